@@ -0,0 +1,8 @@
+# __init__.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Standalone performance benchmarks. Run with `just bench <name>`."""
@@ -0,0 +1,181 @@
+# async_middleware.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compare requests/sec and latency of a simple async page served through Django's
+ASGI handler with the project's middleware: as before, with WhiteNoise and
+`TimezoneMiddleware` only running synchronously; with hybrid versions of both
+in front of Django's middleware; and with the hybrid versions of Django's
+middleware from `play_different_games.core.middleware`.
+
+Requests are anonymous and made in-process, so the numbers are the cost of the
+middleware stack and the thread switches it causes, not of the network.
+
+Usage: `just bench async_middleware [requests]`
+"""
+
+import asyncio
+import sys
+import time
+from http import HTTPStatus
+
+from benchmarks.harness import percentile, print_table, setup_django
+
+setup_django()
+
+from django.core.handlers.asgi import ASGIHandler
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import override_settings
+from django.urls import path
+
+from play_different_games.users.middleware import TimezoneMiddleware
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+CONCURRENCY = 32
+# Where the middleware in play_different_games.core.middleware come from.
+DJANGO_MODULES = {
+    "SecurityMiddleware": "django.middleware.security",
+    "SessionMiddleware": "django.contrib.sessions.middleware",
+    "LocaleMiddleware": "django.middleware.locale",
+    "CommonMiddleware": "django.middleware.common",
+    "CsrfViewMiddleware": "django.middleware.csrf",
+    "AuthenticationMiddleware": "django.contrib.auth.middleware",
+    "MessageMiddleware": "django.contrib.messages.middleware",
+    "XFrameOptionsMiddleware": "django.middleware.clickjacking",
+}
+
+
+class SyncTimezoneMiddleware(TimezoneMiddleware):
+    async_capable = False
+
+
+@transaction.non_atomic_requests
+async def page(_request):
+    return HttpResponse("ok")
+
+
+urlpatterns = [path("", page)]
+
+STACK = [
+    "play_different_games.core.middleware.SecurityMiddleware",
+    "play_different_games.core.middleware.AsyncWhiteNoiseMiddleware",
+    "play_different_games.core.middleware.SessionMiddleware",
+    "play_different_games.core.middleware.LocaleMiddleware",
+    "play_different_games.core.middleware.CommonMiddleware",
+    "django_htmx.middleware.HtmxMiddleware",
+    "play_different_games.core.middleware.CsrfViewMiddleware",
+    "play_different_games.core.middleware.AuthenticationMiddleware",
+    "play_different_games.users.middleware.TimezoneMiddleware",
+    "play_different_games.core.middleware.MessageMiddleware",
+    "play_different_games.core.middleware.XFrameOptionsMiddleware",
+]
+# Django's own middleware, which runs its hooks in threads when async.
+DJANGO_STACK = [
+    middleware.replace(
+        "play_different_games.core.middleware.", f"{DJANGO_MODULES[name]}."
+    )
+    if (name := middleware.rsplit(".", 1)[1]) in DJANGO_MODULES
+    else middleware
+    for middleware in STACK
+]
+# As before: WhiteNoise and TimezoneMiddleware only run synchronously.
+SYNC_STACK = [
+    {
+        "play_different_games.core.middleware.AsyncWhiteNoiseMiddleware": (
+            "whitenoise.middleware.WhiteNoiseMiddleware"
+        ),
+        "play_different_games.users.middleware.TimezoneMiddleware": (
+            f"{__name__}.SyncTimezoneMiddleware"
+        ),
+    }.get(middleware, middleware)
+    for middleware in DJANGO_STACK
+]
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/",
+    "raw_path": b"/",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [(b"host", b"testserver")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("testserver", 80),
+}
+
+
+async def request(app: ASGIHandler) -> float:
+    start = time.perf_counter()
+    done = asyncio.Event()
+    received = False
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if (
+            message["type"] == "http.response.start"
+            and message["status"] != HTTPStatus.OK
+        ):
+            msg = f"Unexpected status {message['status']}"
+            raise RuntimeError(msg)
+        if message["type"] == "http.response.body" and not message.get("more_body"):
+            done.set()
+
+    await app(dict(SCOPE), receive, send)
+    return time.perf_counter() - start
+
+
+async def serve(app: ASGIHandler) -> tuple[list[float], float]:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def limited():
+        async with semaphore:
+            return await request(app)
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(limited() for _ in range(REQUESTS)))
+    return list(latencies), time.perf_counter() - start
+
+
+def main() -> None:
+    results = []
+    for label, stack in (
+        ("sync-only WhiteNoise and timezone", SYNC_STACK),
+        ("hybrid, Django's middleware", DJANGO_STACK),
+        ("hybrid, inline hooks", STACK),
+    ):
+        with override_settings(
+            MIDDLEWARE=stack,
+            ROOT_URLCONF=sys.modules[__name__],
+            ALLOWED_HOSTS=["testserver"],
+        ):
+            app = ASGIHandler()
+            asyncio.run(serve(app))  # Warm up.
+            latencies, seconds = asyncio.run(serve(app))
+        results.append(
+            [
+                label,
+                REQUESTS / seconds,
+                percentile(latencies, 50) * 1000,
+                percentile(latencies, 99) * 1000,
+            ]
+        )
+    print(f"{REQUESTS} requests, {CONCURRENCY} at a time")
+    print_table(["middleware", "req/sec", "p50 ms", "p99 ms"], results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# connection_pool.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compare new, persistent (`CONN_MAX_AGE`) and pooled database connections under
+load. PostgreSQL only.
+
+Requests are served by a fixed set of worker threads, as under a threaded WSGI
+server, and then in bursts where every request gets a new thread, as sync views
+do under ASGI. Each request runs one query and is closed off the way Django does
+at the end of a request. Reported are latency percentiles, requests per second
+and how many server connections were opened.
+
+Usage: `just bench connection_pool [requests]`
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.harness import (
+    benchmark_database,
+    percentile,
+    print_table,
+    setup_django,
+)
+
+setup_django()
+
+from django.db import close_old_connections, connection, connections
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+WORKERS = 16
+POOL = {"min_size": 4, "max_size": 8}
+CONFIGS = (
+    ("new connections", {"CONN_MAX_AGE": 0}),
+    ("persistent (CONN_MAX_AGE=300)", {"CONN_MAX_AGE": 300}),
+    (f"pooled ({POOL['min_size']}-{POOL['max_size']})", {"pool": POOL}),
+)
+
+
+def request(pids: set[int], lock: threading.Lock, last: bool) -> float:  # noqa: FBT001
+    start = time.perf_counter()
+    close_old_connections()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_backend_pid()")
+        row = cursor.fetchone()
+    pid = row[0] if row else 0
+    close_old_connections()
+    elapsed = time.perf_counter() - start
+    with lock:
+        pids.add(pid)
+    if last:
+        # The thread is going away. Its persistent connection would linger until
+        # garbage collected, so close it rather than exhaust the server.
+        connection.close()
+    return elapsed
+
+
+def serve(threads_per_request: bool) -> tuple[list[float], float, int]:  # noqa: FBT001
+    pids: set[int] = set()
+    lock = threading.Lock()
+    start = time.perf_counter()
+    if threads_per_request:
+        latencies = []
+        for _ in range(REQUESTS // WORKERS):
+            with ThreadPoolExecutor(max_workers=WORKERS) as burst:
+                latencies += burst.map(
+                    lambda _: request(pids, lock, last=True), range(WORKERS)
+                )
+    else:
+        with ThreadPoolExecutor(max_workers=WORKERS) as workers:
+            latencies = list(
+                workers.map(lambda _: request(pids, lock, last=False), range(REQUESTS))
+            )
+    return latencies, time.perf_counter() - start, len(pids)
+
+
+def main() -> None:
+    results = []
+    with benchmark_database() as db:
+        if db.vendor != "postgresql":
+            sys.exit("This benchmark needs PostgreSQL.")
+        settings_dict = connections.settings["default"]
+        original = {**settings_dict, "OPTIONS": {**settings_dict["OPTIONS"]}}
+        db.close()
+        for label, config in CONFIGS:
+            settings_dict["CONN_MAX_AGE"] = config.get("CONN_MAX_AGE", 0)
+            settings_dict["OPTIONS"] = {**original["OPTIONS"]}
+            if "pool" in config:
+                settings_dict["OPTIONS"]["pool"] = config["pool"]
+            for mode, threads_per_request in (("workers", False), ("bursts", True)):
+                latencies, seconds, opened = serve(threads_per_request)
+                results.append(
+                    [
+                        label,
+                        mode,
+                        percentile(latencies, 50) * 1000,
+                        percentile(latencies, 99) * 1000,
+                        len(latencies) / seconds,
+                        opened,
+                    ]
+                )
+            db.close_pool()
+        settings_dict.update(original)
+    print(f"{REQUESTS} requests, {WORKERS} at a time")
+    print_table(
+        ["connections", "threads", "p50 ms", "p99 ms", "req/sec", "opened"],
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
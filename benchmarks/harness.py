@@ -0,0 +1,117 @@
+# harness.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Shared setup and reporting helpers for the benchmark scripts."""
+
+import os
+import statistics
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+import django
+from django.db import connections
+
+
+def setup_django() -> None:
+    """Configure Django using the project settings, unless already configured."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "play_different_games.settings")
+    django.setup()
+
+
+@contextmanager
+def benchmark_database(alias: str = "default") -> Iterator[Any]:
+    """
+    Create a throwaway database the same way the test runner does, and destroy it
+    afterwards, so benchmarks never touch development data.
+    """
+    connection = connections[alias]
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+@contextmanager
+def temporary_tables(*models: Any, using: str = "default") -> Iterator[None]:
+    """Create tables for benchmark-only models and drop them afterwards."""
+    connection = connections[using]
+    with connection.schema_editor() as editor:
+        for model in models:
+            editor.create_model(model)
+    try:
+        yield
+    finally:
+        with connection.schema_editor() as editor:
+            for model in models:
+                editor.delete_model(model)
+
+
+class QueryCounter:
+    """Counts every statement executed on a connection, without a log size cap."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def count_queries(connection: Any) -> Iterator[QueryCounter]:
+    """Count the queries executed on `connection` within the block."""
+    counter = QueryCounter()
+    with connection.execute_wrapper(counter):
+        yield counter
+
+
+def timed(func: Callable[[], Any], repeat: int = 5) -> list[float]:
+    """Run `func` `repeat` times and return the wall clock duration of each run."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the `pct` percentile of `values` using the nearest-rank method."""
+    ordered = sorted(values)
+    rank = max(round(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def median_ms(durations: Sequence[float]) -> float:
+    """Median of `durations` (in seconds) expressed in milliseconds."""
+    return statistics.median(durations) * 1000
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """Print rows as a simple fixed width table."""
+    cells = [[str(c) for c in headers]] + [[_fmt(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for index, row in enumerate(cells):
+        print(
+            "  ".join(
+                cell.rjust(width) for cell, width in zip(row, widths, strict=True)
+            )
+        )
+        if index == 0:
+            print("  ".join("-" * width for width in widths))
+
+
+def _fmt(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
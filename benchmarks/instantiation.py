@@ -0,0 +1,95 @@
+# instantiation.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Measure model instantiation throughput with the slug configuration resolved per
+instance (the original `UniqueSlugModel.__init__`) against resolving it once per
+class.
+
+Usage: `just bench instantiation`
+"""
+
+import uuid
+
+from benchmarks.harness import median_ms, print_table, setup_django, timed
+
+setup_django()
+
+from django.db import models
+from django.utils import timezone
+
+from play_different_games.core.models import SluggedUUIDTimestampedModel
+
+ROWS = 100_000
+
+
+class CompiledSlugGame(SluggedUUIDTimestampedModel):
+    title = models.CharField(max_length=250)
+
+    class Meta:
+        app_label = "core"
+
+
+class PerInstanceSlugGame(SluggedUUIDTimestampedModel):
+    title = models.CharField(max_length=250)
+
+    class Meta:
+        app_label = "core"
+
+    def __init__(self, *args, **kwargs):
+        # The original implementation: write the class attribute on every instance.
+        cls = self.__class__
+        cls._slug_meta = cls.SlugMeta
+        super().__init__(*args, **kwargs)
+
+    def get_slug_source(self) -> str:
+        # ...and re-check the configuration on every slug generation.
+        for x in self._slug_meta.slug_based_on_fields:
+            if not hasattr(self, x):
+                raise AttributeError(x)
+        return super().get_slug_source()
+
+
+def main() -> None:
+    now = timezone.now()
+    field_names = [f.attname for f in CompiledSlugGame._meta.concrete_fields]
+    row = {
+        "created_at": now,
+        "modified_at": now,
+        "id": uuid.uuid4(),
+        "slug": "dungeon-world",
+        "title": "Dungeon World",
+    }
+    values = tuple(row[name] for name in field_names)
+    rows = []
+    for model in (PerInstanceSlugGame, CompiledSlugGame):
+
+        def from_db(model=model):
+            for _ in range(ROWS):
+                model.from_db("default", field_names, values)
+
+        def construct(model=model):
+            for _ in range(ROWS):
+                model(title="Dungeon World")
+
+        def slug_source(model=model):
+            instance = model(title="Dungeon World")
+            for _ in range(ROWS):
+                instance.get_slug_source()
+
+        for label, func in (
+            ("from_db", from_db),
+            ("Model()", construct),
+            ("get_slug_source", slug_source),
+        ):
+            ms = median_ms(timed(func, repeat=5))
+            rows.append([model.__name__, label, ms, int(ROWS / (ms / 1000))])
+    print_table(["model", "operation", f"ms per {ROWS:,}", "per second"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# password_hashing.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compare login latency under a burst of concurrent logins, verifying Argon2
+passwords inline in each request thread against `BoundedArgon2PasswordHasher`.
+
+While the logins run, another thread stands in for the rest of the traffic,
+doing a millisecond of work at a time, and its latency is reported as well.
+
+Usage: `just bench password_hashing [concurrent logins]`
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.harness import percentile, print_table, setup_django
+
+setup_django()
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+from play_different_games.users.hashers import BoundedArgon2PasswordHasher
+
+CONCURRENCY = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+LOGINS_PER_THREAD = 5
+
+
+def other_request() -> None:
+    deadline = time.perf_counter() + 0.001
+    while time.perf_counter() < deadline:
+        pass
+
+
+def run(hasher) -> tuple[list[float], list[float]]:
+    encoded = Argon2PasswordHasher().encode("secret", "saltsaltsalt")
+    logins, requests = [], []
+    done = threading.Event()
+
+    def login() -> None:
+        for _ in range(LOGINS_PER_THREAD):
+            start = time.perf_counter()
+            hasher.verify("secret", encoded)
+            logins.append(time.perf_counter() - start)
+
+    def traffic() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            other_request()
+            requests.append(time.perf_counter() - start)
+
+    probe = threading.Thread(target=traffic)
+    probe.start()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        for _ in range(CONCURRENCY):
+            pool.submit(login)
+    done.set()
+    probe.join()
+    return logins, requests
+
+
+def main() -> None:
+    results = []
+    for label, hasher in (
+        ("inline", Argon2PasswordHasher()),
+        (
+            f"bounded ({settings.PASSWORD_HASHING_WORKERS} workers)",
+            BoundedArgon2PasswordHasher(),
+        ),
+    ):
+        logins, requests = run(hasher)
+        results.append(
+            [
+                label,
+                percentile(logins, 50) * 1000,
+                percentile(logins, 99) * 1000,
+                percentile(requests, 50) * 1000,
+                percentile(requests, 99) * 1000,
+            ]
+        )
+    print(f"{CONCURRENCY} concurrent logins, {LOGINS_PER_THREAD} each")
+    print_table(
+        ["hasher", "login p50 ms", "login p99 ms", "other p50 ms", "other p99 ms"],
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# sessions.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Count the cache and database writes per 1,000 requests made by each session
+engine, with `SESSION_SAVE_EVERY_REQUEST` on, as in production.
+
+Ten visitors take turns making requests, one per second of simulated time. Each
+request reads the session and sets a value in it, which is the same as before
+except for one request in ten.
+
+Usage: `just bench sessions`
+"""
+
+import time
+from unittest import mock
+
+from benchmarks.harness import (
+    benchmark_database,
+    count_queries,
+    print_table,
+    setup_django,
+)
+
+setup_django()
+
+from django.conf import settings
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+REQUESTS = 1000
+VISITORS = 10
+ENGINES = (
+    "django.contrib.sessions.backends.cache",
+    "django.contrib.sessions.backends.cached_db",
+    "play_different_games.core.sessions",
+)
+
+
+def view(request):
+    request.session["page"] = request.GET["page"]
+    return HttpResponse()
+
+
+def run(engine: str, connection) -> tuple[int, int]:
+    factory = RequestFactory()
+    cookies: dict[int, str] = {}
+    clock = [time.time()]
+    cache_writes = 0
+    original_set = cache.set
+
+    def counting_set(*args, **kwargs):
+        nonlocal cache_writes
+        cache_writes += 1
+        return original_set(*args, **kwargs)
+
+    with (
+        override_settings(SESSION_ENGINE=engine, SESSION_SAVE_EVERY_REQUEST=True),
+        mock.patch.object(cache, "set", counting_set),
+        mock.patch.object(time, "time", lambda: clock[0]),
+        count_queries(connection) as counter,
+    ):
+        middleware = SessionMiddleware(view)
+        for i in range(REQUESTS):
+            clock[0] += 1
+            visitor = i % VISITORS
+            page = i if (i // VISITORS) % 10 == 0 else "home"
+            request = factory.get("/", {"page": page})
+            if visitor in cookies:
+                request.COOKIES[settings.SESSION_COOKIE_NAME] = cookies[visitor]
+            response = middleware(request)
+            if settings.SESSION_COOKIE_NAME in response.cookies:
+                cookies[visitor] = response.cookies[settings.SESSION_COOKIE_NAME].value
+    return cache_writes, counter.count
+
+
+def main() -> None:
+    results = []
+    with benchmark_database() as connection:
+        for engine in ENGINES:
+            cache.clear()
+            cache_writes, queries = run(engine, connection)
+            results.append([engine.rsplit(".", 1)[-1], cache_writes, queries])
+    print(
+        f"{REQUESTS} requests from {VISITORS} visitors, "
+        f"touch interval {settings.SESSION_TOUCH_INTERVAL}s"
+    )
+    print_table(["engine", "cache writes", "db queries"], results)
+
+
+if __name__ == "__main__":
+    main()
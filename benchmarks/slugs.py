@@ -0,0 +1,103 @@
+# slugs.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compare the single-query slug allocator against the original one-query-per-suffix
+loop at increasing numbers of colliding slugs.
+
+Usage: `just bench slugs`
+"""
+
+from benchmarks.harness import (
+    benchmark_database,
+    count_queries,
+    median_ms,
+    print_table,
+    setup_django,
+    temporary_tables,
+    timed,
+)
+
+setup_django()
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+from django.utils.text import slugify
+
+from play_different_games.core.models import SluggedUUIDTimestampedModel
+from play_different_games.core.utils import generate_unique_slug_for_model
+
+COLLISIONS = [1, 100, 10_000]
+TITLE = "Dungeon World"
+
+
+class BenchSluggedGame(SluggedUUIDTimestampedModel):
+    title = models.CharField(max_length=250)
+
+    class Meta:
+        app_label = "core"
+
+
+def legacy_generate_unique_slug(model_class, text, slug_field="slug") -> str:
+    """The original allocator: one full-row `get()` per candidate suffix."""
+    max_length = model_class._meta.get_field(slug_field).max_length
+    base_slug = slugify(text[:max_length], allow_unicode=True)
+    slug = base_slug
+    next_val = 1
+    while True:
+        try:
+            model_class.objects.get(**{slug_field: slug})
+        except ObjectDoesNotExist:
+            return slug
+        slug = base_slug
+        if len(slug) >= max_length:
+            slug = slug[: max_length - (len(str(next_val)) + 1)]
+        slug = f"{slug}-{next_val}"
+        next_val += 1
+
+
+def seed(collisions: int) -> None:
+    BenchSluggedGame.objects.all().delete()
+    base = slugify(TITLE)
+    slugs = [base] + [f"{base}-{i}" for i in range(1, collisions)]
+    BenchSluggedGame.objects.bulk_create(
+        [BenchSluggedGame(title=TITLE, slug=slug) for slug in slugs], batch_size=2000
+    )
+
+
+def measure(allocator, connection) -> tuple[float, int]:
+    with count_queries(connection) as counter:
+        allocator(BenchSluggedGame, TITLE)
+    durations = timed(lambda: allocator(BenchSluggedGame, TITLE), repeat=3)
+    return median_ms(durations), counter.count
+
+
+def main() -> None:
+    rows = []
+    with benchmark_database() as connection, temporary_tables(BenchSluggedGame):
+        for collisions in COLLISIONS:
+            seed(collisions)
+            legacy_ms, legacy_queries = measure(legacy_generate_unique_slug, connection)
+            new_ms, new_queries = measure(generate_unique_slug_for_model, connection)
+            rows.append(
+                [
+                    collisions,
+                    legacy_queries,
+                    legacy_ms,
+                    new_queries,
+                    new_ms,
+                    f"{legacy_ms / new_ms:.1f}x",
+                ]
+            )
+    print_table(
+        ["collisions", "loop queries", "loop ms", "new queries", "new ms", "speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# tiered_cache.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compare reads of hot keys from the shared cache with reads through
+`TieredCache`, which serves them from the worker's memory.
+
+The shared cache is the one configured as `shared` in the settings, which is
+Redis when `DJANGO_CACHE_URL` points at it, or local memory otherwise. Against
+local memory the difference is only the unpickling; against Redis it includes
+the round trip.
+
+Usage: `just bench tiered_cache [reads]`
+"""
+
+import sys
+
+from benchmarks.harness import median_ms, print_table, setup_django, timed
+
+setup_django()
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test import override_settings
+from django.utils.safestring import mark_safe
+
+from play_different_games.core.metrics import metrics
+
+READS = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+VALUES = {
+    "nav fragment": mark_safe(  # noqa: S308
+        "<nav>" + "<a href='/games/'>Games</a>" * 20 + "</nav>"
+    ),
+    "slug lookup": 1234,
+    "user": {"username": "ann", "email": "ann@example.com", "groups": [1, 2, 3]},
+}
+
+
+def main() -> None:
+    shared = settings.CACHES.get(
+        "shared",
+        {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    )
+    tiered = {
+        "BACKEND": "play_different_games.core.cache.TieredCache",
+        "LOCATION": "shared",
+    }
+    results = []
+    with override_settings(
+        CACHES={**settings.CACHES, "shared": shared, "tiered": tiered}
+    ):
+        for label, value in VALUES.items():
+            caches["tiered"].set(label, value)
+            row: list[str | float] = [label]
+            for alias in ("shared", "tiered"):
+                cache = caches[alias]
+
+                def read(cache=cache, key=label):
+                    for _ in range(READS):
+                        cache.get(key)
+
+                row.append(median_ms(timed(read)) * 1000 / READS)
+            results.append(row)
+        caches["tiered"].clear()
+    print(f"{READS} reads of each key, from {shared['BACKEND']}")
+    print_table(["value", "shared µs/read", "tiered µs/read"], results)
+    print(
+        {name: value for name, value in metrics.snapshot().items() if "tiered" in name}
+    )
+
+
+if __name__ == "__main__":
+    main()
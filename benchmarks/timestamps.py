@@ -0,0 +1,80 @@
+# timestamps.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compare keeping `modified_at` current with a per-object `save()` loop against the
+timestamp-aware `update()` and `bulk_update()` of `TimeStampedQuerySet`.
+
+Usage: `just bench timestamps`
+"""
+
+from benchmarks.harness import (
+    benchmark_database,
+    count_queries,
+    median_ms,
+    print_table,
+    setup_django,
+    temporary_tables,
+    timed,
+)
+
+setup_django()
+
+from django.db import models, transaction
+
+from play_different_games.core.models import TimeStampedModel
+
+ROWS = [100, 1_000, 10_000]
+
+
+class BenchTimestampedRow(TimeStampedModel):
+    status = models.CharField(max_length=20, default="draft")
+
+    class Meta:
+        app_label = "core"
+
+
+def save_loop() -> None:
+    with transaction.atomic():
+        for row in BenchTimestampedRow.objects.all():
+            row.status = "published"
+            row.save(update_fields=["status", "modified_at"])
+
+
+def bulk_update() -> None:
+    rows = list(BenchTimestampedRow.objects.all())
+    for row in rows:
+        row.status = "published"
+    BenchTimestampedRow.objects.bulk_update(rows, ["status"], batch_size=1_000)
+
+
+def queryset_update() -> None:
+    BenchTimestampedRow.objects.update(status="published")
+
+
+def main() -> None:
+    results = []
+    with benchmark_database() as connection, temporary_tables(BenchTimestampedRow):
+        for rows in ROWS:
+            BenchTimestampedRow.objects.all().delete()
+            BenchTimestampedRow.objects.bulk_create(
+                [BenchTimestampedRow() for _ in range(rows)], batch_size=1_000
+            )
+            for label, func in (
+                ("save() loop", save_loop),
+                ("bulk_update()", bulk_update),
+                ("update()", queryset_update),
+            ):
+                with count_queries(connection) as counter:
+                    func()
+                ms = median_ms(timed(func, repeat=3))
+                results.append([rows, label, counter.count, ms])
+    print_table(["rows", "method", "queries", "ms"], results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# user_import.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compare importing users one `create_user()` at a time, which also creates each
+profile through the `post_save` receiver, against `provision_users` hashing in
+this process and in a process pool. Uses the configured password hasher.
+
+Usage: `just bench user_import [rows]`
+"""
+
+import sys
+
+from benchmarks.harness import (
+    benchmark_database,
+    count_queries,
+    print_table,
+    setup_django,
+    timed,
+)
+
+setup_django()
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from play_different_games.users.provisioning import provision_users
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+
+def make_rows() -> list[dict[str, str]]:
+    return [
+        {"username": f"member{i}", "password": f"secret-{i}", "timezone": "UTC"}
+        for i in range(ROWS)
+    ]
+
+
+def create_user_loop() -> None:
+    with transaction.atomic():
+        for row in make_rows():
+            User.objects.create_user(row["username"], password=row["password"])
+
+
+def main() -> None:
+    results = []
+    with benchmark_database() as connection:
+        for label, func in (
+            ("create_user() loop", create_user_loop),
+            (
+                "provision_users(workers=0)",
+                lambda: provision_users(make_rows(), workers=0),
+            ),
+            ("provision_users()", lambda: provision_users(make_rows())),
+        ):
+            User.objects.all().delete()
+            with count_queries(connection) as counter:
+                (seconds,) = timed(func, repeat=1)
+            results.append([label, counter.count, seconds, ROWS / seconds])
+    print_table(["method", "queries", "seconds", "rows/sec"], results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# uuid_keys.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compare insert throughput and primary key index size for random (v4) and
+time-ordered (v7) UUID keys. Requires PostgreSQL.
+
+Usage: `just bench uuid_keys [rows]`
+"""
+
+import sys
+import time
+
+from benchmarks.harness import (
+    benchmark_database,
+    print_table,
+    setup_django,
+    temporary_tables,
+)
+
+setup_django()
+
+from django.db import connection, models, transaction
+
+from play_different_games.core.models import UUID7Model, UUIDModel
+
+DEFAULT_ROWS = 500_000
+BATCH_SIZE = 1_000
+
+
+class BenchUUID4Row(UUIDModel):
+    payload = models.CharField(max_length=64)
+
+    class Meta:
+        app_label = "core"
+
+
+class BenchUUID7Row(UUID7Model):
+    payload = models.CharField(max_length=64)
+
+    class Meta:
+        app_label = "core"
+
+
+def pk_index_bytes(model) -> int:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_relation_size(indexrelid) FROM pg_index "
+            "WHERE indrelid = %s::regclass AND indisprimary",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else 0
+
+
+def insert_rows(model, rows: int) -> float:
+    start = time.perf_counter()
+    for offset in range(0, rows, BATCH_SIZE):
+        # Commit per batch, the way an import or busy site would write.
+        with transaction.atomic():
+            model.objects.bulk_create(
+                model(payload=f"row {i}")
+                for i in range(offset, min(offset + BATCH_SIZE, rows))
+            )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    if connection.vendor != "postgresql":
+        print("This benchmark requires PostgreSQL.")
+        return
+    results = []
+    with benchmark_database(), temporary_tables(BenchUUID4Row, BenchUUID7Row):
+        for label, model in (("uuid4", BenchUUID4Row), ("uuid7", BenchUUID7Row)):
+            elapsed = insert_rows(model, rows)
+            size = pk_index_bytes(model)
+            results.append([label, rows, int(rows / elapsed), size / 1024 / 1024])
+    print_table(["key", "rows", "rows/s", "pk index MiB"], results)
+
+
+if __name__ == "__main__":
+    main()
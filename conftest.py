@@ -10,6 +10,7 @@
 import subprocess
 
 import pytest
+from django.core.cache import cache
 from django.db.models.signals import (
     m2m_changed,
     post_delete,
@@ -70,3 +71,18 @@ def use_dummy_cache_backend(settings):
             "BACKEND": "django.core.cache.backends.dummy.DummyCache",
         }
     }
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """Use a real, empty, cache instead of the dummy one."""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+
+
+@pytest.fixture
+def profile_cache(settings, locmem_cache):
+    """Keep data derived from users in a real cache, see `USER_PROFILE_CACHE`."""
+    settings.USER_PROFILE_CACHE = True
@@ -0,0 +1,172 @@
+# admin.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Admin changelists that stay fast on large tables.
+
+`LargeTableAdminMixin` makes a `ModelAdmin` join the relations shown in
+`list_display` instead of fetching them row by row, take the row count of the
+unfiltered changelist from the PostgreSQL planner once it is past
+`ESTIMATED_COUNT_THRESHOLD`, use autocomplete widgets for foreign keys to other
+admin models, and warns (`core.W001`) about search fields that cannot use an
+index.
+"""
+
+import json
+from typing import TYPE_CHECKING
+
+from django.contrib import admin
+from django.core import checks
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.core.paginator import Paginator
+from django.db import connections, models
+from django.utils.functional import cached_property
+
+# Above this many rows, changelists show the planner's estimate instead of counting.
+ESTIMATED_COUNT_THRESHOLD = 10_000
+
+
+def estimate_count(queryset: models.QuerySet) -> int | None:
+    """
+    The number of rows PostgreSQL's planner expects `queryset` to return.
+
+    Args:
+        queryset (QuerySet): The rows to estimate.
+    Returns:
+        The estimate, or None if the database cannot provide one.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    (plan,) = row
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Counts exactly up to `ESTIMATED_COUNT_THRESHOLD` rows and estimates beyond,
+    so that paginating a large table does not scan all of it. When the estimate
+    is high, the last pages are empty.
+
+    Only rows without a filter are estimated: the planner's guess at how many
+    rows match a filter or search can be far off, so those are counted.
+    """
+
+    @cached_property
+    def count(self):
+        if (
+            isinstance(self.object_list, models.QuerySet)
+            and not self.object_list.query.where
+        ):
+            estimate = estimate_count(self.object_list)
+            if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+def related_path(model: type[models.Model], lookup: str) -> str | None:
+    """
+    The longest prefix of `lookup` that `select_related()` can follow from `model`.
+
+    Args:
+        model (type[Model]): The model `lookup` starts from.
+        lookup (str): A lookup such as 'profile__timezone'.
+    Returns:
+        The relation path, e.g. 'profile', or None if there is none.
+    """
+    path = []
+    for name in lookup.split("__"):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            break
+        related_model = field.related_model
+        if related_model is None or not (field.many_to_one or field.one_to_one):
+            break
+        path.append(name)
+        model = related_model
+    return "__".join(path) or None
+
+
+if TYPE_CHECKING:
+    _ModelAdminBase = admin.ModelAdmin
+else:
+    _ModelAdminBase = object
+
+
+class LargeTableAdminMixin(_ModelAdminBase):
+    """Changelist and form defaults for `ModelAdmin`s of large tables."""
+
+    paginator = EstimatedCountPaginator
+    # Counting the unfiltered table next to the filtered count is another scan.
+    show_full_result_count = False
+
+    def get_list_select_related(self, request):
+        select_related = super().get_list_select_related(request)
+        if select_related is True:
+            return True
+        select_related = list(select_related or ())
+        paths = {
+            path
+            for field in self.get_list_display(request)
+            if isinstance(field, str)
+            and (path := related_path(self.model, field)) is not None
+        }
+        return select_related + sorted(paths - set(select_related))
+
+    def get_autocomplete_fields(self, request):
+        """
+        Adds the foreign keys to admin models with `search_fields` that have no
+        other widget configured, so that their forms do not render a select with
+        every row of the related table.
+        """
+        fields = list(super().get_autocomplete_fields(request))
+        configured = {
+            *fields,
+            *self.raw_id_fields,
+            *self.radio_fields,
+            *self.filter_horizontal,
+            *self.filter_vertical,
+        }
+        for field in self.model._meta.get_fields():
+            if (
+                not field.concrete
+                or not (field.many_to_one or field.one_to_one)
+                or field.name in configured
+            ):
+                continue
+            related_admin = self.admin_site._registry.get(field.related_model)
+            if related_admin is not None and related_admin.search_fields:
+                fields.append(field.name)
+        return fields
+
+    def check(self, **kwargs):
+        return [*super().check(**kwargs), *self._check_search_fields()]
+
+    def _check_search_fields(self) -> list[checks.CheckMessage]:
+        return [
+            checks.Warning(
+                f"Search field '{field}' is matched anywhere in the value, which "
+                "cannot use an index.",
+                hint="Prefix it with '^' or '=' and index the column.",
+                obj=type(self),
+                id="core.W001",
+            )
+            for field in self.search_fields
+            if field[0] not in "^=@"
+        ]
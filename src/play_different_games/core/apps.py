@@ -6,6 +6,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from django.apps import AppConfig
+from django.core import checks
 from django.utils.translation import gettext_lazy as _
 
 
@@ -13,3 +14,10 @@ class CoreConfig(AppConfig):
     name = "play_different_games.core"
     verbose_name = _("Core")
     app_label = "core"
+
+    def ready(self):
+        from play_different_games.core.views import (  # noqa: PLC0415
+            check_read_only_views,
+        )
+
+        checks.register(check_read_only_views, checks.Tags.urls)
@@ -0,0 +1,565 @@
+# cache.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+A two-tier cache backend: a small in-process LRU in front of a shared cache, and
+`get_or_compute()` for values that are expensive to compute.
+
+Hot keys, like rendered fragments and slug lookups, are served from the memory of
+the worker, without a round trip to Redis. Every write and delete goes to the
+shared cache and is broadcast to the other workers, which drop the key from their
+local tier. When the shared cache is Redis, the broadcast is a pub/sub message.
+Otherwise the shared cache is per process anyway, and so is the broadcast.
+
+Configure it with the alias of the shared cache as `LOCATION`, and key prefix and
+version on the shared cache:
+
+    CACHES = {
+        "default": {
+            "BACKEND": "play_different_games.core.cache.TieredCache",
+            "LOCATION": "shared",
+            "OPTIONS": {"MAX_ENTRIES": 1000, "LOCAL_TIMEOUT": 60},
+        },
+        "shared": {"BACKEND": "django.core.cache.backends.redis.RedisCache", ...},
+    }
+
+`MAX_ENTRIES` bounds the local tier, and `LOCAL_TIMEOUT` is the most seconds a
+key is kept in it. Keys read from the shared cache are kept no longer than it
+keeps them, since it tells no one when they expire, and not at all when the
+shared cache is neither Redis nor local memory. The local tier is bypassed while
+this worker is not listening for invalidations, e.g. after losing its connection
+to Redis.
+
+`get_or_compute()` keeps one expiring value from being recomputed by every
+worker at once: only the worker that takes a lock in the cache recomputes it,
+while the others serve the expired value, which is kept a while longer.
+Recomputing also starts early at random, the more likely the closer the value is
+to expiring and the longer it took to compute, so that hot values are usually
+refreshed before they expire at all.
+"""
+
+import json
+import logging
+import math
+import os
+import pickle
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+from weakref import WeakSet
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.safestring import SafeString
+from redis.exceptions import RedisError
+
+from play_different_games.core.metrics import metrics
+
+logger = logging.getLogger("play_different_games")
+
+# Default most seconds a key is kept in the local tier.
+LOCAL_TIMEOUT = 60.0
+# Seconds to wait before listening again after losing the connection to Redis.
+RECONNECT_DELAY = 1.0
+# Values of these types are kept in the local tier as they are. Others are kept
+# pickled, so callers cannot change the cached copy by changing what they got.
+IMMUTABLE_TYPES = (
+    str,
+    SafeString,
+    bytes,
+    int,
+    float,
+    bool,
+    type(None),
+    Decimal,
+    uuid.UUID,
+)
+
+# Default seconds an expired value of get_or_compute() is served while recomputed.
+STALE_TIMEOUT = 300
+# Default seconds the recomputing lock is held at most.
+LOCK_TIMEOUT = 30
+# Seconds between checks for a value that another worker is computing.
+POLL_INTERVAL = 0.05
+# Deletes the lock KEYS[1] only if it still holds the token ARGV[1].
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+_MISSING = object()
+# Local tiers in this process, by channel, for caches without Redis.
+_subscribers: defaultdict[str, WeakSet["LocalTier"]] = defaultdict(WeakSet)
+_tiers: dict[str, "LocalTier"] = {}
+_tiers_lock = threading.Lock()
+
+
+def redis_client(cache: BaseCache):
+    """
+    The Redis client behind `cache`, for Django's and django-redis' backends.
+
+    Returns:
+        A `redis.Redis`, or None when `cache` is not Redis.
+    """
+    # Django's RedisCache keeps its client in _cache, django-redis in client.
+    for attribute in ("_cache", "client"):
+        client = getattr(cache, attribute, None)
+        if client is not None and hasattr(client, "get_client"):
+            return client.get_client(write=True)
+    return None
+
+
+class LocalTier:
+    """
+    A thread-safe LRU of cache entries, shared by the threads of a process.
+
+    Attributes:
+        channel (str): Where invalidations of its keys are broadcast.
+        max_entries (int): How many entries are kept.
+        timeout (float): Most seconds an entry is kept.
+        id (str): Tells its own broadcasts apart from those of other workers.
+        ready (threading.Event): Set while invalidations are being received.
+        generation (int): Incremented with every invalidation received.
+    """
+
+    def __init__(self, channel: str, max_entries: int, timeout: float):
+        self.channel = channel
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.id = uuid.uuid4().hex
+        self.ready = threading.Event()
+        self.generation = 0
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        # Key: (expiry on the monotonic clock, whether pickled, value).
+        self._entries: OrderedDict[str, tuple[float, bool, Any]] = OrderedDict()
+        self._listener: threading.Thread | None = None
+        _subscribers[channel].add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """The value of `key`, or `_MISSING`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires, pickled, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+        return pickle.loads(value) if pickled else value  # noqa: S301
+
+    def set(
+        self, key: str, value: Any, timeout: float | None, generation: int | None = None
+    ) -> None:
+        """
+        Keep `value` for `timeout` seconds, at most the tier's timeout.
+
+        Args:
+            key (str): The key.
+            value (Any): The value.
+            timeout (float): Seconds the shared cache keeps it, None for ever.
+            generation (int): If given, the value is dropped when invalidations
+                were received since reading `generation`, as it may be stale.
+        """
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        pickled = not isinstance(value, IMMUTABLE_TYPES)
+        if pickled:
+            value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if timeout <= 0:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (time.monotonic() + timeout, pickled, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, keys: list[str] | None) -> None:
+        """Drop `keys`, or every key when None."""
+        with self._lock:
+            self.generation += 1
+            if keys is None:
+                self._entries.clear()
+            for key in keys or ():
+                self._entries.pop(key, None)
+
+    def receive(self, message: str | bytes) -> None:
+        """Apply an invalidation broadcast by `TieredCache.publish()`."""
+        data = json.loads(message)
+        if data["sender"] != self.id:
+            metrics.increment("tiered_cache.invalidations.received")
+            self.invalidate(data["keys"])
+
+    def listen(self, remote_alias: str) -> None:
+        """Start receiving invalidations from Redis in a thread, if not yet."""
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = threading.Thread(
+                target=self._listen,
+                args=(remote_alias,),
+                name=f"tiered-cache-{self.channel}",
+                daemon=True,
+            )
+        self._listener.start()
+
+    def _listen(self, remote_alias: str) -> None:
+        while True:
+            client = redis_client(caches[remote_alias])
+            if client is None:
+                # The shared cache is not Redis (any more), nothing to listen to.
+                return
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                # Entries may have missed invalidations while not listening.
+                self.invalidate(None)
+                self.ready.set()
+                for message in pubsub.listen():
+                    self.receive(message["data"])
+            except RedisError:
+                logger.exception("Lost the invalidations of %s", self.channel)
+            self.ready.clear()
+            time.sleep(RECONNECT_DELAY)
+
+
+def get_local_tier(channel: str, max_entries: int, timeout: float) -> LocalTier:
+    """The local tier for `channel` in this process, created if needed."""
+    with _tiers_lock:
+        tier = _tiers.get(channel)
+        # A forked worker does not inherit the listening thread.
+        if tier is None or tier.pid != os.getpid():
+            tier = _tiers[channel] = LocalTier(channel, max_entries, timeout)
+        return tier
+
+
+if TYPE_CHECKING:
+
+    class _CacheBase(BaseCache):
+        """What the type stubs are missing of Django's cache backends."""
+
+        _max_entries: int
+
+        def make_and_validate_key(
+            self, key: str, version: int | None = None
+        ) -> str: ...
+
+else:
+    _CacheBase = BaseCache
+
+
+class TieredCache(_CacheBase):
+    """
+    A cache backend serving keys from a `LocalTier` in front of the shared cache
+    named by `location`, with hit and miss counters for each tier in `metrics`.
+    """
+
+    def __init__(self, location: str, params: dict):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.remote_alias = location
+        self.channel = options.get("CHANNEL", f"tiered-cache:{location}")
+        self.tier = get_local_tier(
+            self.channel,
+            self._max_entries,
+            float(options.get("LOCAL_TIMEOUT", LOCAL_TIMEOUT)),
+        )
+
+    @property
+    def remote(self) -> BaseCache:
+        return caches[self.remote_alias]
+
+    def local(self) -> LocalTier | None:
+        """The local tier, or None while it would miss invalidations."""
+        if not self.tier.ready.is_set():
+            if redis_client(self.remote) is None:
+                self.tier.ready.set()
+            else:
+                self.tier.listen(self.remote_alias)
+                return None
+        return self.tier
+
+    def publish(self, keys: list[str] | None) -> None:
+        """Tell the other workers to drop `keys`, or every key when None."""
+        metrics.increment("tiered_cache.invalidations.sent")
+        message = json.dumps({"sender": self.tier.id, "keys": keys})
+        client = redis_client(self.remote)
+        if client is None:
+            for tier in list(_subscribers[self.channel]):
+                tier.receive(message)
+        else:
+            client.publish(self.channel, message)
+
+    def _local_timeout(self, timeout) -> float | None:
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        return timeout
+
+    def _remote_ttls(self, keys: list[str], version) -> list[float | None]:
+        """
+        Seconds the shared cache still keeps each of `keys`: infinity for keys
+        that do not expire, and None where it is not known, e.g. when the key
+        expired since it was read.
+        """
+        remote = self.remote
+        remote_keys = [remote.make_key(key, version=version) for key in keys]
+        client = redis_client(remote)
+        if client is not None:
+            pipeline = client.pipeline(transaction=False)
+            for remote_key in remote_keys:
+                pipeline.pttl(remote_key)
+            # PTTL is -1 for keys without an expiry, and -2 for missing keys.
+            return [
+                math.inf if ttl == -1 else ttl / 1000 if ttl >= 0 else None
+                for ttl in pipeline.execute()
+            ]
+        expire_info = getattr(remote, "_expire_info", None)
+        if isinstance(remote, LocMemCache) and expire_info is not None:
+            # Expiries are on the wall clock, None for keys that do not expire.
+            now = time.time()
+            ttls = []
+            for remote_key in remote_keys:
+                expires = expire_info.get(remote_key, _MISSING)
+                if expires is _MISSING:
+                    ttls.append(None)
+                else:
+                    ttls.append(math.inf if expires is None else expires - now)
+            return ttls
+        return [None] * len(keys)
+
+    def _fill(
+        self, local_key: str, value: Any, ttl: float | None, generation: int
+    ) -> None:
+        # Keys whose expiry in the shared cache is not known are not kept, since
+        # nothing tells the other workers when they expire.
+        if ttl is not None and (tier := self.local()) is not None:
+            tier.set(local_key, value, ttl, generation)
+
+    def get(self, key, default=None, version=None):
+        # Keys are validated by the shared cache, on misses and writes.
+        local_key = self.make_key(key, version=version)
+        tier = self.local()
+        if tier is not None:
+            value = tier.get(local_key)
+            if value is not _MISSING:
+                metrics.increment("tiered_cache.local.hits")
+                return value
+            metrics.increment("tiered_cache.local.misses")
+        generation = self.tier.generation
+        value = self.remote.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            metrics.increment("tiered_cache.remote.misses")
+            return default
+        metrics.increment("tiered_cache.remote.hits")
+        (ttl,) = self._remote_ttls([key], version)
+        self._fill(local_key, value, ttl, generation)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        local_keys = {self.make_key(key, version=version): key for key in keys}
+        found = {}
+        tier = self.local()
+        if tier is not None:
+            for local_key, key in local_keys.items():
+                value = tier.get(local_key)
+                if value is not _MISSING:
+                    found[key] = value
+            metrics.increment("tiered_cache.local.hits", len(found))
+            metrics.increment("tiered_cache.local.misses", len(local_keys) - len(found))
+        missing = [key for key in keys if key not in found]
+        if not missing:
+            return found
+        generation = self.tier.generation
+        fetched = self.remote.get_many(missing, version=version)
+        metrics.increment("tiered_cache.remote.hits", len(fetched))
+        metrics.increment("tiered_cache.remote.misses", len(missing) - len(fetched))
+        ttls = self._remote_ttls(list(fetched), version)
+        for (key, value), ttl in zip(fetched.items(), ttls, strict=True):
+            self._fill(self.make_key(key, version=version), value, ttl, generation)
+        return found | fetched
+
+    def has_key(self, key, version=None):
+        tier = self.local()
+        local_key = self.make_key(key, version=version)
+        if tier is not None and tier.get(local_key) is not _MISSING:
+            return True
+        return self.remote.has_key(key, version=version)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        self.remote.set(key, value, timeout, version=version)
+        self.publish([local_key])
+        if (tier := self.local()) is not None:
+            tier.set(local_key, value, self._local_timeout(timeout))
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        if not self.remote.add(key, value, timeout, version=version):
+            return False
+        self.publish([local_key])
+        if (tier := self.local()) is not None:
+            tier.set(local_key, value, self._local_timeout(timeout))
+        return True
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        local_keys = {
+            key: self.make_and_validate_key(key, version=version) for key in data
+        }
+        failed = self.remote.set_many(data, timeout, version=version)
+        self.publish(list(local_keys.values()))
+        if (tier := self.local()) is not None:
+            for key, value in data.items():
+                if key not in failed:
+                    tier.set(local_keys[key], value, self._local_timeout(timeout))
+        return failed
+
+    def _invalidate(self, keys, version) -> list[str]:
+        local_keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        self.tier.invalidate(local_keys)
+        self.publish(local_keys)
+        return local_keys
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        touched = self.remote.touch(key, timeout, version=version)
+        self._invalidate([key], version)
+        return touched
+
+    def delete(self, key, version=None):
+        deleted = self.remote.delete(key, version=version)
+        self._invalidate([key], version)
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        self.remote.delete_many(keys, version=version)
+        self._invalidate(keys, version)
+
+    def incr(self, key, delta=1, version=None):
+        value = self.remote.incr(key, delta, version=version)
+        self._invalidate([key], version)
+        return value
+
+    def clear(self):
+        self.remote.clear()
+        self.tier.invalidate(None)
+        self.publish(None)
+
+    def close(self, **kwargs):
+        self.remote.close(**kwargs)
+
+
+def _compute(
+    cache: BaseCache,
+    key: str,
+    compute: Callable[[], Any],
+    timeout: int | None,
+    stale_timeout: int,
+) -> Any:
+    start = time.monotonic()
+    value = compute()
+    delta = time.monotonic() - start
+    metrics.increment("cached_computations.computed")
+    if timeout is None:
+        cache.set(key, (value, delta, math.inf), None)
+    else:
+        expires_at = time.time() + timeout
+        cache.set(key, (value, delta, expires_at), timeout + stale_timeout)
+    return value
+
+
+def _release_lock(cache: BaseCache, lock_key: str, token: int) -> None:
+    """
+    Delete the lock at `lock_key` if it still holds `token`. It may not when it
+    expired while computing and another worker has taken it since.
+    """
+    client = redis_client(cache)
+    if client is None:
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+    else:
+        # Integers are stored as they are, not pickled, by both Redis backends.
+        client.eval(RELEASE_LOCK_SCRIPT, 1, cache.make_key(lock_key), token)
+
+
+def get_or_compute(
+    key: str,
+    compute: Callable[[], Any],
+    timeout: int | None,
+    *,
+    beta: float = 1.0,
+    stale_timeout: int = STALE_TIMEOUT,
+    lock_timeout: int = LOCK_TIMEOUT,
+    using: str = DEFAULT_CACHE_ALIAS,
+) -> Any:
+    """
+    The value cached under `key`, computed by `compute()` if needed, by one
+    worker at a time.
+
+    Expired values are served for up to `stale_timeout` more seconds while the
+    worker holding the lock recomputes them. When there is no value to serve,
+    the other workers wait up to `lock_timeout` seconds for it, and then compute
+    it themselves.
+
+    Args:
+        key (str): The cache key.
+        compute (Callable): Computes the value.
+        timeout (int): Seconds until the value expires, None for never.
+        beta (float): How early values are recomputed. Above 1 favors earlier,
+            below 1 later, and 0 turns it off.
+        stale_timeout (int): Seconds an expired value is still served.
+        lock_timeout (int): Seconds the lock is held at most, which should be
+            longer than computing takes.
+        using (str): The cache alias.
+
+    Returns:
+        The value.
+    """
+    cache = caches[using]
+    entry = cache.get(key)
+    if entry is not None:
+        value, delta, expires_at = entry
+        # XFetch: -log(u) is 0 or more, and rarely much more.
+        early = delta * beta * -math.log(1.0 - random.random())  # noqa: S311
+        if time.time() + early < expires_at:
+            return value
+    # The lock is only ever read from the shared cache, never a local tier.
+    locks = cache.remote if isinstance(cache, TieredCache) else cache
+    lock_key = f"{key}:computing"
+    # Tells this worker's lock apart from one taken after it expired.
+    token = uuid.uuid4().int
+    if locks.add(lock_key, token, lock_timeout):
+        try:
+            return _compute(cache, key, compute, timeout, stale_timeout)
+        finally:
+            _release_lock(locks, lock_key, token)
+    if entry is not None:
+        metrics.increment("cached_computations.stale")
+        return entry[0]
+    metrics.increment("cached_computations.waited")
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline and locks.has_key(lock_key):
+        time.sleep(POLL_INTERVAL)
+        if (entry := cache.get(key)) is not None:
+            return entry[0]
+    # The lock expired or was released without a value, e.g. when computing
+    # failed, so compute it here.
+    return _compute(cache, key, compute, timeout, stale_timeout)
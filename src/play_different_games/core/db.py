@@ -0,0 +1,59 @@
+# db.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Statistics of the psycopg connection pools, for the metrics endpoint.
+
+Pools are enabled with `DJANGO_DATABASE_POOL`, see `settings.py`. Each process
+has its own pool per database alias.
+"""
+
+from typing import Any
+
+from django.db import connections
+
+
+def connection_pool_stats(connection: Any) -> dict[str, int]:
+    """
+    The state of `connection`'s pool, if it has one.
+
+    Args:
+        connection (DatabaseWrapper): A database connection.
+    Returns:
+        'size' and 'in_use' connections, requests 'waiting' for one, the total
+        'wait_ms' they waited, the average 'connect_ms' to open a connection
+        and connection 'errors', or an empty dict if it is not pooled.
+    """
+    pool = getattr(connection, "pool", None)
+    if pool is None:
+        return {}
+    stats = pool.get_stats()
+    connections_made = stats.get("connections_num", 0)
+    return {
+        "size": stats["pool_size"],
+        "in_use": stats["pool_size"] - stats["pool_available"],
+        "waiting": stats.get("requests_waiting", 0),
+        "wait_ms": stats.get("requests_wait_ms", 0),
+        "connect_ms": (
+            stats.get("connections_ms", 0) // connections_made
+            if connections_made
+            else 0
+        ),
+        "errors": stats.get("connections_errors", 0),
+    }
+
+
+def pool_stats() -> dict[str, int]:
+    """
+    The stats of every pooled database, named like the counters of
+    `play_different_games.core.metrics`, e.g. 'db_pool.default.in_use'.
+    """
+    return {
+        f"db_pool.{alias}.{name}": value
+        for alias in connections
+        for name, value in connection_pool_stats(connections[alias]).items()
+    }
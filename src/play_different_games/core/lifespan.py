@@ -0,0 +1,125 @@
+# lifespan.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+ASGI lifespan handling, so that workers warm up before taking traffic and finish
+their requests before exiting.
+
+On startup, the URL resolver, the project's templates and the database pools
+are loaded, so the first requests a new worker serves are not slowed down by
+doing it. Cache connections are not: `caches` holds one per thread, and the
+warm-up runs in a thread of its own. On shutdown, requests still in flight are given up
+to `DRAIN_TIMEOUT` seconds to finish before the database connections close.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.urls import get_resolver
+
+logger = logging.getLogger("play_different_games")
+
+# Most seconds to wait for requests in flight at shutdown.
+DRAIN_TIMEOUT = 25.0
+
+
+def warm_up() -> None:
+    """Load everything the first requests of a worker would otherwise load."""
+    # Imports every URLconf and builds the reverse lookup tables.
+    _ = get_resolver().reverse_dict
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        # Compiled templates are kept by the cached loader.
+        for directory in map(Path, engine.dirs):
+            for path in directory.rglob("*.html"):
+                engine.get_template(path.relative_to(directory).as_posix())
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        if pool is not None:
+            pool.open(wait=True)
+
+
+def close_connections() -> None:
+    """Close the database connections and pools of this process."""
+    for alias in connections:
+        connection = connections[alias]
+        connection.close()
+        # Only the PostgreSQL backend has pools.
+        close_pool = getattr(connection, "close_pool", None)
+        if close_pool is not None and getattr(connection, "pool", None) is not None:
+            close_pool()
+
+
+class LifespanMiddleware:
+    """
+    Answers the ASGI lifespan protocol for `app`, which serves HTTP.
+
+    Args:
+        app: The ASGI application, e.g. Django's.
+        warm_up (Callable): Called on startup, in a thread.
+        drain_timeout (float): Most seconds to wait for requests at shutdown.
+    """
+
+    def __init__(
+        self,
+        app,
+        *,
+        warm_up: Callable[[], None] = warm_up,
+        drain_timeout: float = DRAIN_TIMEOUT,
+    ):
+        self.app = app
+        self.warm_up = warm_up
+        self.drain_timeout = drain_timeout
+        self.in_flight = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+        elif scope["type"] == "http":
+            self.in_flight += 1
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self.in_flight -= 1
+        else:
+            msg = f"Unknown scope type: {scope['type']}"
+            raise NotImplementedError(msg)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await sync_to_async(self.warm_up)()
+                except Exception as error:
+                    logger.exception("Warm up failed")
+                    await send(
+                        {"type": "lifespan.startup.failed", "message": str(error)}
+                    )
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.drain()
+                await sync_to_async(close_connections)()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def drain(self) -> None:
+        """Wait until no requests are in flight, or the drain timeout passes."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.drain_timeout
+        while self.in_flight and loop.time() < deadline:
+            await asyncio.sleep(0.05)
+        if self.in_flight:
+            logger.warning("Shutting down with %d requests in flight", self.in_flight)
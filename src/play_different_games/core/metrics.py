@@ -0,0 +1,54 @@
+# metrics.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Lightweight in-process counters for checking caches and other hot paths under load.
+
+Counters are kept per process and are never persisted, so with several workers
+each one reports its own numbers. They cost a lock and a dict update, which is
+cheap enough to leave on in production.
+"""
+
+import threading
+from collections import defaultdict
+
+
+class Metrics:
+    """A thread-safe registry of named counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: defaultdict[str, int] = defaultdict(int)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """
+        Add `value` to the counter `name`, creating it if needed.
+
+        Args:
+            name (str): Dotted name of the counter, e.g. 'slug_resolver.hits'.
+            value (int): Amount to add. Default 1.
+        """
+        with self._lock:
+            self._counters[name] += value
+
+    def get(self, name: str) -> int:
+        """Current value of the counter `name`, 0 if it was never incremented."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict[str, int]:
+        """A copy of every counter, sorted by name."""
+        with self._lock:
+            return dict(sorted(self._counters.items()))
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        with self._lock:
+            self._counters.clear()
+
+
+metrics = Metrics()
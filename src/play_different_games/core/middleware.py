@@ -0,0 +1,223 @@
+# middleware.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Middleware for running the whole stack on the event loop under ASGI.
+
+A middleware that only runs synchronously makes Django switch every request to
+a thread and back. Django's own middleware can run asynchronously, but does so
+by running each of its hooks in a thread, which costs more than the hooks. These
+are drop-in replacements that work both ways, and run the hooks that do no I/O
+directly on the event loop.
+
+`CsrfViewMiddleware` assumes `CSRF_USE_SESSIONS` is off, since reading the
+session can hit the database. It still checks the token of unsafe requests in a
+thread, since that reads `request.POST`, which parses (and may write to disk) the
+uploaded files.
+"""
+
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any, cast
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import middleware as auth
+from django.contrib.messages import middleware as messages
+from django.contrib.sessions import middleware as sessions
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.middleware import clickjacking, common, csrf, locale, security
+from django.utils.deprecation import MiddlewareMixin
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from play_different_games.core.routers import RoutingState, routing_state
+
+if TYPE_CHECKING:
+
+    class _MiddlewareBase(MiddlewareMixin):
+        """The hooks the mixin runs, which the subclasses of Django's define."""
+
+        process_request: Callable[[HttpRequest], HttpResponseBase | None]
+        process_view: Callable[..., Any]
+        process_response: Callable[[HttpRequest, HttpResponseBase], HttpResponseBase]
+
+else:
+    _MiddlewareBase = object
+
+
+class InlineAsyncMiddlewareMixin(_MiddlewareBase):
+    """
+    For subclasses of Django's `MiddlewareMixin` whose hooks do no I/O: in async
+    mode, runs `process_request`, `process_view` and `process_response` on the
+    event loop instead of in a thread. Requests for which `view_needs_thread()`
+    is true still have `process_view` run in a thread, and responses for which
+    `response_needs_thread()` is true are still processed in a thread.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        # Django's MiddlewareMixin runs async if get_response is a coroutine.
+        if iscoroutinefunction(self.get_response) and hasattr(self, "process_view"):
+            process_view = self.process_view
+
+            async def aprocess_view(request, view_func, view_args, view_kwargs):
+                if self.view_needs_thread(request):
+                    return await sync_to_async(process_view, thread_sensitive=True)(
+                        request, view_func, view_args, view_kwargs
+                    )
+                return process_view(request, view_func, view_args, view_kwargs)
+
+            # Django only runs view hooks on the loop if they are coroutines.
+            self.process_view = aprocess_view
+
+    def view_needs_thread(self, request) -> bool:  # noqa: ARG002
+        """Whether `process_view` does I/O for this request."""
+        return False
+
+    def response_needs_thread(self, request, response) -> bool:  # noqa: ARG002
+        """Whether `process_response` does I/O for this response."""
+        return False
+
+    async def __acall__(self, request):
+        # Django's MiddlewareMixin only runs __acall__ for an async get_response.
+        get_response = cast(
+            "Callable[[HttpRequest], Awaitable[HttpResponseBase]]", self.get_response
+        )
+        response = None
+        if hasattr(self, "process_request"):
+            response = self.process_request(request)
+        response = response or await get_response(request)
+        if hasattr(self, "process_response"):
+            if self.response_needs_thread(request, response):
+                response = await sync_to_async(
+                    self.process_response, thread_sensitive=True
+                )(request, response)
+            else:
+                response = self.process_response(request, response)
+        return response
+
+
+class SecurityMiddleware(InlineAsyncMiddlewareMixin, security.SecurityMiddleware):
+    pass
+
+
+class SessionMiddleware(InlineAsyncMiddlewareMixin, sessions.SessionMiddleware):
+    def response_needs_thread(self, request, response) -> bool:  # noqa: ARG002
+        session = request.session
+        return (
+            session.modified or settings.SESSION_SAVE_EVERY_REQUEST
+        ) and not session.is_empty()
+
+
+class LocaleMiddleware(InlineAsyncMiddlewareMixin, locale.LocaleMiddleware):
+    pass
+
+
+class CommonMiddleware(InlineAsyncMiddlewareMixin, common.CommonMiddleware):
+    pass
+
+
+class CsrfViewMiddleware(InlineAsyncMiddlewareMixin, csrf.CsrfViewMiddleware):
+    def view_needs_thread(self, request) -> bool:
+        # The token of unsafe requests may be in request.POST, read from the body.
+        return request.method not in {"GET", "HEAD", "OPTIONS", "TRACE"}
+
+
+async def _auser(request, auser):
+    """Django's `request.auser()`, caching the user where `request.user` does."""
+    if not hasattr(request, "_cached_user"):
+        request._cached_user = await auser()
+    return request._cached_user
+
+
+class AuthenticationMiddleware(
+    InlineAsyncMiddlewareMixin, auth.AuthenticationMiddleware
+):
+    """
+    Django's, except that `request.user` and `request.auser()` share the user
+    they load. Django caches them apart, so a sync view reading `request.user`
+    after async middleware awaited `request.auser()` loads the user again.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.auser = partial(_auser, request, request.auser)
+
+
+class MessageMiddleware(InlineAsyncMiddlewareMixin, messages.MessageMiddleware):
+    def response_needs_thread(self, request, response) -> bool:  # noqa: ARG002
+        # Messages that do not fit in the cookie are stored in the session.
+        storage = getattr(request, "_messages", None)
+        return storage is not None and (storage.used or storage.added_new)
+
+
+class XFrameOptionsMiddleware(
+    InlineAsyncMiddlewareMixin, clickjacking.XFrameOptionsMiddleware
+):
+    pass
+
+
+class ReplicaPinningMiddleware(InlineAsyncMiddlewareMixin, MiddlewareMixin):
+    """
+    Lets `ReplicaRouter` route the reads of each request, and keeps a client
+    that wrote on the primary for `DATABASE_PRIMARY_PIN_SECONDS`, with a cookie.
+    """
+
+    cookie_name = "primary_pin"
+
+    def process_request(self, request):
+        request.routing_state = RoutingState(pinned=self.cookie_name in request.COOKIES)
+        routing_state.set(request.routing_state)
+
+    def process_response(self, request, response):
+        routing_state.set(None)
+        state = getattr(request, "routing_state", None)
+        if state is not None and state.wrote:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.DATABASE_PRIMARY_PIN_SECONDS,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    `WhiteNoiseMiddleware` that also runs asynchronously. Looking the path up is
+    done on the event loop, so only requests for static files go to a thread, to
+    open the file.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        # Only called when get_response is a coroutine, see __init__.
+        get_response = cast(
+            "Callable[[HttpRequest], Awaitable[HttpResponseBase]]", self.get_response
+        )
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await get_response(request)
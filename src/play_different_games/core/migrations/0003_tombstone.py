@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:55
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django_q.models import Schedule
+
+
+def create_tombstone_scheduled_task(apps, schema_editor):
+    """Create a daily task for deleting expired tombstones."""
+    Schedule_mod = apps.get_model("django_q", "Schedule")
+    Schedule_mod.objects.create(
+        func="play_different_games.core.tasks.remove_expired_tombstones",
+        schedule_type=Schedule.DAILY,
+        name="Remove expired tombstones",
+    )
+
+
+def remove_tombstone_scheduled_task(apps, schema_editor):
+    """Delete any scheduled tasks for deleting expired tombstones."""
+    Schedule_mod = apps.get_model("django_q", "Schedule")
+    Schedule_mod.objects.filter(
+        func="play_different_games.core.tasks.remove_expired_tombstones"
+    ).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("core", "0002_slughistory"),
+        ("django_q", "0018_task_success_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("object_id", models.CharField(max_length=255)),
+                ("deleted_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["content_type", "deleted_at", "id"],
+                        name="core_tombstone_feed_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            create_tombstone_scheduled_task,
+            reverse_code=remove_tombstone_scheduled_task,
+        ),
+    ]
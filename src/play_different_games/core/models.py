@@ -7,25 +7,103 @@
 
 """Abstract and base models for the whole project."""
 
+from collections.abc import Iterable
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import ClassVar
 from uuid import uuid4
 
-from django.core.exceptions import ImproperlyConfigured
-from django.db import models
+from django.contrib.contenttypes.models import ContentType
+from django.core import checks
+from django.core.cache import cache
+from django.db import IntegrityError, models, router, transaction
+from django.db.models.signals import class_prepared, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from play_different_games.core.utils import generate_unique_slug_for_model
+from play_different_games.core.resolvers import get_slug_resolver
+from play_different_games.core.utils import (
+    generate_unique_slug_for_model,
+    generate_unique_slugs_for_model,
+    uuid7,
+)
+
+# How many times a generated slug is recomputed after losing an insert race.
+SLUG_SAVE_ATTEMPTS = 3
+
+# The shared `modified_at` for the batches of an in-progress `bulk_update()`.
+_bulk_update_timestamp: ContextVar[datetime | None] = ContextVar(
+    "bulk_update_timestamp", default=None
+)
+
+# How long (in seconds) old slug to canonical slug redirects are cached.
+SLUG_REDIRECT_CACHE_TIMEOUT = 60 * 60 * 24
+# Unknown slugs are cached for less time, but still spare crawlers a query each.
+SLUG_REDIRECT_MISS_CACHE_TIMEOUT = 60 * 10
+
+# How long tombstones of deleted records are kept for change feed consumers.
+TOMBSTONE_RETENTION_DAYS = 30
+
+
+class TimeStampedQuerySet(models.QuerySet):
+    """
+    QuerySet for `TimeStampedModel` subclasses.
+
+    `auto_now` is only applied by `Model.save()`, so the bulk operations here set
+    `modified_at` themselves, in the same single statement as the update.
+    """
+
+    def update(self, **kwargs):
+        """
+        Same as Django's `update`, but also sets `modified_at` to now unless a
+        value for it is given.
+        """
+        kwargs.setdefault("modified_at", _bulk_update_timestamp.get() or timezone.now())
+        return super().update(**kwargs)
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        """
+        Same as Django's `bulk_update`, but also sets `modified_at` to now on every
+        object and in the database.
+
+        Every object gets the same timestamp, so it is written as a single value
+        by the `update()` that Django runs per batch rather than as another
+        per-row `CASE` expression.
+        """
+        objs = list(objs)
+        now = timezone.now()
+        for obj in objs:
+            obj.modified_at = now
+        if "modified_at" in fields:
+            return super().bulk_update(objs, fields, batch_size=batch_size)
+        token = _bulk_update_timestamp.set(now)
+        try:
+            return super().bulk_update(objs, fields, batch_size=batch_size)
+        finally:
+            _bulk_update_timestamp.reset(token)
 
 
 class TimeStampedModel(models.Model):
     """
     An abstract model that adds creation and modified timestamps.
+
+    The default manager keeps `modified_at` current for `update()` and
+    `bulk_update()` as well as `save()`. Rows are indexed on `(modified_at, id)`
+    so that `play_different_games.core.changes` can page through them in
+    modification order, and deleting a record leaves a `Tombstone` behind.
+    Subclasses that declare their own `Meta` should inherit from
+    `TimeStampedModel.Meta` to keep the index.
     """
 
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    objects = TimeStampedQuerySet.as_manager()
+
     class Meta:
         abstract = True
+        indexes = [models.Index(fields=["modified_at", "id"])]
 
 
 class UUIDModel(models.Model):
@@ -42,6 +120,79 @@ class UUIDModel(models.Model):
         abstract = True
 
 
+class UUID7Model(UUIDModel):
+    """
+    A model that uses a time-ordered UUID (version 7) as its primary key.
+
+    Random `uuid4` keys scatter inserts across the primary key index, which on
+    large tables means page splits, index bloat and poor cache locality. Version 7
+    keys start with a millisecond timestamp, so new rows are appended at the
+    right-hand edge of the index instead. Note that a key reveals when its row was
+    created, so prefer slugs over keys in public URLs.
+
+    To migrate an existing `UUIDModel` subclass, list this class first among its
+    bases (or swap `SluggedUUIDTimestampedModel` for
+    `SluggedUUID7TimestampedModel`) and run `makemigrations`. The resulting
+    `AlterField` only changes the Python-side default, so it neither rewrites
+    rows nor locks the table. Existing `uuid4` keys stay valid and are never
+    renumbered, since they may be referenced elsewhere. The index stops
+    fragmenting from then on; reclaim any existing bloat with
+    `REINDEX INDEX CONCURRENTLY` during a quiet period.
+
+    Attributes:
+        id (uuid): The primary key of the model.
+    """
+
+    id = models.UUIDField(default=uuid7, editable=False, primary_key=True)
+
+    class Meta:
+        abstract = True
+
+
+class UniqueSlugQuerySet(models.QuerySet):
+    """
+    QuerySet for `UniqueSlugModel` subclasses that can assign slugs in bulk.
+    """
+
+    # Set by Django's `QuerySet.__init__` and `using()`.
+    _db: str | None
+
+    def assign_slugs(self, objs: Iterable["UniqueSlugModel"]) -> None:
+        """
+        Assign a unique slug to every object in `objs` that does not have one yet,
+        using a constant number of queries for the whole batch.
+
+        Args:
+            objs (Iterable[UniqueSlugModel]): Unsaved instances of this model.
+        """
+        objs = list(objs)
+        pending = [obj for obj in objs if not obj.slug]
+        if not pending:
+            return
+        using = self._db or router.db_for_write(self.model)
+        slugs = generate_unique_slugs_for_model(
+            self.model,
+            [obj.get_slug_source() for obj in pending],
+            allow_unicode=True,
+            using=using,
+            reserved=[obj.slug for obj in objs if obj.slug],
+        )
+        for obj, slug in zip(pending, slugs, strict=True):
+            obj.slug = slug
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Same as Django's `bulk_create`, but assigns unique slugs to any objects
+        that are missing one first. Allocation and insert share a transaction so
+        the slug locks are held until the rows are written.
+        """
+        objs = list(objs)
+        using = self._db or router.db_for_write(self.model)
+        with transaction.atomic(using=using, savepoint=False):
+            self.assign_slugs(objs)
+            return super().bulk_create(objs, *args, **kwargs)
+
+
 class UniqueSlugModel(models.Model):
     """A model that allows you to define a slug based on other fields.
 
@@ -58,21 +209,31 @@ class UniqueSlugModel(models.Model):
         help_text=_("Slug for this record."),
     )
 
+    objects = UniqueSlugQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
-    def __init__(self, *args, **kwargs):
+    _slug_meta: ClassVar[type]
+    _slug_source_fields: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
         """
-        Adds a new key to the Meta class enabling us to use `slug_based_on_fields`
-        with a default of `['title',]`.
+        Resolves the `SlugMeta` configuration once, when the model class is
+        defined, with a default of `['title',]` for `slug_based_on_fields`.
         In actual subclassed models you can override with:
             class SlugMeta:
                 slug_based_on_fields = ['field1', 'field2', ...]
+
+        The configuration is validated by the system check framework, see
+        `check_slug_configuration`.
         """
-        cls = self.__class__
-        my_meta = getattr(cls, "SlugMeta", None)
-        cls._slug_meta = my_meta  # type: ignore
-        super().__init__(*args, **kwargs)
+        super().__init_subclass__(**kwargs)
+        cls._slug_meta = cls.SlugMeta
+        fields = getattr(cls.SlugMeta, "slug_based_on_fields", None) or ()
+        cls._slug_source_fields = (
+            (fields,) if isinstance(fields, str) else tuple(fields)
+        )
 
     class SlugMeta:
         slug_based_on_fields = ["title"]
@@ -81,39 +242,98 @@ class UniqueSlugModel(models.Model):
         """
         Save method from Django, but we also generate a unique slug if not already
         defined.
+
+        Slug allocation and the insert run in one savepoint. On PostgreSQL the
+        base slug is locked for the rest of the transaction, so concurrent
+        writers wait rather than collide. Elsewhere, if another writer claims the
+        generated slug before our insert, the save is retried with a freshly
+        computed slug instead of aborting the surrounding transaction.
+        """
+        if self.slug:
+            super().save(*args, **kwargs)
+            return
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        for attempt in range(1, SLUG_SAVE_ATTEMPTS + 1):
+            try:
+                with transaction.atomic(using=using):
+                    self.slug = self.generate_slug(using=using)
+                    super().save(*args, **kwargs)
+            except IntegrityError:
+                lost_race = (
+                    type(self)
+                    ._default_manager.db_manager(using)
+                    .filter(slug=self.slug)
+                    .exists()
+                )
+                self.slug = ""
+                if not lost_race or attempt == SLUG_SAVE_ATTEMPTS:
+                    raise
+            else:
+                return
+
+    @classmethod
+    def check(cls, **kwargs):
+        errors = super().check(**kwargs)
+        if not cls._meta.abstract:
+            errors += cls.check_slug_configuration()
+        return errors
+
+    @classmethod
+    def check_slug_configuration(cls) -> list[checks.CheckMessage]:
         """
-        if not self.slug:
-            self.slug = self.generate_slug()
-        super().save(*args, **kwargs)
+        Does a sanity check of the slug configuration for the system check
+        framework, so mistakes are reported at startup rather than on save.
 
-    def check_slug_configuration(self) -> None:
+        Returns:
+            A list of check errors, empty if the configuration is valid.
         """
-        Does a sanity check to ensure the slug configuration and save operations.
-        Raise `ImproperlyConfigured` if fails test.
+        if not cls._slug_source_fields:
+            return [
+                checks.Error(
+                    "SlugMeta.slug_based_on_fields must name at least one field.",
+                    obj=cls,
+                    id="core.E001",
+                )
+            ]
+        return [
+            checks.Error(
+                f"Cannot find field '{x}' in model to generate slug from.",
+                hint="Check SlugMeta.slug_based_on_fields.",
+                obj=cls,
+                id="core.E002",
+            )
+            for x in cls._slug_source_fields
+            if not hasattr(cls, x)
+        ]
+
+    def get_slug_source(self) -> str:
+        """
+        Gathers the slug source field data into the text a slug is built from.
         """
-        for x in self._slug_meta.slug_based_on_fields:  # type: ignore
-            if not hasattr(self, x):
-                msg = f"Cannot find field '{x}' in model to generate slug from."
-                raise ImproperlyConfigured(msg)
+        src_fields = self._slug_source_fields
+        if len(src_fields) == 1:
+            return getattr(self, src_fields[0])
+        return "".join(f" {getattr(self, x)}" for x in src_fields)
 
-    def generate_slug(self) -> str:
+    def generate_slug(self, using: str | None = None) -> str:
         """
         Gathers the slug source field data and sets the slug based on the result of
         a unique slug.
+
+        Args:
+            using (str | None): Database alias to check uniqueness against.
         """
-        self.check_slug_configuration()
-        slug_src: str = ""
-        src_fields = self._slug_meta.slug_based_on_fields  # type: ignore
-        if len(src_fields) > 1:
-            for x in src_fields:
-                slug_src = f"{slug_src} {getattr(self, x)}"
-        else:
-            slug_src = getattr(self, src_fields[0])
         return generate_unique_slug_for_model(
-            type(self), text=slug_src, allow_unicode=True
+            type(self), text=self.get_slug_source(), allow_unicode=True, using=using
         )
 
 
+class SluggedUUIDTimestampedQuerySet(TimeStampedQuerySet, UniqueSlugQuerySet):
+    """
+    Combines the timestamp-aware bulk updates and bulk slug assignment.
+    """
+
+
 class SluggedUUIDTimestampedModel(UUIDModel, TimeStampedModel, UniqueSlugModel):
     """
     Combines the timestamped, UUID, and Unique Slug models.
@@ -125,9 +345,268 @@ class SluggedUUIDTimestampedModel(UUIDModel, TimeStampedModel, UniqueSlugModel):
         modified_at (datetime): The date and time when the record was last updated.
     """
 
-    class Meta:
+    _loaded_slug: str | None = None
+
+    objects = SluggedUUIDTimestampedQuerySet.as_manager()
+
+    class Meta(TimeStampedModel.Meta):
         abstract = True
 
     class SlugMeta:
         # Placeholder value, you should override this on your models.
         slug_based_on_fields = ["title"]
+
+    def save(self, *args, **kwargs):
+        """
+        Save the record, and add its slug to the slug history whenever it is new
+        or has changed so that URLs built on older slugs can still be resolved.
+        """
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        adding = self._state.adding
+        previous_slug = self._loaded_slug
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
+            if adding or self.slug != previous_slug:
+                SlugHistory.objects.db_manager(using).record(
+                    self, None if adding else previous_slug
+                )
+        self._loaded_slug = self.slug
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored slug so a later save can tell whether it changed.
+        instance._loaded_slug = instance.__dict__.get("slug")
+        return instance
+
+
+class SluggedUUID7TimestampedModel(UUID7Model, SluggedUUIDTimestampedModel):
+    """
+    Same as `SluggedUUIDTimestampedModel`, but with a time-ordered UUID (version 7)
+    primary key. See `UUID7Model` for the trade-offs and migration steps.
+
+    Attributes:
+        id (uuid): The primary key of the model.
+        slug (str): A unique slug for this instance.
+        created_at (datetime): The date and time when the record was created.
+        modified_at (datetime): The date and time when the record was last updated.
+    """
+
+    class Meta(SluggedUUIDTimestampedModel.Meta):
+        abstract = True
+
+
+class SlugHistoryManager(models.Manager):
+    """Records and resolves the slugs that objects have had over time."""
+
+    @staticmethod
+    def cache_key(content_type: ContentType, slug: str) -> str:
+        return f"core:slug-redirect:{content_type.pk}:{slug}"
+
+    def record(
+        self, instance: SluggedUUIDTimestampedModel, previous_slug: str | None = None
+    ) -> None:
+        """
+        Record the current slug of `instance` (and the one it replaced, if any), and
+        point every cached redirect for the object at the current slug once the
+        transaction commits.
+
+        Args:
+            instance (SluggedUUIDTimestampedModel): The object that was just saved.
+            previous_slug (str | None): The slug the object had before this save.
+        """
+        content_type = ContentType.objects.get_for_model(instance)
+        slugs = {instance.slug}
+        if previous_slug:
+            slugs.add(previous_slug)
+        self.bulk_create(
+            [
+                self.model(content_type=content_type, object_id=instance.pk, slug=slug)
+                for slug in slugs
+            ],
+            update_conflicts=True,
+            unique_fields=["content_type", "slug"],
+            update_fields=["object_id"],
+        )
+        if not previous_slug:
+            # A brand new record has no older slugs to redirect.
+            return
+        old_slugs = list(
+            self.filter(content_type=content_type, object_id=instance.pk)
+            .exclude(slug=instance.slug)
+            .values_list("slug", flat=True)
+        )
+        if not old_slugs:
+            return
+        redirects = {
+            self.cache_key(content_type, old_slug): instance.slug
+            for old_slug in old_slugs
+        }
+        transaction.on_commit(
+            lambda: cache.set_many(redirects, SLUG_REDIRECT_CACHE_TIMEOUT),
+            using=self.db,
+        )
+
+    def resolve(
+        self, model: type[SluggedUUIDTimestampedModel], slug: str
+    ) -> str | None:
+        """
+        Find the current slug of the object that used to have `slug`.
+
+        Answers come from the cache when possible, otherwise from a single indexed
+        query whose result, including a miss, is then cached.
+
+        Args:
+            model (type[SluggedUUIDTimestampedModel]): The model being looked up.
+            slug (str): A slug that is not (or no longer) live.
+        Returns:
+            The canonical slug, or None if `slug` was never used by the model.
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        key = self.cache_key(content_type, slug)
+        canonical = cache.get(key)
+        if canonical is not None:
+            return canonical or None
+        canonical = (
+            model._default_manager.filter(
+                pk__in=self.filter(content_type=content_type, slug=slug).values(
+                    "object_id"
+                )
+            )
+            .values_list("slug", flat=True)
+            .first()
+        )
+        if canonical == slug:
+            canonical = None
+        if canonical is None:
+            cache.set(key, "", SLUG_REDIRECT_MISS_CACHE_TIMEOUT)
+        else:
+            cache.set(key, canonical, SLUG_REDIRECT_CACHE_TIMEOUT)
+        return canonical
+
+    def forget(self, instance: SluggedUUIDTimestampedModel) -> None:
+        """Remove the slug history of a deleted object, and its cached redirects."""
+        content_type = ContentType.objects.get_for_model(instance)
+        history = self.filter(content_type=content_type, object_id=instance.pk)
+        keys = [
+            self.cache_key(content_type, slug)
+            for slug in history.values_list("slug", flat=True)
+        ]
+        history.delete()
+        if keys:
+            transaction.on_commit(lambda: cache.delete_many(keys), using=self.db)
+
+
+class SlugHistory(models.Model):
+    """
+    Every slug that a `SluggedUUIDTimestampedModel` record has had, so requests for
+    old URLs can be redirected to the current one.
+
+    Attributes:
+        content_type (ContentType): The model the slug belongs to.
+        object_id (uuid): The primary key of the record.
+        slug (str): A current or former slug of the record.
+        created_at (datetime): When the slug was first recorded.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.UUIDField()
+    slug = models.SlugField(allow_unicode=True, max_length=150, db_index=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects: ClassVar[SlugHistoryManager] = SlugHistoryManager()
+
+    class Meta:
+        verbose_name_plural = _("slug history")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "slug"], name="core_slughistory_unique_slug"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["content_type", "object_id"], name="core_slughistory_obj_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:  # no cov
+        return self.slug
+
+
+class TombstoneManager(models.Manager):
+    """Records and prunes the tombstones of deleted records."""
+
+    def record(self, instance: TimeStampedModel) -> "Tombstone":
+        """Leave a tombstone for `instance`, which is being deleted."""
+        return self.create(
+            content_type=ContentType.objects.get_for_model(instance),
+            object_id=str(instance.pk),
+        )
+
+    def prune(self, days: int = TOMBSTONE_RETENTION_DAYS) -> int:
+        """
+        Delete tombstones older than `days`. Consumers that fall further behind
+        than this need a full resync.
+
+        Args:
+            days (int): How many days of tombstones to keep.
+        Returns:
+            The number of tombstones deleted.
+        """
+        cutoff = timezone.now() - timedelta(days=days)
+        deleted, _ = self.filter(deleted_at__lt=cutoff).delete()
+        return deleted
+
+
+class Tombstone(models.Model):
+    """
+    A marker left behind when a `TimeStampedModel` record is deleted, so that change
+    feed consumers can remove it downstream.
+
+    Attributes:
+        content_type (ContentType): The model of the deleted record.
+        object_id (str): The primary key of the deleted record.
+        deleted_at (datetime): When the record was deleted.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.CharField(max_length=255)
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    objects: ClassVar[TombstoneManager] = TombstoneManager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["content_type", "deleted_at", "id"],
+                name="core_tombstone_feed_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:  # no cov
+        return self.object_id
+
+
+def remove_slug_history(sender, instance, using, **kwargs):  # noqa: ARG001
+    SlugHistory.objects.db_manager(using).forget(instance)
+
+
+def record_tombstone(sender, instance, using, **kwargs):  # noqa: ARG001
+    Tombstone.objects.db_manager(using).record(instance)
+
+
+@receiver(class_prepared)
+def connect_delete_receivers(sender, **kwargs):  # noqa: ARG001
+    """
+    Connect the delete receivers, and the slug resolver cache, to each concrete
+    model that needs them.
+
+    They are connected per model rather than to every sender, since any
+    `post_delete` receiver for a model stops Django from deleting its rows in
+    bulk without loading them first.
+    """
+    if issubclass(sender, TimeStampedModel):
+        post_delete.connect(record_tombstone, sender=sender)
+    if issubclass(sender, SluggedUUIDTimestampedModel):
+        post_delete.connect(remove_slug_history, sender=sender)
+        get_slug_resolver(sender)
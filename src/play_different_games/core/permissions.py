@@ -0,0 +1,169 @@
+# permissions.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Object permissions that scale past one object at a time.
+
+`rules` evaluates a permission's predicate for a single user and object. Here,
+a predicate is compiled into a `Q` object instead, so that "the objects this
+user may edit" is one query rather than a check per row. Predicates that only
+look at the user, such as `rules.is_superuser`, are evaluated once and folded
+into the filter; predicates about the object need a filter registered with
+`register_filter()`.
+
+`MemoizedObjectPermissionBackend` remembers each answer on the user for the
+rest of the request, so templates checking the same permission repeatedly
+evaluate it once.
+"""
+
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from django.db import models
+from django.db.models import Q
+from rules.permissions import ObjectPermissionBackend, permissions
+from rules.predicates import Predicate
+
+# A compiled predicate: a filter, or a constant when it does not depend on the
+# object. None is a predicate that skipped itself, which `rules` ignores in
+# combinations and treats as False otherwise.
+Compiled = Q | bool | None
+
+_filters: dict[Predicate, Callable[[Any], Compiled]] = {}
+
+# Name of the attribute holding the memoized answers on the user.
+PERMISSION_CACHE_ATTRIBUTE = "_rules_perm_cache"
+
+
+def register_filter(predicate: Predicate, build: Callable[[Any], Compiled]) -> None:
+    """
+    Register how `predicate` is expressed as a query filter.
+
+    Args:
+        predicate (Predicate): An object predicate, such as `is_self`.
+        build (Callable): Called with the user, returns a `Q` matching the objects
+            the predicate is true for, or a bool if that does not depend on them.
+    """
+    _filters[predicate] = build
+
+
+def _fold(operator: str, query: Q, *, constant: bool) -> Compiled:
+    match operator, constant:
+        case "AND", True:
+            return query
+        case "AND", False:
+            return False
+        case "OR", True:
+            return True
+        case "XOR", True:
+            return ~query
+        case _:
+            return query
+
+
+def _combine(operator: str, left: Compiled, right: Compiled) -> Compiled:
+    match left, right:
+        case None, _:
+            return right
+        case _, None:
+            return left
+        case bool(), bool():
+            return {
+                "AND": left and right,
+                "OR": left or right,
+                "XOR": left != right,
+            }[operator]
+        case bool(), Q():
+            return _fold(operator, right, constant=left)
+        case Q(), bool():
+            return _fold(operator, left, constant=right)
+        case Q(), Q():
+            return {"AND": left & right, "OR": left | right, "XOR": left ^ right}[
+                operator
+            ]
+
+
+def compile_predicate(predicate: Predicate, user: Any) -> Compiled:
+    """
+    Compile `predicate` into a filter on the objects it is true for, for `user`.
+
+    Args:
+        predicate (Predicate): The predicate to compile, combined with `&`, `|`,
+            `^` and `~` or not.
+        user (Any): The user it is evaluated for.
+    Returns:
+        A `Q`, or a bool (or None) when the answer does not depend on the object.
+    Raises:
+        TypeError: If an object predicate in it has no registered filter.
+    """
+    if predicate in _filters:
+        return _filters[predicate](user)
+    operator = predicate.fn.__name__
+    if operator in {"AND", "OR", "XOR", "INVERT"}:
+        # Combined predicates close over their operands as `self` and `other`.
+        operands = inspect.getclosurevars(predicate.fn).nonlocals
+        compiled = compile_predicate(operands["self"], user)
+        if operator == "INVERT":
+            if isinstance(compiled, bool):
+                return not compiled
+            return compiled if compiled is None else ~compiled
+        return _combine(operator, compiled, compile_predicate(operands["other"], user))
+    if predicate.num_args <= 1:
+        result = predicate.test(user)
+        return result if result is None else bool(result)
+    msg = (
+        f"Predicate {predicate.name!r} depends on the object and has no filter; "
+        "register one with register_filter()."
+    )
+    raise TypeError(msg)
+
+
+def filter_permitted(
+    queryset: models.QuerySet, user: Any, perm: str
+) -> models.QuerySet:
+    """
+    Narrow `queryset` to the objects `user` has the `rules` permission `perm` for.
+
+    Args:
+        queryset (QuerySet): The objects to filter.
+        user (Any): The user whose permission is checked.
+        perm (str): Name of a permission added with `rules.add_perm()`.
+    Returns:
+        The filtered queryset, or an empty one if the permission is never granted.
+    """
+    compiled = compile_predicate(permissions[perm], user)
+    if compiled is True:
+        return queryset.all()
+    if compiled is None or compiled is False:
+        return queryset.none()
+    return queryset.filter(compiled)
+
+
+class MemoizedObjectPermissionBackend(ObjectPermissionBackend):
+    """
+    Same as `rules`' `ObjectPermissionBackend`, except that answers are kept on
+    the user, which lives for one request, the way Django's `ModelBackend`
+    keeps permissions. Checks on unsaved objects are not memoized.
+    """
+
+    def has_perm(self, user, perm, *args, **kwargs):
+        obj = args[0] if args else kwargs.get("obj")
+        if len(args) > 1 or set(kwargs) - {"obj"}:
+            key = None
+        elif obj is None:
+            key = (perm, None, None)
+        elif isinstance(obj, models.Model) and obj.pk is not None:
+            key = (perm, obj._meta.label, obj.pk)
+        else:
+            key = None
+        if key is None:
+            return super().has_perm(user, perm, *args, **kwargs)
+        memo = user.__dict__.setdefault(PERMISSION_CACHE_ATTRIBUTE, {})
+        if key not in memo:
+            memo[key] = super().has_perm(user, perm, *args, **kwargs)
+        return memo[key]
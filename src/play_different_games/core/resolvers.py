@@ -0,0 +1,161 @@
+# resolvers.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+A shared cache that resolves slug-like URL values to primary keys.
+
+A slug-routed detail view normally looks its object up by the slug index on every
+request. With a resolver, the slug to primary key mapping comes from the cache
+and the object is fetched by primary key, or comes from the cache as well when
+the view opts into caching whole objects.
+"""
+
+from typing import Any
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+
+from play_different_games.core.metrics import metrics
+
+# How long (in seconds) slug to primary key mappings and cached objects are kept.
+SLUG_RESOLVER_CACHE_TIMEOUT = 60 * 60 * 24
+
+_resolvers: dict[tuple[type[models.Model], str], "SlugResolver"] = {}
+
+
+class SlugResolver:
+    """
+    Resolves the values of a unique field of `model` to objects, through the cache.
+
+    Cached entries are dropped when an object is saved or deleted. A mapping that
+    went stale some other way, such as through `QuerySet.update()`, is detected
+    on the next lookup since the primary key fetch also matches on the slug.
+
+    Attributes:
+        model (type[Model]): The model being resolved.
+        slug_field (str): The unique field to resolve by.
+        metric_prefix (str): Prefix of the hit and miss counters in `metrics`.
+    """
+
+    def __init__(self, model: type[models.Model], slug_field: str = "slug"):
+        self.model = model
+        self.slug_field = slug_field
+        self.metric_prefix = f"slug_resolver.{model._meta.label_lower}"
+
+    def slug_key(self, slug: str) -> str:
+        return f"core:slug-pk:{self.model._meta.label_lower}:{self.slug_field}:{slug}"
+
+    def object_key(self, pk: Any) -> str:
+        return f"core:object:{self.model._meta.label_lower}:{pk}"
+
+    def get_object(
+        self,
+        slug: str,
+        queryset: models.QuerySet | None = None,
+        *,
+        cache_object: bool = False,
+    ) -> models.Model:
+        """
+        Find the object whose slug field is `slug`.
+
+        A cache hit costs a single primary key lookup, or no query at all when
+        `cache_object` is set and the object itself is cached. Only cache objects
+        when every view using this resolver reads the same, non request-specific
+        queryset, since a cached object skips any filtering `queryset` would do.
+
+        Args:
+            slug (str): The value of the slug field.
+            queryset (QuerySet | None): Queryset to fetch from, such as a view's
+                `get_queryset()`. Default is the model's default manager.
+            cache_object (bool): Also cache the object, not just its primary key.
+        Returns:
+            The model instance.
+        Raises:
+            Model.DoesNotExist: No object in `queryset` has that slug.
+        """
+        if queryset is None:
+            queryset = self.model._default_manager.all()
+        pk = cache.get(self.slug_key(slug))
+        if pk is not None:
+            if cache_object:
+                obj = cache.get(self.object_key(pk))
+                if obj is not None and getattr(obj, self.slug_field) == slug:
+                    metrics.increment(f"{self.metric_prefix}.object_hits")
+                    return obj
+            obj = queryset.filter(pk=pk, **{self.slug_field: slug}).first()
+            if obj is not None:
+                metrics.increment(f"{self.metric_prefix}.hits")
+                if cache_object:
+                    cache.set(self.object_key(pk), obj, SLUG_RESOLVER_CACHE_TIMEOUT)
+                return obj
+            metrics.increment(f"{self.metric_prefix}.stale")
+        metrics.increment(f"{self.metric_prefix}.misses")
+        obj = queryset.get(**{self.slug_field: slug})
+        entries = {self.slug_key(slug): obj.pk}
+        if cache_object:
+            entries[self.object_key(obj.pk)] = obj
+        cache.set_many(entries, SLUG_RESOLVER_CACHE_TIMEOUT)
+        return obj
+
+    def invalidate(
+        self,
+        instance: models.Model,
+        previous_slug: str | None = None,
+        using: str | None = None,
+    ) -> None:
+        """
+        Drop the cached entries for `instance` once the current transaction commits,
+        so that no other request can cache the old state in the meantime.
+
+        Args:
+            instance (Model): The object that was saved or deleted.
+            previous_slug (str | None): The slug it had before, if it changed.
+            using (str | None): Database alias of the transaction.
+        """
+        keys = [
+            self.slug_key(getattr(instance, self.slug_field)),
+            self.object_key(instance.pk),
+        ]
+        if previous_slug:
+            keys.append(self.slug_key(previous_slug))
+        transaction.on_commit(lambda: cache.delete_many(keys), using=using)
+
+    def _on_change(self, sender, instance, using, **kwargs):  # noqa: ARG002
+        # SluggedUUIDTimestampedModel remembers the slug it was loaded with.
+        previous_slug = getattr(instance, f"_loaded_{self.slug_field}", None)
+        self.invalidate(instance, previous_slug, using=using)
+
+
+def get_slug_resolver(
+    model: type[models.Model], slug_field: str = "slug"
+) -> SlugResolver:
+    """
+    Get the resolver for `model` and `slug_field`, creating it on first use.
+
+    Creating a resolver connects the receivers that invalidate it, which have to
+    be in place in every process that writes to the model. Models built on
+    `SluggedUUIDTimestampedModel` get theirs when the class is created. For any
+    other model, call this from an `AppConfig.ready()`.
+
+    Args:
+        model (type[Model]): The model being resolved.
+        slug_field (str): The unique field to resolve by. Default 'slug'.
+    Returns:
+        The `SlugResolver`.
+    """
+    resolver = _resolvers.get((model, slug_field))
+    if resolver is None:
+        resolver = _resolvers[model, slug_field] = SlugResolver(model, slug_field)
+        dispatch_uid = f"slug_resolver:{slug_field}"
+        post_save.connect(
+            resolver._on_change, sender=model, weak=False, dispatch_uid=dispatch_uid
+        )
+        post_delete.connect(
+            resolver._on_change, sender=model, weak=False, dispatch_uid=dispatch_uid
+        )
+    return resolver
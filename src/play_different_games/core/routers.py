@@ -0,0 +1,170 @@
+# routers.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Routing of reads to the replicas of the default database.
+
+Only reads made while serving a request go to a replica, and only for models of
+the apps in `DATABASE_REPLICA_APPS`. Everything else, including management
+commands, tasks and reads inside a transaction on the primary (which is every
+view not marked with `read_only_view()` while `ATOMIC_REQUESTS` is on), uses the
+primary.
+
+Once a request writes to a replicated app, its remaining reads use the primary,
+and `ReplicaPinningMiddleware` keeps the client on the primary for
+`DATABASE_PRIMARY_PIN_SECONDS`, so that it reads its own writes while the
+replicas catch up. Replicas lagging more than `DATABASE_REPLICA_MAX_LAG` seconds
+behind are skipped until they catch up.
+"""
+
+import logging
+import math
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from play_different_games.core.metrics import metrics
+
+logger = logging.getLogger("play_different_games")
+
+# Seconds between measurements of a replica's lag.
+LAG_CHECK_INTERVAL = 5.0
+# Seconds the replica has yet to replay, 0 when it has replayed all it received.
+# NULL when it is not streaming from the primary, since it then has nothing to
+# replay however far behind it is. Reading the WAL receiver's status takes the
+# pg_read_all_stats role; without it, replicas are always taken as behind.
+LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT FROM pg_stat_wal_receiver WHERE status = 'streaming'
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+@dataclass
+class RoutingState:
+    """
+    How the reads of the current request are routed.
+
+    Attributes:
+        pinned (bool): Whether reads use the primary.
+        wrote (bool): Whether the request wrote to a replicated app.
+    """
+
+    pinned: bool = False
+    wrote: bool = False
+
+
+# Set for the duration of a request by `ReplicaPinningMiddleware`. The state is
+# mutated rather than replaced, so that writes made in a thread under ASGI are
+# seen by the middleware.
+routing_state: ContextVar[RoutingState | None] = ContextVar(
+    "routing_state", default=None
+)
+
+
+class ReplicaRouter:
+    """
+    Sends reads of the replicated apps to a random replica in
+    `DATABASE_REPLICAS` that is keeping up with the primary.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Alias: (when it was measured, lag in seconds).
+        self._lags: dict[str, tuple[float, float]] = {}
+
+    def db_for_read(self, model, **hints):  # noqa: ARG002
+        state = routing_state.get()
+        if (
+            state is None
+            or state.pinned
+            or model._meta.app_label not in settings.DATABASE_REPLICA_APPS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return None
+        replicas = [
+            alias
+            for alias in settings.DATABASE_REPLICAS
+            if self.replica_lag(alias) <= settings.DATABASE_REPLICA_MAX_LAG
+        ]
+        if not replicas:
+            metrics.increment("db_router.primary_fallbacks")
+            return None
+        metrics.increment("db_router.replica_reads")
+        return random.choice(replicas)  # noqa: S311
+
+    def db_for_write(self, model, **hints):  # noqa: ARG002
+        state = routing_state.get()
+        if (
+            state is not None
+            and model._meta.app_label in settings.DATABASE_REPLICA_APPS
+        ):
+            state.pinned = state.wrote = True
+
+    def allow_relation(self, obj1, obj2, **hints):  # noqa: ARG002
+        # Objects read from a replica are rows of the primary.
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if {obj1._state.db, obj2._state.db} <= databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):  # noqa: ARG002
+        return False if db in settings.DATABASE_REPLICAS else None
+
+    def replica_lag(self, alias: str) -> float:
+        """
+        Seconds the replica `alias` lags behind the primary, measured at most
+        every `LAG_CHECK_INTERVAL` seconds.
+        """
+        now = time.monotonic()
+        with self._lock:
+            measured_at, lag = self._lags.get(alias, (-math.inf, 0.0))
+            if now - measured_at < LAG_CHECK_INTERVAL:
+                return lag
+            # Other threads keep the last measurement while this one measures.
+            self._lags[alias] = (now, lag)
+        lag = self.measure_lag(alias)
+        with self._lock:
+            self._lags[alias] = (now, lag)
+        if lag > settings.DATABASE_REPLICA_MAX_LAG:
+            metrics.increment("db_router.replicas_lagging")
+            logger.warning("Replica %s is %.1f seconds behind", alias, lag)
+        return lag
+
+    def measure_lag(self, alias: str) -> float:
+        """
+        Ask the replica `alias` how far behind it is.
+
+        Returns:
+            The lag in seconds, 0 for databases other than PostgreSQL, and
+            infinity when the replica cannot be reached or is not streaming
+            from the primary.
+        """
+        connection = connections[alias]
+        if connection.vendor != "postgresql":
+            return 0.0
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(LAG_QUERY)
+                row = cursor.fetchone()
+        except DatabaseError:
+            logger.exception("Cannot measure the lag of replica %s", alias)
+            return math.inf
+        if row is None or row[0] is None:
+            logger.warning("Replica %s is not streaming from the primary", alias)
+            return math.inf
+        return float(row[0])
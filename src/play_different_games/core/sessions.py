@@ -0,0 +1,96 @@
+# sessions.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+A session engine that reads from the cache and writes to the database, but only
+when there is something to write.
+
+Use it with `SESSION_ENGINE = "play_different_games.core.sessions"`. Sessions are
+read from the cache and fall back to the database, so they survive eviction,
+like Django's `cached_db` engine. Saving is skipped when the data is the same as
+it was loaded, unless the session was last written more than
+`SESSION_TOUCH_INTERVAL` seconds ago. With `SESSION_SAVE_EVERY_REQUEST`, that
+keeps the expiry sliding at the cost of one write per interval, rather than one
+per request. The stored expiry lags the cookie's by at most the interval.
+"""
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+
+from play_different_games.core.metrics import metrics
+
+# Private session key holding when the session was last written, in epoch seconds.
+SAVED_AT_KEY = "_session_saved_at"
+
+if TYPE_CHECKING:
+
+    class _SessionBase(CachedDBStore):
+        """What the type stubs are missing of Django's session stores."""
+
+        _session: dict[str, Any]
+
+        def _get_session(self, no_load: bool = False) -> dict[str, Any]: ...  # noqa: FBT001, FBT002
+        async def _aget_session(self, no_load: bool = False) -> dict[str, Any]: ...  # noqa: FBT001, FBT002
+        async def aload(self) -> dict[str, Any]: ...
+        async def asave(self, must_create: bool = False) -> None: ...  # noqa: FBT001, FBT002
+
+else:
+    _SessionBase = CachedDBStore
+
+
+class SessionStore(_SessionBase):
+    """Cached, database-backed sessions that skip redundant writes."""
+
+    _loaded = None
+
+    def _fingerprint(self, data: dict) -> bytes:
+        return self.serializer().dumps(
+            {key: value for key, value in data.items() if key != SAVED_AT_KEY}
+        )
+
+    def _remember(self, data: dict) -> dict:
+        self._loaded = (self._fingerprint(data), data.get(SAVED_AT_KEY, 0))
+        return data
+
+    def load(self):
+        return self._remember(super().load())
+
+    async def aload(self):
+        return self._remember(await super().aload())
+
+    def _needs_save(self, must_create: bool) -> bool:  # noqa: FBT001
+        if must_create or self.session_key is None:
+            return True
+        session = self._get_session()
+        if self._loaded is None:
+            return True
+        fingerprint, saved_at = self._loaded
+        if fingerprint != self._fingerprint(session):
+            return True
+        return time.time() - saved_at >= settings.SESSION_TOUCH_INTERVAL
+
+    def _before_save(self, must_create: bool) -> bool:  # noqa: FBT001
+        if not self._needs_save(must_create):
+            metrics.increment("sessions.unchanged")
+            return False
+        self._get_session()[SAVED_AT_KEY] = int(time.time())
+        metrics.increment("sessions.saved")
+        return True
+
+    def save(self, must_create=False):  # noqa: FBT002
+        if self._before_save(must_create):
+            super().save(must_create)
+            self._remember(self._session)
+
+    async def asave(self, must_create=False):  # noqa: FBT002
+        await self._aget_session()
+        if self._before_save(must_create):
+            await super().asave(must_create)
+            self._remember(self._session)
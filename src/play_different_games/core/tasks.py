@@ -12,6 +12,8 @@ import logging
 from django.core.files.storage import default_storage
 from prune_media.utils import get_unreferenced_media_paths
 
+from play_different_games.core.models import Tombstone
+
 logger = logging.getLogger("playdifferentgames")
 
 
@@ -37,3 +39,14 @@ def remove_unreferenced_media_files() -> tuple[int, int]:
         f"delete {total_failed} unreferenced media files."
     )
     return total_deleted, total_failed
+
+
+def remove_expired_tombstones() -> int:
+    """Delete tombstones that are older than the change feed retention period.
+
+    Returns:
+        Number of deleted tombstones.
+    """
+    total_deleted = Tombstone.objects.prune()
+    logger.debug(f"Deleted {total_deleted} expired tombstones.")
+    return total_deleted
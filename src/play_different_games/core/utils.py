@@ -6,13 +6,239 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import logging
+import operator
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from functools import reduce
+from uuid import UUID
 
-from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Model
+from django.db import connections, router
+from django.db.models import Model, Q
 from django.utils.text import slugify
 
 logger = logging.getLogger("play_different_games")
 
+# How many distinct base slugs are checked per collision query in bulk allocation.
+SLUG_LOOKUP_BATCH_SIZE = 500
+
+# How many advisory locks per table the base slugs are hashed into while allocating.
+SLUG_LOCK_BUCKETS = 64
+
+# Widest numeric suffix (in digits) we reserve room for when trimming long slugs.
+SLUG_SUFFIX_MAX_DIGITS = 10
+
+_SLUG_SUFFIX_RE = re.compile(r"-(\d+)$")
+
+# Last (unix_ts_ms, counter) handed out by `uuid7`, guarded by `_uuid7_lock`.
+_uuid7_state = [0, 0]
+_uuid7_lock = threading.Lock()
+_UUID7_COUNTER_MAX = 0xFFF
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix timestamp in milliseconds, so keys generated
+    later sort later and inserts land at the right-hand edge of a B-tree index.
+    The 12 bit `rand_a` field is used as a counter seeded at random each
+    millisecond, keeping keys monotonic within the process even when many are
+    generated in the same millisecond. The remaining 62 bits are random.
+
+    Returns:
+        A new `uuid.UUID`.
+
+    Examples:
+        >>> first, second = uuid7(), uuid7()
+        >>> first.version, first.variant
+        (7, 'specified in RFC 4122')
+        >>> first < second
+        True
+    """
+    with _uuid7_lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        last_ms, counter = _uuid7_state
+        if timestamp_ms > last_ms:
+            # Leave headroom so a burst within this millisecond rarely overflows.
+            counter = int.from_bytes(os.urandom(2)) & 0x7FF
+        else:
+            timestamp_ms = last_ms
+            counter += 1
+            if counter > _UUID7_COUNTER_MAX:
+                timestamp_ms += 1
+                counter = 0
+        _uuid7_state[:] = [timestamp_ms, counter]
+    rand_b = int.from_bytes(os.urandom(8)) & ((1 << 62) - 1)
+    return UUID(
+        int=(timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+
+
+def get_slug_max_length(
+    model_class: type[Model],
+    slug_field: str = "slug",
+    max_length_override: int | None = None,
+) -> int:
+    """
+    Resolve the maximum slug length, either from the override or the field itself.
+
+    Args:
+        model_class (Model): A class based upon `django.db.models.Model`.
+        slug_field (str): The name of the field for saving the slug. Default 'slug'.
+        max_length_override (int | None): Max length in characters for resulting slug.
+    Returns:
+        The maximum length as an int.
+    """
+    if not max_length_override:
+        logger.debug("Setting max_length of slug from field definition.")
+        return model_class._meta.get_field(slug_field).max_length  # type: ignore
+    logger.debug(
+        f"User override value for max length of slug with [{max_length_override}]"
+    )
+    return max_length_override
+
+
+def slug_candidate(base_slug: str, suffix: int, max_length: int) -> str:
+    """
+    Build the slug for `base_slug` with a numeric suffix, trimming the base so
+    the result still fits within `max_length`.
+
+    Args:
+        base_slug (str): The slug before any suffix is added.
+        suffix (int): The number to append.
+        max_length (int): Max length in characters for resulting slug.
+    Returns:
+        The candidate slug as a str.
+
+    Examples:
+        >>> slug_candidate("dungeon-world", 2, 150)
+        'dungeon-world-2'
+        >>> slug_candidate("dungeon-world", 12, 15)
+        'dungeon-worl-12'
+    """
+    tail = f"-{suffix}"
+    return base_slug[: max_length - len(tail)] + tail
+
+
+def slug_collision_filter(
+    base_slug: str, max_length: int, slug_field: str = "slug"
+) -> Q:
+    """
+    Build a filter that matches every existing slug that could collide with
+    `base_slug` or one of its suffixed candidates.
+
+    Both branches are plain equality or prefix lookups, so they are served by the
+    index Django creates for unique slug fields.
+
+    Args:
+        base_slug (str): The slug before any suffix is added.
+        max_length (int): Max length in characters for resulting slug.
+        slug_field (str): The name of the field for saving the slug. Default 'slug'.
+    Returns:
+        A `Q` object suitable for filtering the model's queryset.
+    """
+    shared_prefix = base_slug[: max(max_length - (SLUG_SUFFIX_MAX_DIGITS + 1), 0)]
+    if shared_prefix == base_slug:
+        # Candidates are never trimmed, so they all look like "<base>-<n>".
+        shared_prefix = f"{base_slug}-"
+    return Q(**{slug_field: base_slug}) | Q(
+        **{f"{slug_field}__startswith": shared_prefix}
+    )
+
+
+def lock_slug_bases(
+    model_class: type[Model], base_slugs: Iterable[str], using: str | None = None
+) -> bool:
+    """
+    Serialize slug allocation for the given base slugs across every process that
+    writes to the database.
+
+    On PostgreSQL this takes transaction-scoped advisory locks, all in a single
+    statement and in a consistent order so that overlapping batches cannot
+    deadlock. Base slugs are hashed into `SLUG_LOCK_BUCKETS` locks per table, so
+    even a batch of 100,000 rows takes a bounded number of locks and cannot run
+    out of the lock table (`max_locks_per_transaction`). Writers whose base slugs
+    share a bucket wait for each other needlessly, which is harmless. The locks
+    are released when the surrounding transaction ends, by which time the winning
+    row is visible to the next writer's lookup.
+
+    The locks only protect an insert made in the same transaction, so callers
+    must wrap allocation and insert in `transaction.atomic()`, as
+    `UniqueSlugModel.save()` and `UniqueSlugQuerySet.bulk_create()` do. In
+    autocommit, such as a task calling `generate_unique_slug_for_model()`
+    directly, or on other backends, this does nothing and callers fall back to
+    retrying on `IntegrityError`.
+
+    Args:
+        model_class (Model): A class based upon `django.db.models.Model`.
+        base_slugs (Iterable[str]): The base slugs about to be allocated from.
+        using (str | None): Database alias that will receive the insert.
+    Returns:
+        Whether the locks were taken.
+    """
+    connection = connections[using or router.db_for_write(model_class)]
+    if connection.vendor != "postgresql" or not connection.in_atomic_block:
+        return False
+    base_slugs = sorted(set(base_slugs))
+    if not base_slugs:
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(hashtext(%s), bucket) FROM ("
+            "SELECT DISTINCT abs(hashtext(base_slug) %% %s) AS bucket "
+            "FROM unnest(%s::text[]) AS base_slug"
+            ") AS slug_locks ORDER BY bucket",
+            [model_class._meta.db_table, SLUG_LOCK_BUCKETS, base_slugs],
+        )
+    return True
+
+
+def next_free_slug(base_slug: str, existing: Iterable[str], max_length: int) -> str:
+    """
+    Pick the first free slug for `base_slug`, given the slugs already in use.
+
+    Args:
+        base_slug (str): The slug before any suffix is added.
+        existing (Iterable[str]): Slugs already taken. May include unrelated values.
+        max_length (int): Max length in characters for resulting slug.
+    Returns:
+        The first available slug as a str.
+
+    Examples:
+        >>> next_free_slug("dungeon-world", [], 150)
+        'dungeon-world'
+        >>> next_free_slug("dungeon-world", ["dungeon-world", "dungeon-world-1"], 150)
+        'dungeon-world-2'
+        >>> next_free_slug("dungeon-world", ["dungeon-world", "dungeon-world-2"], 150)
+        'dungeon-world-1'
+    """
+    base_taken = False
+    taken_suffixes: set[int] = set()
+    for slug in existing:
+        if slug == base_slug:
+            base_taken = True
+            continue
+        match = _SLUG_SUFFIX_RE.search(slug)
+        if match is None:
+            continue
+        suffix = int(match.group(1))
+        # Ignore look-alikes such as "-01" or slugs sharing only a trimmed prefix.
+        if slug_candidate(base_slug, suffix, max_length) == slug:
+            taken_suffixes.add(suffix)
+    if not base_taken:
+        return base_slug
+    next_val = 1
+    while next_val in taken_suffixes:
+        next_val += 1
+    return slug_candidate(base_slug, next_val, max_length)
+
 
 def generate_unique_slug_for_model(
     model_class: type[Model],
@@ -20,50 +246,105 @@ def generate_unique_slug_for_model(
     slug_field: str | None = "slug",
     max_length_override: int | None = None,
     allow_unicode: bool | None = None,
+    *,
+    using: str | None = None,
 ) -> str:
     """
     Given a text and model class, generate a unique slug based on that text.
 
+    All slugs that could collide with the result are fetched in a single query
+    and the next free suffix is computed in memory. When called inside a
+    transaction on PostgreSQL, the base slug is locked first (see
+    `lock_slug_bases`) so concurrent writers cannot pick the same slug.
+
     Args:
         model_class (Model): A class based upon `django.db.models.Model`.
         text (str): The text to convert to a slug.
         slug_field (str): The name of the field for saving the slug. Default 'slug'.
         max_length_override (int | None): Max length in characters for resulting slug.
         allow_unicode (bool | None): Allow Unicode characters in slug. Default None.
+        using (str | None): Database alias to check against. Default None.
     Returns:
         The generated slug as a str.
     """
     if allow_unicode is None:
         allow_unicode = False
-    unique_found: bool = False
-    has_next: bool = False
-    next_val: int = 1
-    max_length: int
-    if not max_length_override:
-        logger.debug("Setting max_length of slug from field definition.")
-        max_length: int = model_class._meta.get_field(slug_field).max_length  # type: ignore
-    else:
-        logger.debug(
-            f"User override value for max length of slug with [{max_length_override}]"
-        )
-        max_length = max_length_override
+    slug_field = str(slug_field)
+    max_length = get_slug_max_length(model_class, slug_field, max_length_override)
     base_slug = slugify(text[:max_length], allow_unicode=allow_unicode)
     logger.debug(f"Base slug is set to '{base_slug}'.")
-    slug = base_slug
-    while not unique_found:
-        logger.debug(f"Testing uniqueness of slug '{slug}'...")
-        try:
-            model_class.objects.get(**{str(slug_field): slug})
-        except ObjectDoesNotExist:
-            logger.debug("Slug is unique!")
-            unique_found = True
-        if not unique_found:
-            logger.debug("Slug is not unique yet.")
-            if has_next:
-                slug = base_slug
-            if len(slug) >= max_length:
-                slug = slug[: max_length - (len(str(next_val)) + 1)]
-            slug = slug + f"-{next_val}"
-            has_next = True
-            next_val += 1
+    lock_slug_bases(model_class, [base_slug], using=using)
+    existing = (
+        model_class._default_manager.db_manager(using)  # type: ignore
+        .filter(slug_collision_filter(base_slug, max_length, slug_field))
+        .values_list(slug_field, flat=True)
+    )
+    slug = next_free_slug(base_slug, existing, max_length)
+    logger.debug(f"Selected unique slug '{slug}'.")
     return slug
+
+
+def generate_unique_slugs_for_model(
+    model_class: type[Model],
+    texts: Sequence[str],
+    slug_field: str = "slug",
+    max_length_override: int | None = None,
+    *,
+    allow_unicode: bool = False,
+    using: str | None = None,
+    reserved: Iterable[str] = (),
+    lookup_batch_size: int = SLUG_LOOKUP_BATCH_SIZE,
+) -> list[str]:
+    """
+    Generate a unique slug for each of the given texts, such as for a batch of
+    objects about to be passed to `bulk_create`.
+
+    Slugs are unique both against existing rows and within the batch itself. The
+    number of queries depends only on the number of distinct base slugs, with one
+    query per `lookup_batch_size` of them, plus one to lock them all when inside a
+    transaction on PostgreSQL.
+
+    Args:
+        model_class (Model): A class based upon `django.db.models.Model`.
+        texts (Sequence[str]): The texts to convert to slugs.
+        slug_field (str): The name of the field for saving the slug. Default 'slug'.
+        max_length_override (int | None): Max length in characters for resulting slug.
+        allow_unicode (bool): Allow Unicode characters in slug. Default False.
+        using (str | None): Database alias to check against. Default None.
+        reserved (Iterable[str]): Slugs already claimed by other members of the
+            batch that must not be handed out again.
+        lookup_batch_size (int): Distinct base slugs to check per query.
+    Returns:
+        The generated slugs as a list of str, in the same order as `texts`.
+    """
+    max_length = get_slug_max_length(model_class, slug_field, max_length_override)
+    base_slugs = [
+        slugify(text[:max_length], allow_unicode=allow_unicode) for text in texts
+    ]
+    distinct_bases = list(dict.fromkeys(base_slugs))
+    lock_slug_bases(model_class, distinct_bases, using=using)
+    taken = set(reserved)
+    manager = model_class._default_manager.db_manager(using)  # type: ignore
+    for start in range(0, len(distinct_bases), lookup_batch_size):
+        chunk = distinct_bases[start : start + lookup_batch_size]
+        collisions = reduce(
+            operator.or_,
+            (slug_collision_filter(base, max_length, slug_field) for base in chunk),
+        )
+        taken.update(manager.filter(collisions).values_list(slug_field, flat=True))
+    logger.debug(
+        f"Allocating {len(base_slugs)} slugs from {len(distinct_bases)} base slugs "
+        f"against {len(taken)} existing slugs."
+    )
+    next_suffix: dict[str, int] = {}
+    slugs = []
+    for base_slug in base_slugs:
+        slug = base_slug
+        if slug in taken:
+            suffix = next_suffix.get(base_slug, 1)
+            while (slug := slug_candidate(base_slug, suffix, max_length)) in taken:
+                suffix += 1
+            next_suffix[base_slug] = suffix + 1
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
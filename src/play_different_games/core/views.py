@@ -0,0 +1,257 @@
+# views.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Reusable view mixins for models built on the core abstract models."""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import TYPE_CHECKING, Any, cast
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core import checks
+from django.db import connections, transaction
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponsePermanentRedirect,
+    JsonResponse,
+)
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils.translation import gettext as _
+
+from play_different_games.core.db import pool_stats
+from play_different_games.core.metrics import metrics
+from play_different_games.core.models import SlugHistory
+from play_different_games.core.resolvers import get_slug_resolver
+
+if TYPE_CHECKING:
+    from play_different_games.core.models import SluggedUUIDTimestampedModel
+
+
+class SlugHistoryRedirectMixin:
+    """
+    For slug-routed detail views of `SluggedUUIDTimestampedModel` subclasses.
+
+    When the slug in the URL is not live but has belonged to an object before,
+    answer with a permanent redirect to the object's current URL instead of a 404.
+    """
+
+    if TYPE_CHECKING:
+        model: type[SluggedUUIDTimestampedModel]
+        slug_url_kwarg: str
+        request: HttpRequest
+
+    def get(self, request, *args, **kwargs):
+        try:
+            return super().get(request, *args, **kwargs)  # type: ignore
+        except Http404:
+            slug = kwargs.get(self.slug_url_kwarg)
+            canonical = SlugHistory.objects.resolve(self.model, slug) if slug else None
+            if canonical is None:
+                raise
+        match = request.resolver_match
+        url = reverse(
+            match.view_name,
+            args=args,
+            kwargs={**kwargs, self.slug_url_kwarg: canonical},
+            current_app=match.namespace,
+        )
+        if query := request.META.get("QUERY_STRING"):
+            url = f"{url}?{query}"
+        return HttpResponsePermanentRedirect(url)
+
+
+class CachedSlugLookupMixin:
+    """
+    For slug-routed detail views, resolve the slug to a primary key through the
+    shared cache (see `play_different_games.core.resolvers`) instead of querying
+    the slug index on every request.
+
+    Set `cache_object` to also cache the object itself. Only do so when
+    `get_queryset()` does not depend on the request, since a cached object skips it.
+    """
+
+    cache_object = False
+
+    if TYPE_CHECKING:
+        kwargs: dict
+        pk_url_kwarg: str
+        slug_url_kwarg: str
+
+    def get_object(self, queryset=None):
+        slug = self.kwargs.get(self.slug_url_kwarg)
+        if slug is None or self.pk_url_kwarg in self.kwargs:
+            return super().get_object(queryset)  # type: ignore
+        if queryset is None:
+            queryset = self.get_queryset()  # type: ignore
+        resolver = get_slug_resolver(queryset.model, self.get_slug_field())  # type: ignore
+        try:
+            return resolver.get_object(slug, queryset, cache_object=self.cache_object)
+        except queryset.model.DoesNotExist as err:
+            raise Http404(
+                _("No %(verbose_name)s found matching the query")
+                % {"verbose_name": queryset.model._meta.verbose_name}
+            ) from err
+
+
+class MemoizedObjectMixin:
+    """
+    For single object views, fetch the object once per request even though both a
+    permission check and the view itself ask for it via `get_object()`.
+    """
+
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)  # type: ignore
+        if not hasattr(self, "_object"):
+            self._object = super().get_object()  # type: ignore
+        return self._object
+
+
+# Handlers of views that may write.
+WRITE_METHODS = ("post", "put", "patch", "delete")
+
+
+@contextmanager
+def read_only_atomic(using: str | None = None) -> Iterator[None]:
+    """
+    A transaction that may not write. On PostgreSQL, writes in it fail; elsewhere
+    it is an ordinary transaction. Nested in another transaction, it is a
+    savepoint, which cannot change the outer transaction to read only.
+
+    Args:
+        using (str): The database alias, the default database if not given.
+    """
+    connection = transaction.get_connection(using)
+    outermost = not connection.in_atomic_block
+    with transaction.atomic(using=using):
+        if outermost and connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION READ ONLY")
+        yield
+
+
+def read_only_view(
+    view: Callable[..., Any] | None = None, *, atomic: bool = False
+) -> Callable[..., Any]:
+    """
+    Marks a view as only reading, so `ATOMIC_REQUESTS` does not wrap it in a
+    transaction on any database. Its queries then run in autocommit, without the
+    round trips to begin and commit, and a pooled connection is not held in a
+    transaction while the response renders.
+
+    Can be used with or without arguments, as `@read_only_view` or
+    `@read_only_view(atomic=True)`.
+
+    Args:
+        view (Callable): The view function.
+        atomic (bool): Whether to run the view in a `read_only_atomic()`
+            transaction instead, for a consistent snapshot across its queries.
+            Sync views only.
+
+    Returns:
+        The view, or a decorator when `view` is not given.
+    """
+    if view is None:
+        return lambda view: read_only_view(view, atomic=atomic)
+    if atomic:
+        inner = view
+
+        @wraps(inner)
+        def atomic_view(request, *args, **kwargs):
+            with read_only_atomic():
+                return inner(request, *args, **kwargs)
+
+        view = atomic_view
+
+    for alias in connections:
+        view = transaction.non_atomic_requests(using=alias)(view)
+    return view
+
+
+class ReadOnlyViewMixin:
+    """
+    For class-based views that only read: opts the view out of
+    `ATOMIC_REQUESTS`, as `read_only_view()` does for view functions. Set
+    `atomic` to run it in a read-only transaction instead.
+    """
+
+    atomic = False
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)  # type: ignore
+        return read_only_view(view, atomic=initkwargs.get("atomic", cls.atomic))
+
+
+def _iter_patterns(
+    resolver: URLResolver, prefix: str = "", urlconf: str = ""
+) -> Iterator[tuple[str, URLPattern, str]]:
+    """The URL patterns under `resolver`, with their route and URLconf module."""
+    # The type stubs have url_patterns as a list of (route, view) tuples.
+    patterns = cast("list[URLPattern | URLResolver]", resolver.url_patterns)
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            # Lists of patterns, like the admin's, belong to the including URLconf.
+            module = getattr(pattern.urlconf_module, "__name__", urlconf)
+            yield from _iter_patterns(pattern, route, module)
+        else:
+            yield route, pattern, urlconf
+
+
+def check_read_only_views(app_configs, **kwargs) -> list[checks.CheckMessage]:  # noqa: ARG001
+    """
+    Warns about class-based views of the project that have no handler that
+    writes, but that `ATOMIC_REQUESTS` still wraps in a transaction. Views from
+    URLconfs outside the project's package, like Django's, are left alone.
+
+    Returns:
+        A list of check warnings, empty if there is nothing to report.
+    """
+    atomic_aliases = {
+        alias
+        for alias, database in settings.DATABASES.items()
+        if database.get("ATOMIC_REQUESTS")
+    }
+    if not atomic_aliases:
+        return []
+    package = settings.ROOT_URLCONF.split(".", 1)[0]
+    resolver = get_resolver()
+    warnings = []
+    root = getattr(resolver.urlconf_module, "__name__", "")
+    for route, pattern, urlconf in _iter_patterns(resolver, urlconf=root):
+        view_class = getattr(pattern.callback, "view_class", None)
+        if (
+            view_class is None
+            or urlconf.split(".", 1)[0] != package
+            or any(hasattr(view_class, method) for method in WRITE_METHODS)
+            or atomic_aliases
+            <= getattr(pattern.callback, "_non_atomic_requests", set())
+        ):
+            continue
+        warnings.append(
+            checks.Warning(
+                f"View '{view_class.__qualname__}' at '{route}' only reads, but "
+                "ATOMIC_REQUESTS runs it in a transaction.",
+                hint="Add ReadOnlyViewMixin, or wrap the view in read_only_view().",
+                obj=view_class,
+                id="core.W002",
+            )
+        )
+    return warnings
+
+
+@staff_member_required
+def metrics_view(request):  # noqa: ARG001
+    """
+    The counters of this process as JSON, for checking cache hit rates under load,
+    along with the state of its database connection pools.
+    """
+    return JsonResponse(metrics.snapshot() | pool_stats())
@@ -8,6 +8,7 @@
 import sys
 from pathlib import Path
 
+import dj_database_url
 from django.core.exceptions import ImproperlyConfigured
 from environs import Env
 
@@ -45,7 +46,48 @@ with env.prefixed("DJANGO_"):
     }
     DATABASES["default"]["ENGINE"] = "django.db.backends.postgresql"
     DATABASES["default"]["ATOMIC_REQUESTS"] = True
-    DATABASES["default"]["CONN_MAX_AGE"] = 300
+    if env.bool("DATABASE_POOL", default=False):
+        from psycopg_pool import ConnectionPool
+
+        # Connections are returned to the pool after each request instead of
+        # being kept open by every worker thread.
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+            "min_size": env.int("DATABASE_POOL_MIN_SIZE", default=2),
+            "max_size": env.int("DATABASE_POOL_MAX_SIZE", default=10),
+            # Seconds to wait for a connection before giving up.
+            "timeout": env.float("DATABASE_POOL_TIMEOUT", default=10.0),
+            # Seconds before a connection is replaced, and closed if unused.
+            "max_lifetime": env.float("DATABASE_POOL_MAX_LIFETIME", default=1800.0),
+            "max_idle": env.float("DATABASE_POOL_MAX_IDLE", default=300.0),
+        }
+        if env.bool("DATABASE_POOL_CHECK", default=True):
+            DATABASES["default"]["OPTIONS"]["pool"]["check"] = (
+                ConnectionPool.check_connection
+            )
+    else:
+        DATABASES["default"]["CONN_MAX_AGE"] = 300
+
+    # Read replicas of the default database, see play_different_games.core.routers.
+    DATABASE_REPLICAS = []
+    for number, url in enumerate(env.list("DATABASE_REPLICAS", default=[]), 1):
+        replica = dj_database_url.parse(
+            url, conn_max_age=DATABASES["default"]["CONN_MAX_AGE"]
+        )
+        replica["ENGINE"] = "django.db.backends.postgresql"
+        if pool := DATABASES["default"].get("OPTIONS", {}).get("pool"):
+            replica.setdefault("OPTIONS", {})["pool"] = pool
+        # Tests read what they write, from the test database.
+        replica["TEST"] = {"MIRROR": "default"}
+        DATABASES[f"replica{number}"] = replica
+        DATABASE_REPLICAS.append(f"replica{number}")
+    if DATABASE_REPLICAS:
+        DATABASE_ROUTERS = ["play_different_games.core.routers.ReplicaRouter"]
+    DATABASE_REPLICA_APPS = env.list("DATABASE_REPLICA_APPS", default=["auth", "users"])
+    # Seconds a replica may fall behind before it stops taking reads.
+    DATABASE_REPLICA_MAX_LAG = env.float("DATABASE_REPLICA_MAX_LAG", default=5.0)
+    # Seconds a client reads from the primary after writing.
+    DATABASE_PRIMARY_PIN_SECONDS = env.int("DATABASE_PRIMARY_PIN_SECONDS", default=10)
 
     DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -82,20 +124,23 @@ with env.prefixed("DJANGO_"):
     if env("AWS_ACCESS_KEY_ID", default=None):  # no cov
         THIRD_PARTY_APPS += ["storages"]
 
+    # Middleware that runs both ways keeps ASGI requests on the event loop. See
+    # play_different_games.core.middleware.
     MIDDLEWARE = [
-        "django.middleware.security.SecurityMiddleware",
-        "whitenoise.middleware.WhiteNoiseMiddleware",
-        "django.contrib.sessions.middleware.SessionMiddleware",
-        "django.middleware.locale.LocaleMiddleware",
-        "django.middleware.common.CommonMiddleware",
+        "play_different_games.core.middleware.SecurityMiddleware",
+        "play_different_games.core.middleware.AsyncWhiteNoiseMiddleware",
+        "play_different_games.core.middleware.ReplicaPinningMiddleware",
+        "play_different_games.core.middleware.SessionMiddleware",
+        "play_different_games.core.middleware.LocaleMiddleware",
+        "play_different_games.core.middleware.CommonMiddleware",
         "django_htmx.middleware.HtmxMiddleware",
-        "django.middleware.csrf.CsrfViewMiddleware",
+        "play_different_games.core.middleware.CsrfViewMiddleware",
         "django_browser_reload.middleware.BrowserReloadMiddleware",
-        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "play_different_games.core.middleware.AuthenticationMiddleware",
         "play_different_games.users.middleware.TimezoneMiddleware",
-        "django.contrib.messages.middleware.MessageMiddleware",
+        "play_different_games.core.middleware.MessageMiddleware",
         # "django.middleware.common.BrokenLinkEmailsMiddleware",
-        "django.middleware.clickjacking.XFrameOptionsMiddleware",
+        "play_different_games.core.middleware.XFrameOptionsMiddleware",
     ]
 
     if DEBUG and not TESTING:  # no cov
@@ -110,10 +155,37 @@ with env.prefixed("DJANGO_"):
         )
     }
     CACHES["default"]["KEY_PREFIX"] = "PDG_"
+    if "redis" in CACHES["default"]["BACKEND"].lower() and env.bool(
+        "CACHE_LOCAL_TIER", default=True
+    ):
+        # Hot keys are served from the worker's memory in front of Redis. See
+        # play_different_games.core.cache.
+        CACHES["shared"] = CACHES["default"]
+        CACHES["default"] = {
+            "BACKEND": "play_different_games.core.cache.TieredCache",
+            "LOCATION": "shared",
+            "OPTIONS": {
+                "MAX_ENTRIES": env.int("CACHE_LOCAL_MAX_ENTRIES", default=1000),
+                "LOCAL_TIMEOUT": env.float("CACHE_LOCAL_TIMEOUT", default=60.0),
+            },
+        }
+
+    # Keep data derived from each user (their profile in the cache, their time
+    # zone in the session) until they change, which needs a cache shared by every
+    # worker. See play_different_games.users.cache.
+    USER_PROFILE_CACHE = env.bool(
+        "USER_PROFILE_CACHE",
+        default=not CACHES["default"]["BACKEND"].endswith(".LocMemCache"),
+    )
 
     if not DEBUG:  # no cov
-        SESSION_ENGINE = "django.contrib.sessions.backends.cache"
-        SESSION_CACHE_ALIAS = "default"
+        SESSION_ENGINE = "play_different_games.core.sessions"
+        # Sessions skip the local tier, as the next request may go to another
+        # worker before the invalidation does.
+        SESSION_CACHE_ALIAS = "shared" if "shared" in CACHES else "default"
+        SESSION_SAVE_EVERY_REQUEST = True
+    # How often (in seconds) an unchanged session is written to slide its expiry.
+    SESSION_TOUCH_INTERVAL = env.int("SESSION_TOUCH_INTERVAL", default=300)
 
     # Storages
     STORAGES = {
@@ -220,16 +292,18 @@ with env.prefixed("DJANGO_"):
         )
 
 PASSWORD_HASHERS = [
-    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "play_different_games.users.hashers.BoundedArgon2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
     "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
     "django.contrib.auth.hashers.ScryptPasswordHasher",
 ]
+# Most passwords hashed at once per process, see play_different_games.users.hashers.
+PASSWORD_HASHING_WORKERS = env.int("DJANGO_PASSWORD_HASHING_WORKERS", default=2)
 
 AUTHENTICATION_BACKENDS = (
-    "rules.permissions.ObjectPermissionBackend",
-    "django.contrib.auth.backends.ModelBackend",
+    "play_different_games.core.permissions.MemoizedObjectPermissionBackend",
+    "play_different_games.users.backends.ProfileModelBackend",
 )
 
 INTERNAL_IPS = [
@@ -15,6 +15,8 @@ from django.utils.translation import gettext_lazy as _
 from django.views import defaults as default_views
 from django.views.generic import TemplateView
 
+from play_different_games.core.views import metrics_view, read_only_view
+
 # from play_different_games import views
 
 if settings.DEBUG:
@@ -29,7 +31,11 @@ def confirm_password_change(request):  # no cov
 
 
 urlpatterns = [
-    path("", view=TemplateView.as_view(template_name="home.html"), name="home"),
+    path(
+        "",
+        view=read_only_view(TemplateView.as_view(template_name="home.html")),
+        name="home",
+    ),
     path(
         "400/",
         default_views.bad_request,
@@ -51,6 +57,7 @@ urlpatterns = [
         kwargs={"exception": Exception("Server Error!")},
     ),
     path(settings.ADMIN_URL, admin.site.urls),
+    path("metrics/", metrics_view, name="metrics"),
     path("accounts/password_change/done/", confirm_password_change),
     path("accounts/", include("django.contrib.auth.urls")),
     path("users/", include("play_different_games.users.urls", namespace="users")),
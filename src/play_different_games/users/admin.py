@@ -9,6 +9,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import User
 
+from play_different_games.core.admin import LargeTableAdminMixin
 from play_different_games.users.models import UserProfile
 
 # Register your models here.
@@ -22,8 +23,10 @@ class UserProfileInlineAdmin(admin.StackedInline):
     verbose_name_plural = "profile"
 
 
-class UserAdmin(BaseUserAdmin):
+class UserAdmin(LargeTableAdminMixin, BaseUserAdmin):
     inlines = (UserProfileInlineAdmin,)
+    # Prefix matches, backed by the indexes from migrations users.0004 and 0005.
+    search_fields = ("^username", "^first_name", "^last_name", "^email")
     list_display = [
         "username",
         "email",
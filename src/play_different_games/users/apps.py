@@ -6,11 +6,21 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from django.apps import AppConfig
+from django.contrib.auth import get_user_model
+from django.core import checks
 from django.utils.translation import gettext_lazy as _
 
+from play_different_games.core.resolvers import get_slug_resolver
+from play_different_games.users.cache import check_profile_cache
+
 
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "play_different_games.users"
     verbose_name = _("Users")
     app_label = "users"
+
+    def ready(self):
+        # User detail views are routed by username, so keep that cache current.
+        get_slug_resolver(get_user_model(), "username")
+        checks.register(check_profile_cache, checks.Tags.caches)
@@ -0,0 +1,141 @@
+# backends.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Authentication backends."""
+
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+from play_different_games.users.cache import (
+    aget_profile_version,
+    get_profile_version,
+    profile_version_key,
+)
+from play_different_games.users.hashers import acheck_password, amake_password
+from play_different_games.users.models import UserProfile
+
+UserModel = get_user_model()
+
+# How long (in seconds) a loaded profile is cached. Changes made through `save()`
+# are picked up immediately; this bounds how long a `QuerySet.update()` goes unseen.
+PROFILE_CACHE_TIMEOUT = 60 * 15
+
+
+def profile_cache_key(user_id) -> str:
+    return f"users:profile:{user_id}"
+
+
+def cached_profile_fields(cached: dict[str, Any], user_id) -> dict[str, Any] | None:
+    """
+    The profile fields in `cached`, the result of a `get_many()` of the profile
+    and version keys, if they were stored for the current version.
+    """
+    version = cached.get(profile_version_key(user_id))
+    entry = cached.get(profile_cache_key(user_id))
+    if version is None or entry is None or entry[0] != version:
+        return None
+    return entry[1]
+
+
+def profile_fields(user) -> dict[str, Any] | None:
+    """The field values of the profile joined to `user`, if it has one."""
+    profile = getattr(user, "profile", None)
+    if profile is None:
+        return None
+    return {
+        field.attname: getattr(profile, field.attname)
+        for field in UserProfile._meta.concrete_fields
+    }
+
+
+class ProfileModelBackend(ModelBackend):
+    """
+    Same as Django's `ModelBackend`, except that the user loaded for each request
+    comes with their profile.
+
+    With `USER_PROFILE_CACHE` on, the profile's fields are cached with the version
+    from `play_different_games.users.cache`, which is bumped whenever the user or
+    their profile is saved, and are only used while the versions match. The user
+    row itself, with the password hash and `is_active`, is always read from the
+    database so that a password change or deactivation applies at once. Loading a
+    user therefore costs one query, without the join to the profile on a hit.
+
+    Async logins verify the password on the hashing pool, without blocking the
+    event loop.
+    """
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):  # noqa: ARG002
+        """See authenticate(). Django's `aauthenticate` hashes on the event loop."""
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            # What aget_by_natural_key() does, which the type stubs lack.
+            user = await UserModel._default_manager.aget(
+                **{UserModel.USERNAME_FIELD: username}
+            )
+        except UserModel.DoesNotExist:
+            # Hash once anyway, so that missing users take as long (#20760).
+            await amake_password(password)
+            return None
+
+        async def setter(raw_password):
+            user.password = await amake_password(raw_password)
+            await user.asave(update_fields=["password"])
+
+        if await acheck_password(password, user.password, setter):
+            return self._authenticated(user)
+        return None
+
+    def get_user(self, user_id):
+        if not settings.USER_PROFILE_CACHE:
+            return self._authenticated(self._user_queryset(user_id).first())
+        keys = [profile_cache_key(user_id), profile_version_key(user_id)]
+        fields = cached_profile_fields(cache.get_many(keys), user_id)
+        if fields is not None:
+            user = UserModel._default_manager.filter(pk=user_id).first()
+            return self._authenticated(self._attach_profile(user, fields))
+        version = get_profile_version(user_id)
+        user = self._user_queryset(user_id).first()
+        fields = profile_fields(user)
+        if version is not None and fields is not None:
+            cache.set(keys[0], (version, fields), PROFILE_CACHE_TIMEOUT)
+        return self._authenticated(user)
+
+    async def aget_user(self, user_id):
+        """See get_user(). Django's `ModelBackend.aget_user` skips the profile."""
+        if not settings.USER_PROFILE_CACHE:
+            return self._authenticated(await self._user_queryset(user_id).afirst())
+        keys = [profile_cache_key(user_id), profile_version_key(user_id)]
+        fields = cached_profile_fields(await cache.aget_many(keys), user_id)
+        if fields is not None:
+            user = await UserModel._default_manager.filter(pk=user_id).afirst()
+            return self._authenticated(self._attach_profile(user, fields))
+        version = await aget_profile_version(user_id)
+        user = await self._user_queryset(user_id).afirst()
+        fields = profile_fields(user)
+        if version is not None and fields is not None:
+            await cache.aset(keys[0], (version, fields), PROFILE_CACHE_TIMEOUT)
+        return self._authenticated(user)
+
+    def _user_queryset(self, user_id):
+        return UserModel._default_manager.select_related("profile").filter(pk=user_id)
+
+    def _attach_profile(self, user, fields: dict[str, Any]):
+        if user is not None:
+            user.profile = UserProfile.from_db(
+                user._state.db, list(fields), list(fields.values())
+            )
+        return user
+
+    def _authenticated(self, user):
+        return user if user is not None and self.user_can_authenticate(user) else None
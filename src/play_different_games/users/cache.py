@@ -0,0 +1,94 @@
+# cache.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Per-user version stamps for data that is copied into sessions or the cache.
+
+Anything derived from a user or their profile is stored together with the
+version it was derived from, and is refreshed once the version in the cache no
+longer matches. Bumping the version is a single cache write, however many
+sessions the user has.
+
+The versions are only kept when `USER_PROFILE_CACHE` is on, which needs a cache
+that every worker process shares: a version bumped in one worker's local memory
+would go unseen by the others, which would keep serving the old data.
+"""
+
+from typing import Any
+from uuid import uuid4
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+
+def profile_version_key(user_id: Any) -> str:
+    return f"users:profile-version:{user_id}"
+
+
+def _new_version() -> str:
+    return uuid4().hex
+
+
+def get_profile_version(user_id: Any) -> str | None:
+    """
+    The current version of the user's data. Compare it with the stored version to
+    tell whether anything derived from the user is stale.
+
+    A version that was never bumped or was evicted is replaced with a new one,
+    which matches nothing stored before.
+
+    Returns:
+        The version, or None when `USER_PROFILE_CACHE` is off (or the cache does
+        not keep it), in which case nothing derived from the user can be trusted.
+    """
+    if not settings.USER_PROFILE_CACHE:
+        return None
+    return cache.get_or_set(profile_version_key(user_id), _new_version, None)
+
+
+async def aget_profile_version(user_id: Any) -> str | None:
+    """See get_profile_version()."""
+    if not settings.USER_PROFILE_CACHE:
+        return None
+    return await cache.aget_or_set(profile_version_key(user_id), _new_version, None)
+
+
+def bump_profile_version(user_id: Any, using: str | None = None) -> None:
+    """
+    Mark everything derived from the user as stale, once the current transaction
+    commits so that a refresh cannot read the old data.
+
+    Args:
+        user_id (Any): Primary key of the user.
+        using (str | None): Database alias of the transaction.
+    """
+    transaction.on_commit(
+        lambda: cache.set(profile_version_key(user_id), _new_version(), None),
+        using=using,
+    )
+
+
+def check_profile_cache(app_configs, **kwargs) -> list[checks.CheckMessage]:  # noqa: ARG001
+    """
+    Reports `USER_PROFILE_CACHE` turned on with a default cache that lives in the
+    memory of each worker process.
+    """
+    if settings.USER_PROFILE_CACHE and isinstance(
+        caches[DEFAULT_CACHE_ALIAS], LocMemCache
+    ):
+        return [
+            checks.Error(
+                "USER_PROFILE_CACHE needs a cache shared by every worker, but the "
+                "default cache is local memory.",
+                hint="Set DJANGO_CACHE_URL to Redis, or turn USER_PROFILE_CACHE off.",
+                id="users.E001",
+            )
+        ]
+    return []
@@ -5,15 +5,85 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from collections.abc import Iterable
+from functools import cache
+
 from django import forms
 from django.contrib.auth.models import User
+from django.forms.utils import flatatt
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import SafeString, mark_safe
 from django.utils.translation import gettext_lazy as _
 
-from play_different_games.users.zones import TIMEZONES
+from play_different_games.users.zones import Zone, get_zone_catalog, timezone_choices
+
+
+def render_timezone_options(
+    zones: Iterable[Zone], selected: str | None = None
+) -> SafeString:
+    """Render `zones` as `<option>` elements, marking `selected` as chosen."""
+    return format_html_join(
+        "",
+        '<option value="{}"{}>{}</option>',
+        (
+            (
+                zone.key,
+                mark_safe(" selected") if zone.key == selected else "",
+                zone.label,
+            )
+            for zone in zones
+        ),
+    )
+
+
+@cache
+def _catalog_options() -> SafeString:
+    return render_timezone_options(get_zone_catalog().zones)
+
+
+def render_catalog_options(selected: str | None = None) -> SafeString:
+    """
+    Every zone in the catalog as `<option>` elements. The fragment is rendered
+    once per process, and the selection is marked by a string replacement.
+    """
+    options = _catalog_options()
+    if selected in get_zone_catalog().by_key:
+        option = format_html('<option value="{}"', selected)
+        options = mark_safe(options.replace(option, f"{option} selected", 1))  # noqa: S308
+    return options
+
+
+class TimezoneSelect(forms.Select):
+    """
+    A select for every zone in the catalog, which skips rendering an option
+    template per zone by using the pre-rendered `render_catalog_options`.
+    """
+
+    def render(self, name, value, attrs=None, renderer=None):  # noqa: ARG002
+        attrs = self.build_attrs(self.attrs, attrs)
+        return format_html(
+            '<select name="{}"{}>{}</select>',
+            name,
+            flatatt(attrs),
+            render_catalog_options(value),
+        )
+
+
+class TimezoneField(forms.ChoiceField):
+    """A choice of zone from the catalog, validated with a dict lookup."""
+
+    widget = TimezoneSelect
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("choices", timezone_choices)
+        super().__init__(**kwargs)
+
+    def valid_value(self, value):
+        return value in get_zone_catalog().by_key
 
 
 class UserChangeForm(forms.ModelForm):
-    timezone = forms.ChoiceField(choices=TIMEZONES)
+    timezone = TimezoneField()
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -0,0 +1,181 @@
+# hashers.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Password hashing helpers.
+
+Hashing a password with Argon2 keeps a core busy for tens of milliseconds, so a
+burst of logins can starve every other request in the process. The bounded
+hashers here run that work on a shared pool of `PASSWORD_HASHING_WORKERS`
+threads (Argon2 releases the GIL while hashing), so at most that many cores are
+spent on passwords and the other requests keep being served. Async code awaits
+the pool with `acheck_password` and `amake_password`, since Django's versions
+hash on the event loop. The pool's queue depth is reported through
+`play_different_games.core.metrics`.
+
+This module must not import any models, since its functions run in worker
+processes that never set up Django.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    BasePasswordHasher,
+    check_password,
+    make_password,
+)
+from django.utils.module_loading import import_string
+
+from play_different_games.core.metrics import metrics
+
+# Set in the pool's threads, where hashers run their work inline.
+_worker = threading.local()
+
+if TYPE_CHECKING:
+    _HasherBase = BasePasswordHasher
+else:
+    _HasherBase = object
+
+
+@cache
+def get_hashing_executor() -> ThreadPoolExecutor:
+    """The pool passwords are hashed on, sized by `PASSWORD_HASHING_WORKERS`."""
+    return ThreadPoolExecutor(
+        max_workers=settings.PASSWORD_HASHING_WORKERS,
+        thread_name_prefix="password-hashing",
+        initializer=setattr,
+        initargs=(_worker, "active", True),
+    )
+
+
+def submit_hashing(func: Callable[..., Any], *args: Any) -> Future:
+    """
+    Run `func(*args)` on the hashing pool, counting it in the
+    `password_hashing.queued` and `password_hashing.running` metrics.
+
+    Args:
+        func (Callable): The CPU-heavy work, e.g. a hasher's `verify`.
+        *args (Any): Its arguments.
+    Returns:
+        A future for the result.
+    """
+
+    def run():
+        metrics.increment("password_hashing.queued", -1)
+        metrics.increment("password_hashing.running")
+        try:
+            return func(*args)
+        finally:
+            metrics.increment("password_hashing.running", -1)
+            metrics.increment("password_hashing.completed")
+
+    metrics.increment("password_hashing.queued")
+    return get_hashing_executor().submit(run)
+
+
+def _verify(password: str, encoded: str) -> tuple[bool, bool]:
+    """Whether `password` is correct, and whether its hash should be upgraded."""
+    must_update = False
+
+    def setter(_password):
+        nonlocal must_update
+        must_update = True
+
+    return check_password(password, encoded, setter), must_update
+
+
+async def acheck_password(
+    password: str,
+    encoded: str,
+    setter: Callable[[str], Awaitable[None]] | None = None,
+) -> bool:
+    """
+    Django's `acheck_password`, verifying on the hashing pool. The event loop
+    keeps serving other requests while it waits, where Django's verifies on the
+    loop itself.
+
+    Args:
+        password (str): The raw password.
+        encoded (str): The encoded password to check it against.
+        setter (Callable): Awaited with the raw password when it is correct but
+            its hash should be upgraded.
+    Returns:
+        Whether the password is correct.
+    """
+    is_correct, must_update = await asyncio.wrap_future(
+        submit_hashing(_verify, password, encoded)
+    )
+    if setter is not None and is_correct and must_update:
+        await setter(password)
+    return is_correct
+
+
+async def amake_password(password: str) -> str:
+    """Django's `make_password`, hashing on the hashing pool without blocking."""
+    return await asyncio.wrap_future(submit_hashing(make_password, password))
+
+
+class BoundedHasherMixin(_HasherBase):
+    """
+    Runs a hasher's `encode` and `verify` on the hashing pool, blocking the
+    caller until it is done. Only the pool's threads spend CPU on hashing.
+
+    Called on the event loop, e.g. by Django's `acheck_password`, this blocks
+    the loop until the pool is done. Async code should use this module's
+    `acheck_password` instead.
+    """
+
+    def _bounded(self, method: Callable[..., Any], *args: Any) -> Any:
+        if getattr(_worker, "active", False):
+            return method(*args)
+        return submit_hashing(method, *args).result()
+
+    def encode(self, password, salt):
+        return self._bounded(super().encode, password, salt)
+
+    def verify(self, password, encoded):
+        return self._bounded(super().verify, password, encoded)
+
+
+class BoundedArgon2PasswordHasher(BoundedHasherMixin, Argon2PasswordHasher):
+    """`Argon2PasswordHasher` on the hashing pool. Reads and writes the same hashes."""
+
+
+def hasher_path(hasher: BasePasswordHasher) -> str:
+    """The dotted import path of `hasher`'s class, for sending to another process."""
+    cls = type(hasher)
+    if isinstance(hasher, BoundedHasherMixin):
+        # The process pool is the bound there, so hash inline in its workers.
+        cls = next(
+            base for base in cls.__mro__ if not issubclass(base, BoundedHasherMixin)
+        )
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def hash_passwords(path: str, passwords: Sequence[str]) -> list[str]:
+    """
+    Hash each of `passwords` with the hasher class at `path`.
+
+    Equivalent to calling `make_password` on each, except that the hasher is
+    given explicitly rather than looked up in settings, so it can be called in a
+    worker process.
+
+    Args:
+        path (str): Dotted import path of a `BasePasswordHasher` subclass.
+        passwords (Sequence[str]): The raw passwords.
+    Returns:
+        The encoded passwords, in the same order.
+    """
+    hasher = import_string(path)()
+    return [hasher.encode(password, hasher.salt()) for password in passwords]
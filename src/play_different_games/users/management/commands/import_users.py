@@ -0,0 +1,73 @@
+# import_users.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Management command for importing users in bulk from a CSV or JSON Lines file."""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from play_different_games.users.provisioning import (
+    IMPORT_CHUNK_SIZE,
+    IMPORT_FORMATS,
+    provision_users,
+    read_user_rows,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import users, and their profiles, from a CSV file with a header line or a "
+        "JSON Lines file. Existing usernames are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path, help="File to import.")
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="Format of the file. Default is guessed from its extension.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help="Rows to read, hash and insert at a time.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Processes for password hashing. Default one per CPU, 0 for none.",
+        )
+        parser.add_argument(
+            "--database", default=None, help="Database alias to import into."
+        )
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        path: Path = options["path"]
+        file_format = options["format"] or path.suffix.lstrip(".").lower()
+        if file_format not in IMPORT_FORMATS:
+            msg = f"Cannot tell the format of {path}, use --format."
+            raise CommandError(msg)
+        try:
+            with path.open(encoding="utf-8", newline="") as stream:
+                report = provision_users(
+                    read_user_rows(stream, file_format),
+                    chunk_size=options["chunk_size"],
+                    workers=options["workers"],
+                    using=options["database"],
+                )
+        except OSError as err:
+            raise CommandError(err) from err
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report.created} users from {report.rows} rows "
+                f"({report.skipped} skipped, {report.invalid} invalid) in "
+                f"{report.seconds:.2f}s, {report.rows_per_second:.0f} rows/sec."
+            )
+        )
@@ -6,23 +6,96 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import zoneinfo
+from functools import lru_cache
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.utils import timezone
 
+from play_different_games.users.cache import aget_profile_version, get_profile_version
+from play_different_games.users.models import UserProfile
+
+TIMEZONE_SESSION_KEY = "django_timezone"
+# The user and profile version the session's timezone was read for.
+TIMEZONE_VERSION_SESSION_KEY = "django_timezone_version"
+
+
+@lru_cache(maxsize=1024)
+def get_zone(tzname: str) -> zoneinfo.ZoneInfo | None:
+    """The `ZoneInfo` for `tzname`, or None if there is no such time zone."""
+    try:
+        return zoneinfo.ZoneInfo(tzname)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def activate_zone(tzname: str | None) -> None:
+    """Activate the time zone `tzname`, or the default one if it is not valid."""
+    zone = get_zone(tzname) if tzname else None
+    if zone is not None:
+        timezone.activate(zone)
+    else:
+        timezone.deactivate()
+
 
 class TimezoneMiddleware:
-    """Sets the user's timezone in the session and activates it."""
+    """
+    Sets the user's timezone in the session and activates it.
+
+    With `USER_PROFILE_CACHE` on, the timezone is copied from the profile into the
+    session, and only read again once the profile's version (see
+    `play_different_games.users.cache`) changes, so activating it costs no
+    queries. Otherwise it is read from the profile on every request.
+
+    Works both ways, so under ASGI it runs on the event loop without a thread
+    switch, using the async session, cache and user lookups.
+    """
+
+    sync_capable = True
+    async_capable = True
 
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tzname = request.session.get(TIMEZONE_SESSION_KEY)
         if request.user.is_authenticated:
-            tzname = request.user.profile.timezone
-        else:
-            tzname = request.session.get("django_timezone")
-        if tzname:
-            timezone.activate(zoneinfo.ZoneInfo(tzname))
-        else:
-            timezone.deactivate()
+            version = get_profile_version(request.user.pk)
+            stamp = [request.user.pk, version]
+            if (
+                version is None
+                or request.session.get(TIMEZONE_VERSION_SESSION_KEY) != stamp
+            ):
+                tzname = (
+                    UserProfile.objects.filter(user_id=request.user.pk)
+                    .values_list("timezone", flat=True)
+                    .first()
+                )
+                if version is not None:
+                    request.session[TIMEZONE_SESSION_KEY] = tzname
+                    request.session[TIMEZONE_VERSION_SESSION_KEY] = stamp
+        activate_zone(tzname)
         return self.get_response(request)
+
+    async def __acall__(self, request):
+        tzname = await request.session.aget(TIMEZONE_SESSION_KEY)
+        user = await request.auser()
+        if user.is_authenticated:
+            version = await aget_profile_version(user.pk)
+            stamp = [user.pk, version]
+            if version is None or (
+                await request.session.aget(TIMEZONE_VERSION_SESSION_KEY) != stamp
+            ):
+                tzname = (
+                    await UserProfile.objects.filter(user_id=user.pk)
+                    .values_list("timezone", flat=True)
+                    .afirst()
+                )
+                if version is not None:
+                    await request.session.aset(TIMEZONE_SESSION_KEY, tzname)
+                    await request.session.aset(TIMEZONE_VERSION_SESSION_KEY, stamp)
+        activate_zone(tzname)
+        return await self.get_response(request)
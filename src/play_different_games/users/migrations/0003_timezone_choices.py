@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:11
+
+import play_different_games.users.zones
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0002_auto_20241025_1151"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="userprofile",
+            name="timezone",
+            field=models.CharField(
+                choices=play_different_games.users.zones.timezone_choices,
+                default="UTC",
+                max_length=100,
+            ),
+        ),
+    ]
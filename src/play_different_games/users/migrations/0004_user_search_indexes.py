@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:40
+
+from django.db import migrations
+
+INDEXES = {
+    "users_auth_user_username_upper_like": "username",
+    "users_auth_user_email_upper_like": "email",
+}
+
+
+def create_indexes(apps, schema_editor):
+    """
+    Index the columns the user admin searches by prefix. `istartswith` compares
+    `UPPER(column::text)` with `LIKE`, which can only use an index on that same
+    expression with `text_pattern_ops`. PostgreSQL only.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, column in INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f'ON auth_user (UPPER("{column}"::text) text_pattern_ops)'
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    """Drop the user admin's search indexes."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0003_timezone_choices"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
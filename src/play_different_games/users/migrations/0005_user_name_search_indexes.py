@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:50
+
+from django.db import migrations
+
+INDEXES = {
+    "users_auth_user_first_name_upper_like": "first_name",
+    "users_auth_user_last_name_upper_like": "last_name",
+}
+
+
+def create_indexes(apps, schema_editor):
+    """
+    Index the name columns the user admin searches by prefix, the same way as
+    migration 0004. PostgreSQL only.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, column in INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f'ON auth_user (UPPER("{column}"::text) text_pattern_ops)'
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    """Drop the user admin's name search indexes."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("users", "0004_user_search_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -5,12 +5,16 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from collections.abc import Iterable
+from typing import cast
+
 from django.conf import settings
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from play_different_games.users.zones import TIMEZONES
+from play_different_games.users.cache import bump_profile_version
+from play_different_games.users.zones import timezone_choices
 
 # Create your models here.
 
@@ -24,7 +28,10 @@ class UserProfile(models.Model):
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="profile"
     )
     timezone = models.CharField(
-        max_length=100, default=settings.TIMEZONE, choices=TIMEZONES
+        max_length=100,
+        default=settings.TIMEZONE,
+        # Django takes a callable, which the type stubs of CharField do not allow.
+        choices=cast("Iterable[tuple[str, str]]", timezone_choices),
     )
 
     def __str__(self) -> str:  # no cov
@@ -35,3 +42,14 @@ class UserProfile(models.Model):
 def create_user_profile(sender, instance, created, **kwargs):  # noqa: ARG001
     if created:
         UserProfile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=UserProfile)
+def refresh_user_profile(sender, instance, using, **kwargs):  # noqa: ARG001
+    bump_profile_version(instance.user_id, using=using)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def refresh_user(sender, instance, using, **kwargs):  # noqa: ARG001
+    bump_profile_version(instance.pk, using=using)
@@ -0,0 +1,217 @@
+# provisioning.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Bulk creation of users, such as when importing members of another community site.
+
+Users and their profiles are inserted with `bulk_create` a chunk at a time, so the
+`post_save` receiver that creates one profile per user is never involved and each
+chunk costs a constant number of queries. Passwords are hashed in a pool of
+worker processes, since a deliberately slow hasher such as Argon2 would otherwise
+dominate the run time.
+"""
+
+import csv
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, TextIO
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, identify_hasher, make_password
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import router, transaction
+
+from play_different_games.users.hashers import hash_passwords, hasher_path
+from play_different_games.users.models import UserProfile
+from play_different_games.users.zones import get_zone_catalog
+
+logger = logging.getLogger("play_different_games")
+
+# How many rows are read, hashed and inserted at a time.
+IMPORT_CHUNK_SIZE = 1000
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+
+@dataclass
+class ImportReport:
+    """
+    The outcome of a bulk user import.
+
+    Attributes:
+        created (int): Users created.
+        skipped (int): Rows whose username already exists, or appeared earlier.
+        invalid (int): Rows without a valid username.
+        seconds (float): Wall clock duration of the import.
+    """
+
+    created: int = 0
+    skipped: int = 0
+    invalid: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return self.created + self.skipped + self.invalid
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def read_user_rows(stream: TextIO, format: str) -> Iterator[dict[str, Any]]:  # noqa: A002
+    """
+    Stream rows from a CSV file with a header line, or a JSON Lines file.
+
+    Recognised keys are `username` (required), `email`, `first_name`,
+    `last_name`, `timezone`, and either `password` (raw) or `password_hash`
+    (already encoded by a hasher Django supports). Other keys are ignored.
+
+    Args:
+        stream (TextIO): The opened file.
+        format (str): Either 'csv' or 'jsonl'.
+    Returns:
+        An iterator of dicts, one per row.
+    """
+    if format == "csv":
+        yield from csv.DictReader(stream)
+    elif format == "jsonl":
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        msg = f"Unsupported format '{format}', expected one of {IMPORT_FORMATS}."
+        raise ValueError(msg)
+
+
+def _chunked(rows: Iterable[Mapping[str, Any]], size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _encode_passwords(
+    raw_passwords: list[str], path: str, pool: Executor | None, workers: int
+) -> list[str]:
+    if pool is None or len(raw_passwords) < 2:  # noqa: PLR2004
+        return hash_passwords(path, raw_passwords)
+    step = -(-len(raw_passwords) // workers)
+    futures = [
+        pool.submit(hash_passwords, path, raw_passwords[start : start + step])
+        for start in range(0, len(raw_passwords), step)
+    ]
+    return [encoded for future in futures for encoded in future.result()]
+
+
+def _password_for(row: Mapping[str, Any]) -> str | None:
+    """The stored password for `row`, or None if the raw password needs hashing."""
+    if encoded := row.get("password_hash"):
+        try:
+            identify_hasher(encoded)
+        except ValueError:
+            return make_password(None)
+        return encoded
+    if row.get("password"):
+        return None
+    return make_password(None)
+
+
+def provision_users(
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    workers: int | None = None,
+    using: str | None = None,
+) -> ImportReport:
+    """
+    Create users, and their profiles, from `rows`.
+
+    Rows whose username is taken are skipped, so an interrupted import can be
+    rerun. Each chunk is created in its own transaction with one query to find
+    existing usernames and one insert each for users and profiles.
+
+    Args:
+        rows (Iterable[Mapping[str, Any]]): User data, see `read_user_rows`.
+        chunk_size (int): Rows per chunk.
+        workers (int | None): Processes for password hashing. Default is one per
+            CPU, 0 hashes in this process.
+        using (str | None): Database alias to create the users in.
+    Returns:
+        An `ImportReport`.
+    """
+    using = using or router.db_for_write(User)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    path = hasher_path(get_hasher())
+    username_field = User._meta.get_field("username")
+    catalog = get_zone_catalog()
+    report = ImportReport()
+    start = time.perf_counter()
+    pool_context = ProcessPoolExecutor(workers) if workers else nullcontext()
+    with pool_context as pool:
+        for chunk in _chunked(rows, chunk_size):
+            valid = {}
+            for row in chunk:
+                username = (row.get("username") or "").strip()
+                try:
+                    username_field.clean(username, None)
+                except ValidationError:
+                    report.invalid += 1
+                    continue
+                if username in valid:
+                    report.skipped += 1
+                    continue
+                valid[username] = row
+            existing = set(
+                User.objects.using(using)
+                .filter(username__in=valid)
+                .values_list("username", flat=True)
+            )
+            report.skipped += len(existing)
+            pending = [
+                (name, row) for name, row in valid.items() if name not in existing
+            ]
+            if not pending:
+                continue
+            passwords = [_password_for(row) for _, row in pending]
+            to_hash = [
+                row["password"]
+                for (_, row), password in zip(pending, passwords, strict=True)
+                if password is None
+            ]
+            hashed = iter(_encode_passwords(to_hash, path, pool, workers))
+            users = [
+                User(
+                    username=username,
+                    email=row.get("email") or "",
+                    first_name=row.get("first_name") or "",
+                    last_name=row.get("last_name") or "",
+                    password=password or next(hashed),
+                )
+                for (username, row), password in zip(pending, passwords, strict=True)
+            ]
+            profiles = []
+            with transaction.atomic(using=using):
+                User.objects.using(using).bulk_create(users)
+                for user, (_, row) in zip(users, pending, strict=True):
+                    timezone = row.get("timezone")
+                    if timezone not in catalog.by_key:
+                        timezone = settings.TIMEZONE
+                    profiles.append(UserProfile(user=user, timezone=timezone))
+                UserProfile.objects.using(using).bulk_create(profiles)
+            report.created += len(users)
+            logger.debug(f"Imported {report.created} of {report.rows} users so far.")
+    report.seconds = time.perf_counter() - start
+    return report
@@ -9,13 +9,20 @@ from typing import Any
 
 import rules
 from django.contrib.auth.models import User
+from django.db.models import Q
+from rules.predicates import Predicate
 
+from play_different_games.core.permissions import register_filter
 
-@rules.predicate  # type: ignore
-def is_self(user: User, obj: Any) -> bool:
+
+def _is_self(user: User, obj: Any) -> bool:
     return user == obj
 
 
+is_self = Predicate(_is_self, name="is_self")
+
+register_filter(is_self, lambda user: user.pk is not None and Q(pk=user.pk))
+
 can_edit_profile = is_self | rules.is_superuser  # type: ignore
 
 rules.add_perm("users.edit-user", can_edit_profile)  # type: ignore
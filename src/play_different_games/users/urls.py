@@ -12,6 +12,8 @@ from play_different_games.users import views
 app_name = "users"
 
 urlpatterns = [
+    # Two segments, so it cannot collide with a username.
+    path("zones/search/", view=views.timezone_search, name="timezone-search"),
     path("<slug:username>/", view=views.UserDetailView.as_view(), name="user-detail"),
     path(
         "<slug:username>/edit/", view=views.UserUpdateView.as_view(), name="user-edit"
@@ -8,48 +8,69 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
-from django.http import HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseRedirect
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_GET
 from django.views.generic import DetailView
 from django.views.generic.edit import UpdateView
 from rules.contrib.views import PermissionRequiredMixin
 
-from play_different_games.users.forms import UserChangeForm
+from play_different_games.core.views import (
+    CachedSlugLookupMixin,
+    MemoizedObjectMixin,
+    ReadOnlyViewMixin,
+    read_only_view,
+)
+from play_different_games.users.forms import (
+    UserChangeForm,
+    render_catalog_options,
+    render_timezone_options,
+)
+from play_different_games.users.zones import get_zone_catalog
 
 # Create your views here.
 
 
-class UserDetailView(LoginRequiredMixin, PermissionRequiredMixin, DetailView):
+class UserProfileMixin(
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+    MemoizedObjectMixin,
+    CachedSlugLookupMixin,
+):
     """
-    Where a user can view their details.
+    Common setup for the views of a user's profile. The user is fetched once per
+    request, with their profile, and shared with the permission check.
     """
 
     model = User
     slug_url_kwarg = "username"
     slug_field = "username"
     context_object_name = "user"
-    template_name = "registration/profile_detail.html"
     permission_required = "users.edit-user"
 
+    def get_queryset(self):
+        return super().get_queryset().select_related("profile")  # type: ignore
+
+
+class UserDetailView(ReadOnlyViewMixin, UserProfileMixin, DetailView):
+    """
+    Where a user can view their details.
+    """
+
+    template_name = "registration/profile_detail.html"
+
 
-class UserUpdateView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
+class UserUpdateView(UserProfileMixin, UpdateView):
     """
     Where a user can edit their details.
     """
 
-    model = User
-    slug_url_kwarg = "username"
-    slug_field = "username"
-    context_object_name = "user"
     template_name = "registration/profile_update.html"
     form_class = UserChangeForm
-    permission_required = "users.edit-user"
     object: User
 
-    def get_permission_object(self):
-        return self.get_object(self.queryset)
-
     def get_initial(self):
         initial = super().get_initial()
         initial["timezone"] = self.object.profile.timezone  # type: ignore
@@ -62,11 +83,38 @@ class UserUpdateView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView):
         return super().form_invalid(form)
 
     def form_valid(self, form):
+        """
+        Write only what changed: an update of the changed user columns, and of
+        the profile's timezone, each skipped when there is nothing to write.
+        """
         user = form.save(commit=False)
-        user.profile.timezone = form.cleaned_data["timezone"]
-        user.profile.save()
-        user.save()
+        model_fields = UserChangeForm.Meta.fields
+        if user_fields := [f for f in form.changed_data if f in model_fields]:
+            user.save(update_fields=user_fields)
+        if "timezone" in form.changed_data:
+            user.profile.timezone = form.cleaned_data["timezone"]  # type: ignore
+            user.profile.save(update_fields=["timezone"])  # type: ignore
         messages.success(self.request, _("Your profile has been updated!"))
         return HttpResponseRedirect(
             reverse("users:user-detail", kwargs={"username": user.username})
         )
+
+
+@read_only_view
+@require_GET
+@cache_control(max_age=60 * 60)
+def timezone_search(request):
+    """
+    Typeahead for the time zone picker. Returns the `<option>` elements for the
+    zones matching `q`, or every zone when `q` is empty, keeping the zone given
+    as `timezone` selected.
+    """
+    query = request.GET.get("q", "").strip()
+    selected = request.GET.get("timezone")
+    if not query:
+        return HttpResponse(render_catalog_options(selected))
+    catalog = get_zone_catalog()
+    zones = catalog.search(query)
+    if selected in catalog.by_key and catalog.by_key[selected] not in zones:
+        zones.insert(0, catalog.by_key[selected])
+    return HttpResponse(render_timezone_options(zones, selected))
@@ -0,0 +1,46 @@
+# conftest.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Fixtures for the core test suite."""
+
+import pytest
+from django.db import connection, connections
+
+from tests.core.models import SluggedGame
+
+
+@pytest.fixture
+def core_test_tables(transactional_db):
+    """Create the tables for the test-only core models, and drop them afterwards."""
+    models = [SluggedGame]
+    existing = connection.introspection.table_names()
+    with connection.schema_editor() as editor:
+        for model in models:
+            if model._meta.db_table not in existing:
+                editor.create_model(model)
+    yield
+    with connection.schema_editor() as editor:
+        for model in models:
+            editor.delete_model(model)
+
+
+@pytest.fixture
+def replica(settings, transactional_db):
+    """
+    A replica of the default database, routed to by `ReplicaRouter`. It is a
+    second connection to the test database, so it has no lag of its own.
+    """
+    alias = "replica"
+    # Not in DATABASES, so the test case lets it connect.
+    connections[alias] = type(connections["default"])(
+        {**connection.settings_dict}, alias=alias
+    )
+    settings.DATABASE_REPLICAS = [alias]
+    settings.DATABASE_ROUTERS = ["play_different_games.core.routers.ReplicaRouter"]
+    yield alias
+    connections[alias].close()
+    del connections[alias]
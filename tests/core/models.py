@@ -0,0 +1,25 @@
+# models.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Concrete models used to exercise the abstract core models in tests."""
+
+from django.db import models
+
+from play_different_games.core.models import SluggedUUIDTimestampedModel
+
+
+class SluggedGame(SluggedUUIDTimestampedModel):
+    title = models.CharField(max_length=250)
+
+    class Meta(SluggedUUIDTimestampedModel.Meta):
+        app_label = "core"
+
+    class SlugMeta:
+        slug_based_on_fields = ["title"]
+
+    def __str__(self) -> str:  # no cov
+        return self.title
@@ -0,0 +1,112 @@
+# test_admin.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from play_different_games.core import admin as core_admin
+from play_different_games.core.admin import (
+    EstimatedCountPaginator,
+    LargeTableAdminMixin,
+    related_path,
+)
+from play_different_games.users.models import UserProfile
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+class GroupAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    search_fields = ("name", "^name")
+
+
+class ProfileAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    pass
+
+
+class RawIdProfileAdmin(ProfileAdmin):
+    raw_id_fields = ("user",)
+
+
+@pytest.mark.parametrize(
+    ("lookup", "expected"),
+    [
+        ("profile__timezone", "profile"),
+        ("profile", "profile"),
+        ("username", None),
+        ("groups__name", None),
+    ],
+)
+def test_related_path(lookup, expected):
+    assert related_path(User, lookup) == expected
+
+
+def test_changelist_joins_profiles(admin_client, tp):
+    url = tp.reverse("admin:auth_user_changelist")
+    admin_client.get(url)
+    with CaptureQueriesContext(connection) as few:
+        admin_client.get(url)
+    for i in range(10):
+        tp.make_user(f"member{i}")
+    with CaptureQueriesContext(connection) as many:
+        response = admin_client.get(url)
+    assert response.status_code == 200
+    assert b"member9" in response.content
+    assert len(many) == len(few)
+
+
+def test_prefix_search(admin_client, tp):
+    tp.make_user("alice")
+    tp.make_user("malice")
+    response = admin_client.get(tp.reverse("admin:auth_user_changelist"), {"q": "AL"})
+    users = list(response.context["cl"].result_list)
+    assert [user.username for user in users] == ["alice"]
+    User.objects.filter(username="malice").update(last_name="Alder")
+    response = admin_client.get(tp.reverse("admin:auth_user_changelist"), {"q": "ald"})
+    users = list(response.context["cl"].result_list)
+    assert [user.username for user in users] == ["malice"]
+
+
+@pytest.mark.parametrize(("estimate", "expected"), [(50_000, 50_000), (5, 1)])
+def test_estimated_count(monkeypatch, admin_user, estimate, expected):
+    monkeypatch.setattr(core_admin, "estimate_count", lambda _queryset: estimate)
+    paginator = EstimatedCountPaginator(User.objects.order_by("pk"), 100)
+    assert paginator.count == expected
+
+
+def test_filtered_rows_are_counted(monkeypatch, admin_user):
+    monkeypatch.setattr(core_admin, "estimate_count", lambda _queryset: 50_000)
+    paginator = EstimatedCountPaginator(User.objects.filter(is_staff=True), 100)
+    assert paginator.count == 1
+
+
+def test_estimate_count():
+    estimate = core_admin.estimate_count(User.objects.all())
+    if connection.vendor == "postgresql":
+        assert isinstance(estimate, int)
+    else:
+        assert estimate is None
+    assert core_admin.estimate_count(User.objects.filter(pk__in=[])) in {0, None}
+
+
+def test_autocomplete_for_searchable_foreign_keys(rf):
+    request = rf.get("/")
+    profile_admin = ProfileAdmin(UserProfile, admin.site)
+    assert profile_admin.get_autocomplete_fields(request) == ["user"]
+    raw_id_admin = RawIdProfileAdmin(UserProfile, admin.site)
+    assert not raw_id_admin.get_autocomplete_fields(request)
+    # Many-to-many relations keep the widget they were given.
+    assert not admin.site._registry[User].get_autocomplete_fields(request)
+
+
+def test_unindexed_search_fields_warn():
+    assert not admin.site._registry[User].check()
+    warnings = GroupAdmin(Group, admin.site).check()
+    assert [warning.id for warning in warnings] == ["core.W001"]
+    assert "'name'" in warnings[0].msg
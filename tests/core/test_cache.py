@@ -0,0 +1,288 @@
+# test_cache.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from redis import Redis
+
+from play_different_games.core import cache as cache_module
+from play_different_games.core.cache import (
+    LocalTier,
+    TieredCache,
+    get_or_compute,
+    redis_client,
+)
+from play_different_games.core.metrics import metrics
+
+PARAMS = {"OPTIONS": {"MAX_ENTRIES": 3, "LOCAL_TIMEOUT": 60}}
+WORKERS = 16
+
+
+@pytest.fixture
+def tiered(settings):
+    settings.CACHES = {
+        **settings.CACHES,
+        "shared": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "tiered-tests",
+        },
+        "tiered": {
+            "BACKEND": "play_different_games.core.cache.TieredCache",
+            "LOCATION": "shared",
+            **PARAMS,
+        },
+    }
+    cache = caches["tiered"]
+    cache.clear()
+    metrics.reset()
+    return cache
+
+
+@pytest.fixture
+def other_worker(tiered):
+    """The same cache in another worker, with a local tier of its own."""
+    worker = TieredCache("shared", PARAMS)
+    worker.tier = LocalTier(tiered.channel, max_entries=3, timeout=60)
+    yield worker
+    cache_module._subscribers[tiered.channel].discard(worker.tier)
+
+
+def test_hot_keys_are_served_locally(tiered):
+    tiered.set("fragment", "<nav></nav>")
+    # Gone from the shared cache, but still in this worker's memory.
+    caches["shared"].delete("fragment")
+    assert tiered.get("fragment") == "<nav></nav>"
+    assert metrics.get("tiered_cache.local.hits") == 1
+    tiered.delete("fragment")
+    assert tiered.get("fragment") is None
+    assert metrics.get("tiered_cache.remote.misses") == 1
+
+
+def test_misses_fill_the_local_tier(tiered):
+    caches["shared"].set("pk", 42)
+    assert tiered.get("pk") == 42
+    assert tiered.get("pk") == 42
+    assert metrics.snapshot() == {
+        "tiered_cache.local.hits": 1,
+        "tiered_cache.local.misses": 1,
+        "tiered_cache.remote.hits": 1,
+    }
+
+
+def test_get_many(tiered):
+    tiered.set("a", 1)
+    caches["shared"].set("b", 2)
+    assert tiered.get_many(iter(["a", "b", "c"])) == {"a": 1, "b": 2}
+    assert metrics.get("tiered_cache.local.hits") == 1
+    assert metrics.get("tiered_cache.remote.hits") == 1
+    assert metrics.get("tiered_cache.remote.misses") == 1
+    assert tiered.get_many(["a", "b"]) == {"a": 1, "b": 2}
+    assert metrics.get("tiered_cache.local.hits") == 3
+
+
+def test_writes_invalidate_other_workers(other_worker, tiered):
+    tiered.set("slug", 1)
+    assert other_worker.get("slug") == 1
+    tiered.set("slug", 2)
+    assert other_worker.get("slug") == 2
+    assert tiered.incr("slug") == 3
+    assert other_worker.get("slug") == 3
+    other_worker.delete("slug")
+    assert tiered.get("slug") is None
+    assert metrics.get("tiered_cache.invalidations.received") == 4
+
+
+def test_keys_expire_from_other_workers(other_worker, tiered):
+    tiered.set("short", "v", 1)
+    other_worker.set("long", "v", None)
+    assert other_worker.get("short") == "v"
+    assert tiered.get("long") == "v"
+    assert other_worker.tier.get(other_worker.make_key("short")) == "v"
+    time.sleep(1.1)
+    # Expired in the shared cache, which broadcasts nothing when it does.
+    assert caches["shared"].get("short") is None
+    assert other_worker.get("short") is None
+    assert tiered.get("short") is None
+    assert tiered.get("long") == "v"
+
+
+def test_keys_of_unknown_expiry_are_not_kept(settings, tiered, tmp_path):
+    settings.CACHES = {
+        **settings.CACHES,
+        "shared": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path),
+        },
+    }
+    caches["shared"].set("pk", 42)
+    tiered = caches["tiered"]
+    assert tiered.get("pk") == 42
+    assert tiered.get_many(["pk"]) == {"pk": 42}
+    assert len(tiered.tier) == 0
+
+
+def test_clear_invalidates_other_workers(other_worker, tiered):
+    tiered.set("slug", 1)
+    other_worker.get("slug")
+    tiered.clear()
+    assert len(other_worker.tier) == 0
+
+
+def test_mutable_values_are_copied(tiered):
+    tiered.set("user", {"name": "Ann"})
+    tiered.get("user")["name"] = "Bob"
+    assert tiered.get("user") == {"name": "Ann"}
+
+
+def test_local_tier_is_bounded():
+    tier = LocalTier("bounded", max_entries=2, timeout=60)
+    tier.set("a", 1, None)
+    tier.set("b", 2, None)
+    tier.get("a")
+    tier.set("c", 3, None)
+    assert [tier.get(key) for key in "abc"] == [1, tier.get("missing"), 3]
+    tier.set("d", 4, 0.01)
+    time.sleep(0.02)
+    assert tier.get("d") is tier.get("missing")
+
+
+def test_stale_reads_are_not_kept():
+    tier = LocalTier("stale", max_entries=2, timeout=60)
+    generation = tier.generation
+    # Another worker wrote while the shared cache was being read.
+    tier.invalidate(["a"])
+    tier.set("a", "old", None, generation)
+    assert len(tier) == 0
+
+
+def test_locmem_has_no_redis_client(tiered):
+    assert redis_client(caches["shared"]) is None
+    assert redis_client(tiered) is None
+
+
+def test_redis_client():
+    # Creating the client does not connect.
+    cache = RedisCache("redis://localhost:6379/0", {})
+    assert isinstance(redis_client(cache), Redis)
+
+
+@pytest.fixture
+def computations(settings):
+    settings.CACHES = {
+        **settings.CACHES,
+        "computations": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "computations",
+        },
+    }
+    caches["computations"].clear()
+    metrics.reset()
+    return caches["computations"]
+
+
+class SlowComputation:
+    """Counts its calls, and takes long enough for every worker to ask."""
+
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+        time.sleep(0.2)
+        return "fresh"
+
+
+def compute_concurrently(computation) -> list:
+    barrier = threading.Barrier(WORKERS)
+
+    def worker(_):
+        barrier.wait()
+        return get_or_compute("landing", computation, 60, beta=0, using="computations")
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        return list(executor.map(worker, range(WORKERS)))
+
+
+def test_expired_value_is_recomputed_once(computations):
+    # Expired a second ago, but still kept to be served while recomputed.
+    computations.set("landing", ("stale", 0.2, time.time() - 1), 60)
+    computation = SlowComputation()
+    results = compute_concurrently(computation)
+    assert computation.calls == 1
+    assert sorted(results) == ["fresh"] + ["stale"] * (WORKERS - 1)
+    assert metrics.get("cached_computations.stale") == WORKERS - 1
+    assert get_or_compute("landing", computation, 60, using="computations") == "fresh"
+    assert computation.calls == 1
+
+
+def test_missing_value_is_computed_once(computations):
+    computation = SlowComputation()
+    assert compute_concurrently(computation) == ["fresh"] * WORKERS
+    assert computation.calls == 1
+    assert metrics.get("cached_computations.waited") == WORKERS - 1
+
+
+def test_values_are_recomputed_early_at_random(computations, monkeypatch):
+    # Expires in 10 seconds, and took 1 second to compute.
+    computations.set("landing", ("cached", 1.0, time.time() + 10), 60)
+    monkeypatch.setattr("random.random", lambda: 0.0)
+    assert get_or_compute("landing", str, 60, using="computations") == "cached"
+    # -log(1 - u) is about 21 for this u, later than the expiry.
+    monkeypatch.setattr("random.random", lambda: 1 - 1e-9)
+    assert get_or_compute("landing", str, 60, using="computations") == ""
+
+
+def test_failed_computation_releases_the_lock(computations):
+    def fail():
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        get_or_compute("landing", fail, 60, using="computations")
+    assert get_or_compute("landing", lambda: "ok", 60, using="computations") == "ok"
+    assert not computations.has_key("landing:computing")
+
+
+def test_lock_taken_by_another_worker_is_kept(computations):
+    def compute():
+        # The lock expired while computing, and another worker took it.
+        computations.set("landing:computing", 1234, 60)
+        return "fresh"
+
+    assert get_or_compute("landing", compute, 60, using="computations") == "fresh"
+    assert computations.get("landing:computing") == 1234
+
+
+def test_lock_is_released_on_redis(computations, monkeypatch):
+    calls = []
+
+    class Client:
+        def eval(self, script, numkeys, *args):
+            calls.append((script, numkeys, *args))
+
+    monkeypatch.setattr(cache_module, "redis_client", lambda _cache: Client())
+    assert get_or_compute("landing", str, 60, using="computations") == ""
+    ((script, numkeys, key, token),) = calls
+    assert script == cache_module.RELEASE_LOCK_SCRIPT
+    assert (numkeys, key) == (1, computations.make_key("landing:computing"))
+    assert computations.get("landing:computing") == token
+
+
+def test_lock_is_kept_in_the_shared_cache(tiered):
+    def compute():
+        assert caches["shared"].has_key("landing:computing")
+        assert len(tiered.tier) == 0
+        return "fresh"
+
+    assert get_or_compute("landing", compute, 60, using="tiered") == "fresh"
+    assert not caches["shared"].has_key("landing:computing")
@@ -0,0 +1,100 @@
+# test_changes.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.db.models.deletion import Collector
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from play_different_games.core.changes import Watermark, iter_changes
+from play_different_games.core.models import SlugHistory, Tombstone
+from tests.core.models import SluggedGame
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures("core_test_tables"),
+]
+
+
+def read_feed(since=None, **kwargs):
+    kwargs.setdefault("settle_time", timedelta(0))
+    return list(iter_changes(SluggedGame, since, **kwargs))
+
+
+def test_changes_are_streamed_in_bounded_chunks():
+    games = SluggedGame.objects.bulk_create(
+        [SluggedGame(title=f"Game {i}") for i in range(5)]
+    )
+    table = SluggedGame._meta.db_table
+    with CaptureQueriesContext(connection) as context:
+        batches = read_feed(chunk_size=2)
+    feed_queries = [
+        q for q in context.captured_queries if f'FROM "{table}"' in q["sql"]
+    ]
+    assert [len(batch.changed) for batch in batches] == [2, 2, 1]
+    assert len(feed_queries) == 3
+    assert {game.pk for batch in batches for game in batch.changed} == {
+        game.pk for game in games
+    }
+    streamed = [(game.modified_at, game.pk) for b in batches for game in b.changed]
+    assert streamed == sorted(streamed)
+
+
+def test_resume_from_watermark():
+    first, second, third = (
+        SluggedGame.objects.create(title=title)
+        for title in ("Ironsworn", "Mausritter", "Troika")
+    )
+    token = read_feed()[-1].watermark.to_token()
+    assert read_feed(Watermark.from_token(token)) == []
+
+    SluggedGame.objects.filter(pk=first.pk).update(title="Ironsworn: Starforged")
+    second_pk = second.pk
+    second.delete()
+    batches = read_feed(Watermark.from_token(token))
+
+    assert [game.title for b in batches for game in b.changed] == [
+        "Ironsworn: Starforged"
+    ]
+    assert [t.object_id for b in batches for t in b.deleted] == [str(second_pk)]
+    assert read_feed(batches[-1].watermark) == []
+    assert third.pk not in {game.pk for b in batches for game in b.changed}
+
+
+def test_recent_changes_are_left_to_settle():
+    SluggedGame.objects.create(title="Blades in the Dark")
+    assert read_feed(settle_time=timedelta(minutes=5)) == []
+    assert len(read_feed()[0].changed) == 1
+
+
+def test_watermark_since_timestamp():
+    SluggedGame.objects.create(title="Old")
+    cutoff = timezone.now()
+    SluggedGame.objects.create(title="New")
+    batches = read_feed(Watermark.since(cutoff))
+    assert [game.title for b in batches for game in b.changed] == ["New"]
+
+
+def test_non_timestamped_models_are_rejected():
+    with pytest.raises(TypeError):
+        list(iter_changes(SlugHistory))
+
+
+def test_tombstones_are_pruned():
+    game = SluggedGame.objects.create(title="Dread")
+    game.delete()
+    Tombstone.objects.update(deleted_at=timezone.now() - timedelta(days=31))
+    assert Tombstone.objects.prune() == 1
+    assert not Tombstone.objects.exists()
+
+
+def test_unrelated_models_can_still_be_fast_deleted():
+    assert Collector(using="default").can_fast_delete(SlugHistory.objects.all())
+    assert not Collector(using="default").can_fast_delete(SluggedGame.objects.all())
@@ -0,0 +1,114 @@
+# test_concurrency.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Multi-process stress tests for slug allocation."""
+
+import multiprocessing
+import traceback
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, connections, transaction
+from django.test.utils import CaptureQueriesContext
+
+from play_different_games.core.utils import SLUG_LOCK_BUCKETS
+from tests.core.models import SluggedGame
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures("core_test_tables"),
+    pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="Slug reservation relies on PostgreSQL advisory locks.",
+    ),
+]
+
+WORKERS = 8
+SAVES_PER_WORKER = 10
+# More than the lock table holds with the default max_locks_per_transaction.
+DISTINCT_TITLES = 20_000
+# SAVEPOINT, lock, collision lookup, INSERT, RELEASE SAVEPOINT, slug history INSERT.
+QUERIES_PER_SAVE = 6
+
+
+def create_games(barrier, results, title, use_bulk):
+    """Worker body: wait for every process, then create games as fast as possible."""
+    try:
+        barrier.wait()
+        query_counts = []
+        if use_bulk:
+            with transaction.atomic():
+                SluggedGame.objects.bulk_create(
+                    [SluggedGame(title=title) for _ in range(SAVES_PER_WORKER)]
+                )
+        else:
+            for _ in range(SAVES_PER_WORKER):
+                # Mirror ATOMIC_REQUESTS, where the save runs in an outer transaction.
+                with transaction.atomic():
+                    with CaptureQueriesContext(connection) as context:
+                        SluggedGame.objects.create(title=title)
+                    query_counts.append(len(context.captured_queries))
+        results.put(("ok", query_counts))
+    except Exception:
+        results.put(("error", traceback.format_exc()))
+    finally:
+        connections.close_all()
+
+
+def run_workers(title, *, use_bulk=False):
+    context = multiprocessing.get_context("fork")
+    barrier = context.Barrier(WORKERS)
+    results = context.Queue()
+    # Warm the content type cache so the children inherit it.
+    ContentType.objects.get_for_model(SluggedGame)
+    # Children must open their own connections rather than share the parent's.
+    connections.close_all()
+    processes = [
+        context.Process(target=create_games, args=(barrier, results, title, use_bulk))
+        for _ in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+    outcomes = [results.get(timeout=60) for _ in processes]
+    for process in processes:
+        process.join(timeout=60)
+    return outcomes
+
+
+def test_concurrent_saves_never_collide():
+    outcomes = run_workers("Blades in the Dark")
+    errors = [detail for status, detail in outcomes if status == "error"]
+    assert not errors, errors[0]
+    slugs = list(SluggedGame.objects.values_list("slug", flat=True))
+    assert len(slugs) == WORKERS * SAVES_PER_WORKER
+    assert len(set(slugs)) == len(slugs)
+    # No save needed a retry round trip.
+    for _, query_counts in outcomes:
+        assert query_counts == [QUERIES_PER_SAVE] * SAVES_PER_WORKER
+
+
+def test_concurrent_bulk_creates_never_collide():
+    outcomes = run_workers("Lancer", use_bulk=True)
+    errors = [detail for status, detail in outcomes if status == "error"]
+    assert not errors, errors[0]
+    slugs = list(SluggedGame.objects.values_list("slug", flat=True))
+    assert len(slugs) == WORKERS * SAVES_PER_WORKER
+    assert len(set(slugs)) == len(slugs)
+
+
+def test_bulk_create_takes_a_bounded_number_of_locks():
+    games = [SluggedGame(title=f"Game {number}") for number in range(DISTINCT_TITLES)]
+    with transaction.atomic():
+        SluggedGame.objects.bulk_create(games)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_locks "
+                "WHERE locktype = 'advisory' AND pid = pg_backend_pid()"
+            )
+            (locks,) = cursor.fetchone()
+    assert locks <= SLUG_LOCK_BUCKETS
+    assert SluggedGame.objects.count() == DISTINCT_TITLES
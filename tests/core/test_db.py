@@ -0,0 +1,55 @@
+# test_db.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+from django.db import connection, connections
+
+from play_different_games.core import views
+from play_different_games.core.db import connection_pool_stats, pool_stats
+from play_different_games.core.metrics import metrics
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.urls("tests.core.urls"),
+]
+
+
+def test_unpooled_connections_have_no_stats():
+    assert connection_pool_stats(connection) == {}
+    assert pool_stats() == {}
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Pools are PostgreSQL only."
+)
+def test_pool_stats():
+    settings_dict = {
+        **connection.settings_dict,
+        "CONN_MAX_AGE": 0,
+        "OPTIONS": {
+            **connection.settings_dict["OPTIONS"],
+            "pool": {"min_size": 1, "max_size": 2},
+        },
+    }
+    pooled = type(connections["default"])(settings_dict, alias="pooled")
+    try:
+        pooled.pool.open(wait=True)
+        pooled.ensure_connection()
+        stats = connection_pool_stats(pooled)
+        assert stats["in_use"] == 1
+        assert stats["waiting"] == 0
+        assert stats["errors"] == 0
+        pooled.close()
+        assert connection_pool_stats(pooled)["in_use"] == 0
+    finally:
+        pooled.close_pool()
+
+
+def test_metrics_view_reports_pools(admin_client, monkeypatch):
+    metrics.reset()
+    monkeypatch.setattr(views, "pool_stats", lambda: {"db_pool.default.in_use": 3})
+    assert admin_client.get("/metrics/").json() == {"db_pool.default.in_use": 3}
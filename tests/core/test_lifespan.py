@@ -0,0 +1,101 @@
+# test_lifespan.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+
+from django.template import engines
+
+from play_different_games.core.lifespan import LifespanMiddleware, warm_up
+
+
+async def app(scope, receive, send):
+    await asyncio.sleep(0.1)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def run_lifespan(middleware, during_startup=None):
+    """Start and shut `middleware` down, returning the messages it sent."""
+    sent = []
+    messages = asyncio.Queue()
+
+    async def receive():
+        return await messages.get()
+
+    async def send(message):
+        sent.append(message["type"])
+
+    async def main():
+        lifespan = asyncio.create_task(middleware({"type": "lifespan"}, receive, send))
+        await messages.put({"type": "lifespan.startup"})
+        await asyncio.sleep(0.01)
+        if during_startup:
+            await during_startup(send)
+        await messages.put({"type": "lifespan.shutdown"})
+        await lifespan
+
+    asyncio.run(main())
+    return sent
+
+
+def test_startup_and_shutdown():
+    calls = []
+    middleware = LifespanMiddleware(app, warm_up=lambda: calls.append("warm"))
+    sent = run_lifespan(middleware)
+    assert calls == ["warm"]
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+
+def test_failed_warm_up():
+    def fail():
+        raise RuntimeError
+
+    sent = run_lifespan(LifespanMiddleware(app, warm_up=fail))
+    assert sent == ["lifespan.startup.failed"]
+
+
+def test_shutdown_drains_requests():
+    middleware = LifespanMiddleware(app, warm_up=lambda: None)
+
+    async def start_request(send):
+        asyncio.create_task(middleware({"type": "http"}, None, send))  # noqa: RUF006
+        await asyncio.sleep(0)
+
+    sent = run_lifespan(middleware, during_startup=start_request)
+    assert sent == [
+        "lifespan.startup.complete",
+        "http.response.start",
+        "http.response.body",
+        "lifespan.shutdown.complete",
+    ]
+
+
+def test_warm_up_compiles_templates(settings):
+    (template_settings,) = settings.TEMPLATES
+    settings.TEMPLATES = [
+        {
+            **template_settings,
+            "OPTIONS": {
+                **template_settings["OPTIONS"],
+                "loaders": [
+                    (
+                        "django.template.loaders.cached.Loader",
+                        ["django.template.loaders.filesystem.Loader"],
+                    )
+                ],
+            },
+        }
+    ]
+    warm_up()
+    (loader,) = engines["django"].engine.template_loaders
+    assert "home.html" in loader.get_template_cache
+
+
+def test_asgi_application():
+    from play_different_games import asgi  # noqa: PLC0415
+
+    assert isinstance(asgi.application, LifespanMiddleware)
@@ -0,0 +1,143 @@
+# test_middleware.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+
+import pytest
+from asgiref.sync import SyncToAsync, iscoroutinefunction
+from django.db.backends.utils import CursorWrapper
+from django.http import HttpResponse
+from django.test import AsyncClient
+
+from play_different_games.core.middleware import (
+    AsyncWhiteNoiseMiddleware,
+    CsrfViewMiddleware,
+)
+
+STACK = [
+    "play_different_games.core.middleware.SecurityMiddleware",
+    "play_different_games.core.middleware.AsyncWhiteNoiseMiddleware",
+    "play_different_games.core.middleware.SessionMiddleware",
+    "play_different_games.core.middleware.LocaleMiddleware",
+    "play_different_games.core.middleware.CommonMiddleware",
+    "django_htmx.middleware.HtmxMiddleware",
+    "play_different_games.core.middleware.CsrfViewMiddleware",
+    "play_different_games.core.middleware.AuthenticationMiddleware",
+    "play_different_games.users.middleware.TimezoneMiddleware",
+    "play_different_games.core.middleware.MessageMiddleware",
+    "play_different_games.core.middleware.XFrameOptionsMiddleware",
+]
+DJANGO_STACK = [
+    "django.middleware.security.SecurityMiddleware",
+    "play_different_games.core.middleware.AsyncWhiteNoiseMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.locale.LocaleMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django_htmx.middleware.HtmxMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "play_different_games.users.middleware.TimezoneMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+
+async def page(_request):
+    return HttpResponse("page")
+
+
+@pytest.mark.django_db
+def test_async_whitenoise(rf, settings, tmp_path):
+    (tmp_path / "app.css").write_text("body {}")
+    settings.STATIC_ROOT = str(tmp_path)
+    settings.STATIC_URL = "/static/"
+    settings.WHITENOISE_AUTOREFRESH = False
+    middleware = AsyncWhiteNoiseMiddleware(page)
+    assert iscoroutinefunction(middleware)
+    response = asyncio.run(middleware(rf.get("/static/app.css")))
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == b"body {}"
+    response.close()
+    assert asyncio.run(middleware(rf.get("/"))).content == b"page"
+
+
+def test_sync_whitenoise(rf, settings, tmp_path):
+    settings.STATIC_ROOT = str(tmp_path)
+    middleware = AsyncWhiteNoiseMiddleware(lambda _request: HttpResponse("page"))
+    assert not iscoroutinefunction(middleware)
+    assert middleware(rf.get("/")).content == b"page"
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("tests.core.urls")
+@pytest.mark.parametrize(
+    ("stack", "hooks_in_threads"),
+    [(STACK, False), (DJANGO_STACK, True)],
+)
+def test_async_stack_stays_on_the_loop(
+    monkeypatch, settings, tmp_path, stack, hooks_in_threads
+):
+    settings.MIDDLEWARE = stack
+    settings.STATIC_ROOT = str(tmp_path)
+    in_threads = []
+    call = SyncToAsync.__call__
+
+    def record(self, *args, **kwargs):
+        in_threads.append(getattr(self.func, "__name__", ""))
+        return call(self, *args, **kwargs)
+
+    monkeypatch.setattr(SyncToAsync, "__call__", record)
+    response = asyncio.run(AsyncClient().get("/async/"))
+    assert response.content == b"async"
+    assert any(name.startswith("process_") for name in in_threads) is hooks_in_threads
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("tests.core.urls")
+@pytest.mark.parametrize(("method", "in_thread"), [("get", False), ("post", True)])
+def test_csrf_checks_unsafe_requests_in_a_thread(
+    monkeypatch, settings, tmp_path, method, in_thread
+):
+    settings.MIDDLEWARE = STACK
+    settings.STATIC_ROOT = str(tmp_path)
+    in_threads = []
+    call = SyncToAsync.__call__
+
+    def record(self, *args, **kwargs):
+        in_threads.append(getattr(self.func, "__self__", None))
+        return call(self, *args, **kwargs)
+
+    monkeypatch.setattr(SyncToAsync, "__call__", record)
+    client = AsyncClient(enforce_csrf_checks=True)
+    response = asyncio.run(getattr(client, method)("/async/"))
+    # Rejected for the missing token, after reading the body in a thread.
+    assert response.status_code == (403 if in_thread else 200)
+    assert any(isinstance(hook, CsrfViewMiddleware) for hook in in_threads) is in_thread
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.urls("tests.core.urls")
+def test_user_is_loaded_once(monkeypatch, settings, tmp_path, user):
+    settings.MIDDLEWARE = STACK
+    settings.STATIC_ROOT = str(tmp_path)
+    queries = []
+    execute = CursorWrapper._execute
+
+    def record(self, sql, *args, **kwargs):
+        queries.append(sql)
+        return execute(self, sql, *args, **kwargs)
+
+    async def main():
+        client = AsyncClient()
+        await client.aforce_login(user)
+        # Captured on every thread, as the sync view runs in one of its own.
+        monkeypatch.setattr(CursorWrapper, "_execute", record)
+        return await client.get("/username/")
+
+    # TimezoneMiddleware awaits request.auser(), then the view reads request.user.
+    assert asyncio.run(main()).content == b"u1"
+    assert len([sql for sql in queries if 'FROM "auth_user"' in sql]) == 1
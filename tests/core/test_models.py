@@ -0,0 +1,137 @@
+# test_models.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from datetime import timedelta
+
+import pytest
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext, isolate_apps
+
+from play_different_games.core.models import (
+    SluggedUUID7TimestampedModel,
+    SluggedUUIDTimestampedModel,
+)
+from play_different_games.core.utils import uuid7
+from tests.core.models import SluggedGame
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures("core_test_tables"),
+]
+
+
+def lookup_count(context: CaptureQueriesContext) -> int:
+    table = SluggedGame._meta.db_table
+    return sum(
+        1
+        for q in context.captured_queries
+        if q["sql"].startswith("SELECT") and f'FROM "{table}"' in q["sql"]
+    )
+
+
+def test_bulk_create_assigns_unique_slugs():
+    SluggedGame.objects.create(title="Mörk Borg")
+    SluggedGame.objects.create(title="Mörk Borg")
+    games = [SluggedGame(title="Mörk Borg") for _ in range(3)]
+    games += [SluggedGame(title="Cy_Borg"), SluggedGame(title="Pirate Borg")]
+    games.append(SluggedGame(title="Mörk Borg", slug="mörk-borg-3"))
+    with CaptureQueriesContext(connection) as context:
+        SluggedGame.objects.bulk_create(games)
+    assert lookup_count(context) == 1
+    assert [game.slug for game in games] == [
+        "mörk-borg-2",
+        "mörk-borg-4",
+        "mörk-borg-5",
+        "cy_borg",
+        "pirate-borg",
+        "mörk-borg-3",
+    ]
+    assert SluggedGame.objects.count() == 8
+
+
+@pytest.mark.parametrize("batch_size", [10, 200])
+def test_bulk_create_lookup_is_independent_of_batch_size(batch_size):
+    SluggedGame.objects.create(title="Game 0")
+    games = [SluggedGame(title=f"Game {i % 10}") for i in range(batch_size)]
+    with CaptureQueriesContext(connection) as context:
+        SluggedGame.objects.bulk_create(games)
+    assert lookup_count(context) == 1
+    assert len({game.slug for game in games} | {"game-0"}) == batch_size + 1
+
+
+def test_slug_configuration_is_resolved_per_class():
+    assert SluggedGame._slug_source_fields == ("title",)
+    assert SluggedGame().get_slug_source() == ""
+    assert SluggedGame(title="Ironsworn").get_slug_source() == "Ironsworn"
+
+
+def test_slug_configuration_is_reported_by_system_checks():
+    with isolate_apps("play_different_games.core"):
+
+        class MisconfiguredGame(SluggedUUIDTimestampedModel):
+            name = models.CharField(max_length=50)
+
+            class Meta:
+                app_label = "core"
+
+            class SlugMeta:
+                slug_based_on_fields = ["name", "subtitle"]
+
+        class EmptySlugMetaGame(SluggedUUIDTimestampedModel):
+            class Meta:
+                app_label = "core"
+
+            class SlugMeta:
+                slug_based_on_fields = []
+
+        errors = MisconfiguredGame.check() + EmptySlugMetaGame.check()
+    assert [error.id for error in errors if error.id.startswith("core.")] == [
+        "core.E002",
+        "core.E001",
+    ]
+    assert "subtitle" in errors[0].msg
+
+
+def test_uuid7_models_opt_into_time_ordered_keys():
+    with isolate_apps("play_different_games.core"):
+
+        class TimeOrderedGame(SluggedUUID7TimestampedModel):
+            title = models.CharField(max_length=50)
+
+            class Meta:
+                app_label = "core"
+
+    assert TimeOrderedGame._meta.pk.default is uuid7
+    assert TimeOrderedGame().pk.version == 7
+    assert SluggedGame().pk.version == 4
+
+
+def test_queryset_update_sets_modified_at():
+    game = SluggedGame.objects.create(title="Fiasco")
+    stale = game.modified_at - timedelta(days=1)
+    SluggedGame.objects.filter(pk=game.pk).update(modified_at=stale)
+    game.refresh_from_db()
+    assert game.modified_at == stale
+    SluggedGame.objects.filter(pk=game.pk).update(title="Fiasco Companion")
+    game.refresh_from_db()
+    assert game.modified_at > stale
+
+
+def test_bulk_update_sets_modified_at(django_assert_max_num_queries):
+    games = SluggedGame.objects.bulk_create(
+        [SluggedGame(title=f"Kids on Bikes {i}") for i in range(5)]
+    )
+    stale = games[0].modified_at - timedelta(days=1)
+    SluggedGame.objects.update(modified_at=stale)
+    for game in games:
+        game.title = game.title.upper()
+    with django_assert_max_num_queries(3):
+        SluggedGame.objects.bulk_update(games, ["title"])
+    assert SluggedGame.objects.filter(title__startswith="KIDS").count() == 5
+    assert set(SluggedGame.objects.values_list("modified_at", flat=True)) == {
+        games[0].modified_at
+    }
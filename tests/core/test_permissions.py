@@ -0,0 +1,98 @@
+# test_permissions.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+import rules
+from django.contrib.auth.models import AnonymousUser, User
+from django.db.models import Q
+
+from play_different_games.core.permissions import (
+    MemoizedObjectPermissionBackend,
+    compile_predicate,
+    filter_permitted,
+)
+from play_different_games.users.rules import is_self
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@rules.predicate
+def is_listed(user, obj):
+    return obj.is_active
+
+
+@pytest.fixture
+def users(tp):
+    return [tp.make_user(f"member{i}") for i in range(3)]
+
+
+def test_editable_users_are_one_query(django_assert_num_queries, users):
+    with django_assert_num_queries(1):
+        editable = list(
+            filter_permitted(User.objects.all(), users[0], "users.edit-user")
+        )
+    assert editable == [users[0]]
+
+
+def test_superuser_constant_is_folded(django_assert_num_queries, admin_user, users):
+    queryset = User.objects.order_by("pk")
+    with django_assert_num_queries(1):
+        editable = list(filter_permitted(queryset, admin_user, "users.edit-user"))
+    assert editable == list(queryset)
+
+
+def test_anonymous_user_matches_nothing(django_assert_num_queries, users):
+    with django_assert_num_queries(0):
+        assert not filter_permitted(
+            User.objects.all(), AnonymousUser(), "users.edit-user"
+        )
+
+
+@pytest.mark.parametrize(
+    ("predicate", "expected"),
+    [
+        (rules.always_true & is_self, Q(pk=1)),
+        (rules.always_false & is_self, False),
+        (is_self | rules.always_true, True),
+        (~is_self, ~Q(pk=1)),
+        (~(rules.always_false | is_self), ~Q(pk=1)),
+        (is_self ^ rules.always_true, ~Q(pk=1)),
+        (~rules.always_false, True),
+        (~rules.always_true | is_self, Q(pk=1)),
+    ],
+)
+def test_constants_are_folded(predicate, expected):
+    assert compile_predicate(predicate, User(pk=1)) == expected
+
+
+def test_object_predicate_without_filter():
+    with pytest.raises(TypeError, match="is_listed"):
+        compile_predicate(is_self | is_listed, User(pk=1))
+
+
+def test_permission_checks_are_memoized(django_assert_num_queries, users, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        MemoizedObjectPermissionBackend.__mro__[1],
+        "has_perm",
+        lambda _self, user, _perm, *args: calls.append(args) or user == args[0],
+    )
+    backend = MemoizedObjectPermissionBackend()
+    for _ in range(3):
+        assert backend.has_perm(users[0], "users.edit-user", users[0])
+        assert not backend.has_perm(users[0], "users.edit-user", users[1])
+    assert calls == [(users[0],), (users[1],)]
+    # Unsaved objects are checked every time.
+    backend.has_perm(users[0], "users.edit-user", User())
+    backend.has_perm(users[0], "users.edit-user", User())
+    assert len(calls) == 4
+
+
+def test_template_checks_use_the_backend(users):
+    assert users[0].has_perm("users.edit-user", users[0])
+    assert not users[0].has_perm("users.edit-user", users[1])
+    assert len(users[0]._rules_perm_cache) == 2
@@ -0,0 +1,107 @@
+# test_resolvers.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from play_different_games.core.metrics import metrics
+from play_different_games.core.resolvers import get_slug_resolver
+from tests.core.models import SluggedGame
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures("core_test_tables", "locmem_cache"),
+    pytest.mark.urls("tests.core.urls"),
+]
+
+PREFIX = "slug_resolver.core.sluggedgame"
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+
+
+def game_selects(context: CaptureQueriesContext) -> list[str]:
+    table = SluggedGame._meta.db_table
+    return [
+        q["sql"]
+        for q in context.captured_queries
+        if q["sql"].startswith("SELECT") and f'FROM "{table}"' in q["sql"]
+    ]
+
+
+def test_cache_hit_fetches_by_primary_key():
+    game = SluggedGame.objects.create(title="Lancer")
+    resolver = get_slug_resolver(SluggedGame)
+    assert resolver.get_object("lancer") == game
+    with CaptureQueriesContext(connection) as context:
+        assert resolver.get_object("lancer") == game
+    (sql,) = game_selects(context)
+    assert '"id" =' in sql
+    assert metrics.get(f"{PREFIX}.misses") == 1
+    assert metrics.get(f"{PREFIX}.hits") == 1
+
+
+def test_cached_objects_skip_the_database():
+    SluggedGame.objects.create(title="Heart")
+    resolver = get_slug_resolver(SluggedGame)
+    resolver.get_object("heart", cache_object=True)
+    with CaptureQueriesContext(connection) as context:
+        assert resolver.get_object("heart", cache_object=True).title == "Heart"
+    assert game_selects(context) == []
+    assert metrics.get(f"{PREFIX}.object_hits") == 1
+
+
+def test_saving_and_deleting_invalidates():
+    game = SluggedGame.objects.create(title="Spire")
+    resolver = get_slug_resolver(SluggedGame)
+    resolver.get_object("spire", cache_object=True)
+    game.title = "Spire: The City Must Fall"
+    game.slug = "spire-the-city-must-fall"
+    game.save()
+    with pytest.raises(SluggedGame.DoesNotExist):
+        resolver.get_object("spire", cache_object=True)
+    assert resolver.get_object("spire-the-city-must-fall", cache_object=True) == game
+    game.delete()
+    with pytest.raises(SluggedGame.DoesNotExist):
+        resolver.get_object("spire-the-city-must-fall", cache_object=True)
+
+
+def test_stale_mapping_falls_back_to_slug_lookup():
+    game = SluggedGame.objects.create(title="Wanderhome")
+    resolver = get_slug_resolver(SluggedGame)
+    resolver.get_object("wanderhome")
+    # Bypasses the signals that would have invalidated the cached mapping.
+    SluggedGame.objects.filter(pk=game.pk).update(slug="wanderhome-2")
+    with pytest.raises(SluggedGame.DoesNotExist):
+        resolver.get_object("wanderhome")
+    assert metrics.get(f"{PREFIX}.stale") == 1
+
+
+def test_cached_detail_view(client):
+    game = SluggedGame.objects.create(title="Fiasco")
+    assert client.get("/cached/games/fiasco/").content == b"fiasco"
+    assert client.get("/cached/games/fiasco/").content == b"fiasco"
+    assert client.get("/cached/games/unknown/").status_code == 404
+    game.slug = "fiasco-2"
+    game.save()
+    response = client.get("/cached/games/fiasco/")
+    assert response.status_code == 301
+    assert response["Location"] == "/cached/games/fiasco-2/"
+    assert metrics.get(f"{PREFIX}.hits") == 1
+    with CaptureQueriesContext(connection) as context:
+        client.get("/objects/games/fiasco-2/")
+        client.get("/objects/games/fiasco-2/")
+    assert len(game_selects(context)) == 1
+
+
+def test_metrics_view_is_staff_only(client, admin_client):
+    metrics.increment("example")
+    assert client.get("/metrics/").status_code == 302
+    assert admin_client.get("/metrics/").json() == {"example": 1}
@@ -0,0 +1,90 @@
+# test_routers.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import math
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import DatabaseError, connection, connections, router
+
+from play_different_games.core.metrics import metrics
+from play_different_games.core.routers import ReplicaRouter
+
+pytestmark = pytest.mark.urls("tests.core.urls")
+
+
+@pytest.fixture
+def replica_router(replica):
+    (replica_router,) = router.routers
+    return replica_router
+
+
+def test_reads_in_requests_go_to_the_replica(client, replica, user):
+    metrics.reset()
+    assert client.get(f"/users/{user.pk}/").content.decode() == replica
+    assert metrics.get("db_router.replica_reads") == 1
+
+
+def test_reads_outside_requests_go_to_the_primary(replica, user):
+    assert User.objects.get(pk=user.pk)._state.db == "default"
+
+
+def test_writes_pin_the_client_to_the_primary(client, replica, user):
+    response = client.post(f"/users/{user.pk}/rename/", {"first_name": "Ann"})
+    assert response.content.decode() == "default"
+    assert response.cookies["primary_pin"]["max-age"] == 10
+    assert client.get(f"/users/{user.pk}/").content.decode() == "default"
+    client.cookies.clear()
+    assert client.get(f"/users/{user.pk}/").content.decode() == replica
+
+
+def test_lagging_replicas_are_skipped(client, monkeypatch, replica_router, user):
+    metrics.reset()
+    monkeypatch.setattr(replica_router, "measure_lag", lambda _alias: 60.0)
+    assert client.get(f"/users/{user.pk}/").content.decode() == "default"
+    assert metrics.get("db_router.replicas_lagging") == 1
+    assert metrics.get("db_router.primary_fallbacks") == 1
+    # The lag is not measured again until the check interval passes.
+    monkeypatch.setattr(replica_router, "measure_lag", lambda _alias: 0.0)
+    client.get(f"/users/{user.pk}/")
+    assert metrics.get("db_router.replicas_lagging") == 1
+
+
+def test_replicas_are_not_migrated(replica, replica_router):
+    assert replica_router.allow_migrate(replica, "users") is False
+    assert replica_router.allow_migrate("default", "users") is None
+
+
+def test_objects_from_replicas_relate_to_the_primary(replica, replica_router, user):
+    group = user.groups.create(name="Players")
+    group._state.db = replica
+    assert replica_router.allow_relation(user, group) is True
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Lag is measured on PostgreSQL."
+)
+def test_measure_lag(replica):
+    # The simulated replica is the primary, which has nothing to replay.
+    assert ReplicaRouter().measure_lag(replica) == 0.0
+    assert ReplicaRouter().measure_lag("default") == 0.0
+
+
+def test_unreachable_replica_is_infinitely_behind(monkeypatch, replica):
+    def fail():
+        raise DatabaseError
+
+    monkeypatch.setattr(connections[replica], "vendor", "postgresql")
+    monkeypatch.setattr(connections[replica], "cursor", fail)
+    assert ReplicaRouter().measure_lag(replica) == math.inf
+
+
+def test_replica_not_streaming_is_infinitely_behind(monkeypatch, replica):
+    # What the lag query answers on a replica whose WAL receiver is down.
+    monkeypatch.setattr("play_different_games.core.routers.LAG_QUERY", "SELECT NULL")
+    monkeypatch.setattr(connections[replica], "vendor", "postgresql")
+    assert ReplicaRouter().measure_lag(replica) == math.inf
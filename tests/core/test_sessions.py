@@ -0,0 +1,68 @@
+# test_sessions.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import time
+
+import pytest
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+
+from play_different_games.core.metrics import metrics
+from play_different_games.core.sessions import SAVED_AT_KEY, SessionStore
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures("locmem_cache"),
+]
+
+
+@pytest.fixture
+def session_key():
+    session = SessionStore()
+    session["cart"] = [1, 2]
+    session.create()
+    metrics.reset()
+    return session.session_key
+
+
+def test_session_is_durable(session_key):
+    assert Session.objects.filter(session_key=session_key).exists()
+    cache.clear()
+    assert SessionStore(session_key)["cart"] == [1, 2]
+
+
+def test_unchanged_session_is_not_written(django_assert_num_queries, session_key):
+    session = SessionStore(session_key)
+    with django_assert_num_queries(0):
+        session["cart"] = [1, 2]
+        session.save()
+    assert metrics.get("sessions.unchanged") == 1
+
+
+def test_changed_session_is_written(session_key):
+    session = SessionStore(session_key)
+    session["cart"] = [1, 2, 3]
+    session.save()
+    assert metrics.get("sessions.saved") == 1
+    cache.clear()
+    assert SessionStore(session_key)["cart"] == [1, 2, 3]
+
+
+def test_expiry_is_touched_after_interval(
+    django_assert_max_num_queries, monkeypatch, settings, session_key
+):
+    settings.SESSION_TOUCH_INTERVAL = 60
+    saved_at = SessionStore(session_key)[SAVED_AT_KEY]
+    monkeypatch.setattr(time, "time", lambda: saved_at + 59)
+    session = SessionStore(session_key)
+    with django_assert_max_num_queries(0):
+        session.save()
+    monkeypatch.setattr(time, "time", lambda: saved_at + 60)
+    session = SessionStore(session_key)
+    session.save()
+    assert metrics.get("sessions.saved") == 1
+    assert SessionStore(session_key)[SAVED_AT_KEY] == saved_at + 60
@@ -0,0 +1,66 @@
+# test_utils.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+
+from play_different_games.core import models as core_models
+from play_different_games.core.utils import generate_unique_slug_for_model
+from tests.core.models import SluggedGame
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures("core_test_tables"),
+]
+
+
+def test_unique_slug_uses_single_query(django_assert_num_queries):
+    for slug in ["dungeon-world", "dungeon-world-1", "dungeon-world-2"]:
+        SluggedGame.objects.create(title="Dungeon World", slug=slug)
+    SluggedGame.objects.create(title="Dungeon World 2e", slug="dungeon-world-2e")
+    with django_assert_num_queries(1):
+        slug = generate_unique_slug_for_model(SluggedGame, "Dungeon World")
+    assert slug == "dungeon-world-3"
+
+
+def test_unique_slug_fills_gaps():
+    for slug in ["blades", "blades-2"]:
+        SluggedGame.objects.create(title="Blades", slug=slug)
+    assert generate_unique_slug_for_model(SluggedGame, "Blades") == "blades-1"
+
+
+def test_unique_slug_trims_long_text():
+    SluggedGame.objects.create(title="x", slug="a" * 10)
+    for i in range(1, 10):
+        SluggedGame.objects.create(title="x", slug=f"{'a' * 8}-{i}")
+    slug = generate_unique_slug_for_model(SluggedGame, "a" * 30, max_length_override=10)
+    assert slug == "aaaaaaa-10"
+
+
+def test_save_assigns_sequential_slugs():
+    games = [SluggedGame.objects.create(title="Mothership") for _ in range(3)]
+    assert [game.slug for game in games] == [
+        "mothership",
+        "mothership-1",
+        "mothership-2",
+    ]
+
+
+def test_save_retries_after_losing_slug_race(monkeypatch):
+    SluggedGame.objects.create(title="Troika!")
+    calls = []
+
+    def stale_generator(*args, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            # Simulate a concurrent writer claiming the slug after our lookup.
+            return "troika"
+        return generate_unique_slug_for_model(*args, **kwargs)
+
+    monkeypatch.setattr(core_models, "generate_unique_slug_for_model", stale_generator)
+    game = SluggedGame.objects.create(title="Troika!")
+    assert len(calls) == 2
+    assert game.slug == "troika-1"
@@ -0,0 +1,97 @@
+# test_views.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from play_different_games.core.models import SlugHistory
+from play_different_games.core.views import check_read_only_views
+from tests.core import urls
+from tests.core.models import SluggedGame
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures("core_test_tables"),
+    pytest.mark.urls("tests.core.urls"),
+]
+
+
+def test_slug_history_records_every_slug():
+    game = SluggedGame.objects.create(title="Apocalypse World")
+    game.slug = "apocalypse-world-2e"
+    game.save()
+    game.slug = "apocalypse-world-second-edition"
+    game.save()
+    assert set(SlugHistory.objects.values_list("slug", flat=True)) == {
+        "apocalypse-world",
+        "apocalypse-world-2e",
+        "apocalypse-world-second-edition",
+    }
+    game.delete()
+    assert not SlugHistory.objects.exists()
+
+
+def test_old_slug_redirects_to_current(client):
+    game = SluggedGame.objects.create(title="Monsterhearts")
+    game.slug = "monsterhearts-2"
+    game.save()
+    response = client.get("/games/monsterhearts/?ref=old")
+    assert response.status_code == 301
+    assert response["Location"] == "/games/monsterhearts-2/?ref=old"
+    response = client.get("/games/monsterhearts-2/")
+    assert response.status_code == 200
+
+
+def test_unknown_slug_is_not_found(client):
+    response = client.get("/games/never-existed/")
+    assert response.status_code == 404
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_cached_redirect_skips_history_lookup(client):
+    game = SluggedGame.objects.create(title="Masks")
+    game.slug = "masks-a-new-generation"
+    game.save()
+    client.get("/games/masks/")
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/games/masks/")
+    assert response["Location"] == "/games/masks-a-new-generation/"
+    # Only the live slug lookup runs; the redirect itself comes from the cache.
+    selects = [q for q in context.captured_queries if q["sql"].startswith("SELECT")]
+    assert len(selects) == 1
+
+
+@pytest.mark.parametrize(
+    ("path", "atomic", "read_only"),
+    [
+        ("/transaction/", True, False),
+        ("/transaction/read-only/", False, False),
+        ("/transaction/atomic/", True, True),
+    ],
+)
+def test_read_only_views(client, path, atomic, read_only):
+    response = client.get(path).json()
+    assert response["atomic"] == atomic
+    if connection.vendor == "postgresql":
+        assert response["read_only"] == read_only
+
+
+def test_check_read_only_views():
+    warnings = check_read_only_views(None)
+    assert {warning.obj for warning in warnings} == {
+        urls.SluggedGameDetailView,
+        urls.CachedSluggedGameDetailView,
+        urls.TransactionView,
+    }
+    assert {warning.id for warning in warnings} == {"core.W002"}
+
+
+def test_project_views_are_read_only(settings):
+    pytest.importorskip("django_browser_reload")
+    settings.ROOT_URLCONF = "play_different_games.urls"
+    assert check_read_only_views(None) == []
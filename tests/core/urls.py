@@ -0,0 +1,99 @@
+# urls.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""URLs for exercising the core view mixins in tests."""
+
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.http import HttpResponse, JsonResponse
+from django.urls import path
+from django.views.generic import DetailView, View
+
+from play_different_games.core.views import (
+    CachedSlugLookupMixin,
+    ReadOnlyViewMixin,
+    SlugHistoryRedirectMixin,
+    metrics_view,
+    read_only_view,
+)
+from tests.core.models import SluggedGame
+
+
+class SluggedGameDetailView(SlugHistoryRedirectMixin, DetailView):
+    model = SluggedGame
+
+    def render_to_response(self, context, **response_kwargs):
+        return HttpResponse(self.object.slug)
+
+
+class CachedSluggedGameDetailView(CachedSlugLookupMixin, SluggedGameDetailView):
+    pass
+
+
+class TransactionView(View):
+    """Describes the transaction the view runs in."""
+
+    def get(self, _request):
+        read_only = None
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SHOW transaction_read_only")
+                read_only = cursor.fetchone()[0] == "on"
+        return JsonResponse(
+            {"atomic": connection.in_atomic_block, "read_only": read_only}
+        )
+
+
+class ReadOnlyTransactionView(ReadOnlyViewMixin, TransactionView):
+    pass
+
+
+@read_only_view
+def user_database_view(_request, pk):
+    """The database the user was read from."""
+    return HttpResponse(User.objects.get(pk=pk)._state.db)
+
+
+@transaction.non_atomic_requests
+def rename_user_view(request, pk):
+    """Renames the user, then reads them back."""
+    User.objects.filter(pk=pk).update(first_name=request.POST["first_name"])
+    return user_database_view(request, pk)
+
+
+@transaction.non_atomic_requests
+async def async_view(_request):
+    return HttpResponse("async")
+
+
+def username_view(request):
+    return HttpResponse(request.user.get_username())
+
+
+urlpatterns = [
+    path("admin/", admin.site.urls),
+    path("metrics/", metrics_view),
+    path("async/", async_view),
+    path("username/", username_view),
+    path("users/<int:pk>/", user_database_view),
+    path("users/<int:pk>/rename/", rename_user_view),
+    path("transaction/", TransactionView.as_view()),
+    path("transaction/read-only/", ReadOnlyTransactionView.as_view()),
+    path("transaction/atomic/", ReadOnlyTransactionView.as_view(atomic=True)),
+    path("games/<slug:slug>/", SluggedGameDetailView.as_view(), name="game-detail"),
+    path(
+        "cached/games/<slug:slug>/",
+        CachedSluggedGameDetailView.as_view(),
+        name="cached-game-detail",
+    ),
+    path(
+        "objects/games/<slug:slug>/",
+        CachedSluggedGameDetailView.as_view(cache_object=True),
+        name="cached-object-game-detail",
+    ),
+]
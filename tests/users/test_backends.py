@@ -0,0 +1,135 @@
+# test_backends.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from play_different_games.users.backends import ProfileModelBackend, profile_cache_key
+from play_different_games.users.cache import profile_version_key
+from play_different_games.users.models import UserProfile
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures("profile_cache"),
+]
+
+
+def test_profile_is_served_from_the_cache(django_assert_num_queries, user):
+    backend = ProfileModelBackend()
+    with django_assert_num_queries(1):
+        assert backend.get_user(user.pk).profile.timezone == "UTC"
+    with CaptureQueriesContext(connection) as context:
+        assert backend.get_user(user.pk).profile.timezone == "UTC"
+    # The user itself is always read, but without the profile.
+    (query,) = context.captured_queries
+    assert "users_userprofile" not in query["sql"]
+
+
+def test_credentials_are_never_cached(user):
+    backend = ProfileModelBackend()
+    backend.get_user(user.pk)
+    # Not saved, so the version is not bumped.
+    type(user).objects.filter(pk=user.pk).update(password="changed")
+    assert backend.get_user(user.pk).password == "changed"
+    type(user).objects.filter(pk=user.pk).update(is_active=False)
+    assert backend.get_user(user.pk) is None
+
+
+def test_saving_user_or_profile_invalidates(user):
+    backend = ProfileModelBackend()
+    backend.get_user(user.pk)
+    user.profile.timezone = "Europe/Berlin"
+    user.profile.save()
+    assert backend.get_user(user.pk).profile.timezone == "Europe/Berlin"
+    user.is_active = False
+    user.save()
+    assert backend.get_user(user.pk) is None
+
+
+def test_evicted_version_invalidates(user):
+    backend = ProfileModelBackend()
+    backend.get_user(user.pk)
+    UserProfile.objects.filter(user=user).update(timezone="Asia/Tokyo")
+    cache.delete(profile_version_key(user.pk))
+    assert backend.get_user(user.pk).profile.timezone == "Asia/Tokyo"
+
+
+def test_missing_user(django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert ProfileModelBackend().get_user(404) is None
+
+
+def test_profile_is_joined_without_profile_cache(
+    django_assert_num_queries, settings, user
+):
+    settings.USER_PROFILE_CACHE = False
+    backend = ProfileModelBackend()
+    for _ in range(2):
+        with django_assert_num_queries(1):
+            assert backend.get_user(user.pk).profile.timezone == "UTC"
+    assert not cache.has_key(profile_cache_key(user.pk))
+
+
+def test_logged_in_requests_read_the_profile_from_cache(client, tp, user):
+    client.force_login(user)
+    client.get(tp.reverse("home"))
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(tp.reverse("home"))
+    assert response.wsgi_request.user == user
+    # Only the session and the user are read from the database.
+    selects = [q["sql"] for q in context.captured_queries if "SELECT" in q["sql"]]
+    assert len(selects) == 2
+    assert "django_session" in selects[0]
+    assert "users_userprofile" not in selects[1]
+
+
+def test_async_lookup_uses_the_cache(monkeypatch, user):
+    backend = ProfileModelBackend()
+    assert asyncio.run(backend.aget_user(user.pk)).profile.timezone == "UTC"
+    assert asyncio.run(backend.aget_user(0)) is None
+    monkeypatch.setattr(backend, "_user_queryset", None)
+    cached = asyncio.run(backend.aget_user(user.pk))
+    assert cached == user
+    assert cached.profile.timezone == "UTC"
+
+
+def test_async_lookup_without_profile_cache(settings, user):
+    settings.USER_PROFILE_CACHE = False
+    backend = ProfileModelBackend()
+    assert asyncio.run(backend.aget_user(user.pk)).profile.timezone == "UTC"
+    assert asyncio.run(backend.aget_user(0)) is None
+
+
+def test_async_login(user):
+    backend = ProfileModelBackend()
+    login = backend.aauthenticate(None, username="u1", password="password")
+    assert asyncio.run(login) == user
+    login = backend.aauthenticate(None, username="u1", password="wrong")
+    assert asyncio.run(login) is None
+    login = backend.aauthenticate(None, username="nobody", password="password")
+    assert asyncio.run(login) is None
+    user.is_active = False
+    user.save()
+    login = backend.aauthenticate(None, username="u1", password="password")
+    assert asyncio.run(login) is None
+
+
+def test_async_login_upgrades_the_hash(settings, user):
+    settings.PASSWORD_HASHERS = [
+        "play_different_games.users.hashers.BoundedArgon2PasswordHasher",
+        *settings.PASSWORD_HASHERS,
+    ]
+    login = ProfileModelBackend().aauthenticate(
+        None, username="u1", password="password"
+    )
+    assert asyncio.run(login) == user
+    user.refresh_from_db()
+    assert user.password.startswith("argon2$")
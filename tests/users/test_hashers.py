@@ -0,0 +1,121 @@
+# test_hashers.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    check_password,
+    make_password,
+)
+
+from play_different_games.core.metrics import metrics
+from play_different_games.users.hashers import (
+    BoundedArgon2PasswordHasher,
+    acheck_password,
+    amake_password,
+    get_hashing_executor,
+    hasher_path,
+)
+
+
+@pytest.fixture
+def bounded_hashing(settings):
+    settings.PASSWORD_HASHERS = [
+        "play_different_games.users.hashers.BoundedArgon2PasswordHasher"
+    ]
+    settings.PASSWORD_HASHING_WORKERS = 2
+    get_hashing_executor.cache_clear()
+    metrics.reset()
+    yield
+    get_hashing_executor().shutdown()
+    get_hashing_executor.cache_clear()
+
+
+@pytest.mark.usefixtures("bounded_hashing")
+def test_hashes_are_argon2():
+    encoded = make_password("secret")
+    assert Argon2PasswordHasher().verify("secret", encoded)
+    assert check_password("secret", make_password("secret", hasher="argon2"))
+    assert not check_password("wrong", encoded)
+    assert metrics.get("password_hashing.completed") == 4
+    assert metrics.get("password_hashing.queued") == 0
+    assert metrics.get("password_hashing.running") == 0
+
+
+@pytest.mark.usefixtures("bounded_hashing")
+def test_concurrency_is_capped(monkeypatch):
+    lock = threading.Lock()
+    running, peak = 0, 0
+
+    def verify(_self, _password, _encoded):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return True
+
+    monkeypatch.setattr(Argon2PasswordHasher, "verify", verify)
+    hasher = BoundedArgon2PasswordHasher()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: hasher.verify("pw", "hash"), range(16)))
+    assert all(results)
+    assert peak == 2
+    assert metrics.get("password_hashing.completed") == 16
+
+
+@pytest.mark.usefixtures("bounded_hashing")
+def test_async_checks_use_the_pool():
+    encoded = asyncio.run(amake_password("secret"))
+    assert asyncio.run(acheck_password("secret", encoded))
+    assert not asyncio.run(acheck_password("wrong", encoded))
+    assert metrics.get("password_hashing.completed") == 3
+    assert metrics.get("password_hashing.queued") == 0
+
+
+@pytest.mark.usefixtures("bounded_hashing")
+def test_async_checks_do_not_block_the_loop(monkeypatch, settings):
+    settings.PASSWORD_HASHING_WORKERS = 1
+    get_hashing_executor.cache_clear()
+
+    def verify(_self, _password, _encoded):
+        time.sleep(0.05)
+        return True
+
+    monkeypatch.setattr(Argon2PasswordHasher, "verify", verify)
+    encoded = make_password("secret")
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    async def main():
+        ticker = asyncio.create_task(tick())
+        checks = [acheck_password("secret", encoded) for _ in range(8)]
+        results = await asyncio.gather(*checks)
+        ticker.cancel()
+        return results
+
+    assert asyncio.run(main()) == [True] * 8
+    # Eight checks one after another take 0.4 seconds, a tick takes 1 ms or more.
+    assert ticks > 50
+
+
+def test_process_pool_hashes_inline():
+    assert hasher_path(BoundedArgon2PasswordHasher()) == (
+        "django.contrib.auth.hashers.Argon2PasswordHasher"
+    )
@@ -0,0 +1,123 @@
+# test_middleware.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+
+import pytest
+from asgiref.sync import iscoroutinefunction
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.cache import SessionStore
+from django.core.cache import cache
+from django.utils import timezone
+
+from play_different_games.users.cache import check_profile_cache, profile_version_key
+from play_different_games.users.middleware import (
+    TIMEZONE_SESSION_KEY,
+    TimezoneMiddleware,
+)
+from play_different_games.users.models import UserProfile
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def middleware():
+    return TimezoneMiddleware(lambda _request: timezone.get_current_timezone_name())
+
+
+def make_request(rf, user, session):
+    request = rf.get("/")
+    request.user = user
+    request.session = session
+    return request
+
+
+@pytest.mark.usefixtures("profile_cache")
+def test_timezone_activation_needs_no_queries(
+    rf, django_assert_num_queries, middleware, user
+):
+    user.profile.timezone = "Europe/Prague"
+    user.profile.save()
+    session = SessionStore()
+    with django_assert_num_queries(1):
+        assert middleware(make_request(rf, user, session)) == "Europe/Prague"
+    with django_assert_num_queries(0):
+        assert middleware(make_request(rf, user, session)) == "Europe/Prague"
+
+
+@pytest.mark.usefixtures("profile_cache")
+def test_profile_changes_refresh_the_session(rf, middleware, user):
+    session = SessionStore()
+    assert middleware(make_request(rf, user, session)) == "UTC"
+    user.profile.timezone = "America/Chicago"
+    user.profile.save()
+    assert middleware(make_request(rf, user, session)) == "America/Chicago"
+
+
+@pytest.mark.usefixtures("profile_cache")
+def test_evicted_version_refreshes_the_session(rf, middleware, user):
+    session = SessionStore()
+    assert middleware(make_request(rf, user, session)) == "UTC"
+    # Changed without bumping the version, which is then evicted.
+    UserProfile.objects.filter(user=user).update(timezone="Asia/Tokyo")
+    cache.delete(profile_version_key(user.pk))
+    assert middleware(make_request(rf, user, session)) == "Asia/Tokyo"
+
+
+def test_timezone_is_read_every_time_without_profile_cache(
+    rf, django_assert_num_queries, middleware, user
+):
+    session = SessionStore()
+    for _ in range(2):
+        with django_assert_num_queries(1):
+            assert middleware(make_request(rf, user, session)) == "UTC"
+    assert TIMEZONE_SESSION_KEY not in session
+
+
+@pytest.mark.usefixtures("profile_cache")
+def test_profile_cache_needs_a_shared_cache(settings):
+    (error,) = check_profile_cache(None)
+    assert error.id == "users.E001"
+    settings.USER_PROFILE_CACHE = False
+    assert check_profile_cache(None) == []
+
+
+def test_anonymous_users_use_the_session(rf, middleware):
+    session = SessionStore()
+    session["django_timezone"] = "Asia/Tokyo"
+    assert middleware(make_request(rf, AnonymousUser(), session)) == "Asia/Tokyo"
+    session["django_timezone"] = "Not/AZone"
+    default = timezone.get_default_timezone_name()
+    assert middleware(make_request(rf, AnonymousUser(), session)) == default
+
+
+async def current_zone(_request):
+    return timezone.get_current_timezone_name()
+
+
+@pytest.mark.usefixtures("profile_cache")
+def test_async_middleware(rf, user):
+    middleware = TimezoneMiddleware(current_zone)
+    assert iscoroutinefunction(middleware)
+    user.profile.timezone = "Europe/Prague"
+    user.profile.save()
+    session = SessionStore()
+
+    async def auser():
+        return user
+
+    request = make_request(rf, user, session)
+    request.auser = auser
+    assert asyncio.run(middleware(request)) == "Europe/Prague"
+    assert session[TIMEZONE_SESSION_KEY] == "Europe/Prague"
+
+    async def anonymous():
+        return AnonymousUser()
+
+    request = make_request(rf, AnonymousUser(), session)
+    request.auser = anonymous
+    assert asyncio.run(middleware(request)) == "Europe/Prague"
@@ -0,0 +1,101 @@
+# test_provisioning.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+from io import StringIO
+
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+
+from play_different_games.users.models import UserProfile
+from play_different_games.users.provisioning import provision_users
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+def make_rows(count, start=0):
+    return [
+        {
+            "username": f"member{i}",
+            "email": f"member{i}@example.com",
+            "password": f"secret-{i}",
+            "timezone": "Europe/Prague",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def test_users_and_profiles_are_created_in_bulk(django_assert_num_queries):
+    # Per chunk: look up existing usernames, then BEGIN, insert the users, insert
+    # their profiles, and COMMIT.
+    with django_assert_num_queries(2 * 5):
+        report = provision_users(make_rows(10), chunk_size=5, workers=0)
+    assert report.created == 10
+    assert report.rows_per_second > 0
+    user = User.objects.select_related("profile").get(username="member3")
+    assert user.check_password("secret-3")
+    assert user.profile.timezone == "Europe/Prague"
+    assert UserProfile.objects.count() == 10
+
+
+def test_existing_duplicate_and_invalid_rows_are_skipped(tp):
+    tp.make_user("member1")
+    rows = [
+        *make_rows(3),
+        {"username": "member2"},
+        {"username": "not a valid username!"},
+        {"email": "nobody@example.com"},
+    ]
+    report = provision_users(rows, workers=0)
+    assert (report.created, report.skipped, report.invalid) == (2, 2, 2)
+    assert User.objects.count() == 3
+
+
+def test_password_hashes_and_missing_passwords():
+    rows = [
+        {"username": "hashed", "password_hash": make_password("imported")},
+        {"username": "garbled", "password_hash": "not-a-hash"},
+        {"username": "nopassword", "timezone": "Not/AZone"},
+    ]
+    provision_users(rows, workers=0)
+    assert User.objects.get(username="hashed").check_password("imported")
+    assert not User.objects.get(username="garbled").has_usable_password()
+    nopassword = User.objects.get(username="nopassword")
+    assert not nopassword.has_usable_password()
+    assert nopassword.profile.timezone == "UTC"
+
+
+def test_passwords_are_hashed_in_worker_processes():
+    report = provision_users(make_rows(6), workers=2)
+    assert report.created == 6
+    assert User.objects.get(username="member5").check_password("secret-5")
+
+
+@pytest.mark.parametrize("suffix", ["csv", "jsonl"])
+def test_import_users_command(tmp_path, suffix):
+    rows = make_rows(4)
+    path = tmp_path / f"members.{suffix}"
+    if suffix == "csv":
+        lines = ["username,email,password,timezone"]
+        lines += [",".join(row.values()) for row in rows]
+    else:
+        lines = [json.dumps(row) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    out = StringIO()
+    call_command("import_users", str(path), "--workers=0", stdout=out)
+    assert "Imported 4 users from 4 rows" in out.getvalue()
+    assert "rows/sec" in out.getvalue()
+    assert User.objects.filter(profile__timezone="Europe/Prague").count() == 4
+
+
+def test_import_users_command_needs_a_known_format(tmp_path):
+    path = tmp_path / "members.txt"
+    path.write_text("", encoding="utf-8")
+    with pytest.raises(CommandError):
+        call_command("import_users", str(path))
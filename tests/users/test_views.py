@@ -138,3 +138,62 @@ def test_authorized_has_permission_post_views(
     )
     user.refresh_from_db()
     assert user.profile.timezone == "America/Chicago"
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_renamed_user_is_not_served_from_cache(client, tp, user):
+    client.force_login(user)
+    url = tp.reverse("users:user-detail", username=user.username)
+    assert client.get(url).status_code == 200
+    user.username = "renamed"
+    user.save()
+    assert client.get(url).status_code == 404
+    url = tp.reverse("users:user-detail", username="renamed")
+    assert client.get(url).status_code == 200
+
+
+@pytest.fixture
+def own_profile_client(client, profile_cache, tp, user):
+    client.force_login(user)
+    # The first request copies the timezone into the session.
+    client.get(tp.reverse("users:user-detail", username=user.username))
+    return client
+
+
+# Every request reads the session and loads the logged in user (their profile and
+# timezone come from the cache), then runs in a transaction (BEGIN and COMMIT)
+# where the profile's user is fetched once, with the profile joined. The detail
+# view only reads, so it has no transaction.
+PROFILE_GET_QUERIES = 5
+
+
+@pytest.mark.parametrize(
+    ("view_name", "queries"),
+    [("user-detail", PROFILE_GET_QUERIES - 2), ("user-edit", PROFILE_GET_QUERIES)],
+)
+def test_profile_get_query_budget(  # noqa: PLR0917
+    own_profile_client, django_assert_num_queries, tp, user, view_name, queries
+):
+    url = tp.reverse(f"users:{view_name}", username=user.username)
+    with django_assert_num_queries(queries):
+        response = own_profile_client.get(url)
+    assert response.status_code == 200
+
+
+def test_profile_post_query_budget(
+    own_profile_client, django_assert_num_queries, tp, user
+):
+    url = tp.reverse("users:user-edit", username=user.username)
+    data = {"first_name": "John", "last_name": "", "timezone": "America/New_York"}
+    # Plus one update of the changed user columns, and one of the timezone.
+    with django_assert_num_queries(PROFILE_GET_QUERIES + 2):
+        response = own_profile_client.post(url, data=data)
+    assert response.status_code == 302
+    # The next request copies the new timezone into the session.
+    own_profile_client.get(url)
+    # Nothing changed, so nothing is written.
+    with django_assert_num_queries(PROFILE_GET_QUERIES):
+        own_profile_client.post(url, data=data)
+    user.refresh_from_db()
+    assert user.first_name == "John"
+    assert user.profile.timezone == "America/New_York"
@@ -0,0 +1,83 @@
+# test_zones.py
+#
+# Copyright (c) 2025 Daniel Andrlik
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from play_different_games.users.forms import TimezoneField, render_catalog_options
+from play_different_games.users.zones import get_zone_catalog
+
+# The hand-written list the catalog replaced offered this many zones. tzdata has
+# since added the zones below.
+PREVIOUS_PICKER_ZONES = 432
+ADDED_ZONES = {"America/Coyhaique"}
+
+
+def test_catalog_matches_the_previous_picker():
+    catalog = get_zone_catalog()
+    assert len(catalog.zones) == PREVIOUS_PICKER_ZONES + len(ADDED_ZONES)
+    assert ADDED_ZONES <= catalog.by_key.keys()
+    # Links kept for backward compatibility are not offered twice.
+    for key in ("America/Buenos_Aires", "Africa/Asmera", "Asia/Calcutta"):
+        assert key not in catalog.by_key
+
+
+def test_catalog_keeps_previously_offered_zones():
+    catalog = get_zone_catalog()
+    for key in ("UTC", "GMT", "US/Pacific", "Canada/Atlantic", "Europe/Prague"):
+        assert key in catalog.by_key
+    assert "Factory" not in catalog.by_key
+    assert catalog.by_key["America/Argentina/Buenos_Aires"].label == (
+        "America / Argentina / Buenos Aires"
+    )
+    assert all(zone.region == "Europe" for zone in catalog.by_region["Europe"])
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("new y", "America/New_York"),
+        ("YORK", "America/New_York"),
+        ("america/new", "America/New_York"),
+        ("buenos", "America/Argentina/Buenos_Aires"),
+        ("prag", "Europe/Prague"),
+    ],
+)
+def test_search_matches_word_prefixes(query, expected):
+    assert expected in [zone.key for zone in get_zone_catalog().search(query)]
+
+
+def test_search_limits_and_empty_queries():
+    catalog = get_zone_catalog()
+    assert len(catalog.search("america", limit=5)) == 5
+    assert catalog.search("  ") == []
+    assert catalog.search("atlantis") == []
+
+
+def test_timezone_field():
+    field = TimezoneField()
+    assert field.clean("Asia/Tokyo") == "Asia/Tokyo"
+    with pytest.raises(ValidationError, match="valid choice"):
+        field.clean("Mars/Olympus_Mons")
+    html = field.widget.render("timezone", "Asia/Tokyo", {"id": "id_timezone"})
+    assert '<option value="Asia/Tokyo" selected>' in html
+    assert html.count(" selected") == 1
+    assert 'id="id_timezone"' in html
+    assert " selected" not in render_catalog_options()
+
+
+@pytest.mark.django_db
+def test_timezone_search_view(client, tp):
+    url = tp.reverse("users:timezone-search")
+    response = client.get(url, {"q": "prag", "timezone": "Asia/Tokyo"})
+    assert response.status_code == 200
+    assert response.content.decode() == (
+        '<option value="Asia/Tokyo" selected>Asia / Tokyo</option>'
+        '<option value="Europe/Prague">Europe / Prague</option>'
+    )
+    response = client.get(url)
+    assert response.content.count(b"<option") == len(get_zone_catalog().zones)